@@ -6,81 +6,532 @@ arXiv论文获取模块 / arXiv Paper Fetching Module
 
 import arxiv
 import feedparser
-from datetime import datetime, timedelta
-from typing import List, Dict
+import math
+import requests
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Optional, Tuple
 import re
 
+from requests.adapters import HTTPAdapter
+
+from http_cache import ResponseCache
+from paper import Paper
+from paper_index import PaperIndex
+from paper_store import PaperStore, TIMESTAMP_FORMAT, parse_arxiv_id, utc_now
+from rate_limiter import TokenBucket, shared_adapter, shared_limiter
+import config
+
+
+class ThrottledSession(requests.Session):
+    """
+    经过限流的HTTP会话 / HTTP session whose requests go through a rate limiter
+    同时统计请求次数和接收字节数，可选地使用响应缓存和共享连接池 /
+    Also counts requests and received bytes, optionally backed by a response cache and a shared connection pool
+    """
+    
+    def __init__(self, limiter: TokenBucket, cache: Optional[ResponseCache] = None,
+                 adapter: Optional[HTTPAdapter] = None):
+        super().__init__()
+        self.limiter = limiter
+        self.cache = cache
+        if adapter is not None:
+            self.mount('https://', adapter)
+            self.mount('http://', adapter)
+        self.request_count = 0
+        self.bytes_received = 0
+    
+    def request(self, method, url, *args, **kwargs):
+        cached = None
+        if self.cache is not None and method.upper() == 'GET':
+            cached = self.cache.lookup(url)
+        
+        # 有效期内的缓存无需访问网络，也不占用请求配额 / Fresh cache entries need no network access and no request quota
+        if cached and cached['fresh']:
+            self.cache.record_hit(url, len(cached['response'].content))
+            return cached['response']
+        
+        if cached and cached['headers']:
+            kwargs['headers'] = dict(kwargs.get('headers') or {}, **cached['headers'])
+        
+        self.limiter.acquire()
+        response = super().request(method, url, *args, **kwargs)
+        self.request_count += 1
+        self.bytes_received += len(response.content)
+        
+        if cached and response.status_code == 304:
+            self.cache.record_hit(url, len(cached['response'].content), revalidated=True)
+            return cached['response']
+        if self.cache is not None and method.upper() == 'GET':
+            self.cache.store_response(url, response)
+        return response
+
+
 class ArxivFetcher:
     """
     arXiv论文获取器 / arXiv Paper Fetcher
     用于搜索和获取arXiv上的学术论文 / Used to search and fetch academic papers from arXiv
     """
     
-    def __init__(self, max_results: int = 10):
+    # arXiv API单次请求允许的最大条数 / Maximum entries arXiv allows per API request
+    MAX_PAGE_SIZE = 2000
+    
+    def __init__(self, max_results: int = 10, store: Optional[PaperStore] = None,
+                 incremental: bool = False, fan_out: bool = False, max_workers: int = 4,
+                 chunk_size: int = 1, request_interval: float = 3.0, harvest_ttl: int = 3600,
+                 response_cache: Optional[ResponseCache] = None, index: Optional[PaperIndex] = None,
+                 limiter: Optional[TokenBucket] = None, api_url: str = "https://export.arxiv.org/api/query"):
         """
         初始化获取器 / Initialize the fetcher
         
         Args:
             max_results (int): 最大结果数量 / Maximum number of results
+            store: 本地论文存储，为空时不做持久化 / Local paper store, no persistence if None
+            incremental: 是否只获取上次之后的新论文（需要store）/ Only fetch papers newer than the last run (requires store)
+            fan_out: 是否按关键词拆分为多个并发查询 / Split keywords into concurrent per-keyword queries
+            max_workers: 并发查询的线程数 / Number of threads for concurrent queries
+            chunk_size: 每个并发查询包含的关键词数 / Number of keywords per concurrent query
+            request_interval: 对arXiv两次请求之间的最小间隔（秒），未指定limiter时使用 / Minimum seconds between two requests to arXiv, used without a limiter
+            harvest_ttl: 分类每日列表的缓存时间（秒）/ Seconds a harvested daily listing stays cached
+            response_cache: 磁盘HTTP响应缓存，为空时不缓存 / On-disk HTTP response cache, no caching if None
+            index: 本地倒排索引，新获取的论文会增量加入 / Local inverted index that newly fetched papers are added to
+            limiter: 共享的令牌桶限流器，所有请求都经过它 / Shared token bucket limiter that every request goes through
+            api_url: arXiv查询接口地址，可指向本地模拟服务 / arXiv query API url, may point at a local mock server
         """
         self.max_results = max_results
-        self.client = arxiv.Client()
+        self.api_url = api_url
+        self.limiter = limiter or TokenBucket(rate=1 / request_interval)
+        self.adapter = shared_adapter(max(max_workers, 2))
+        self.response_cache = response_cache
+        self.client = self._make_client()
+        self.store = store
+        self.incremental = incremental
+        self.index = index
+        self._index_loaded = False
+        self.fan_out = fan_out
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+        # 最近一次搜索中每个查询的耗时和分页统计 / Per-query timing and paging statistics of the latest search
+        self.last_query_stats: List[Dict] = []
+        # 时间窗口内条目的命中率估计，用于决定页大小 / Estimated hit density inside the date window, used to size pages
+        self._hit_density = 1.0
+        # 订阅源下载使用的会话及缓存 {分类组合: (下载时间, 论文列表)} / Session and cache for feed downloads {categories: (download time, papers)}
+        self.session = ThrottledSession(self.limiter, self.response_cache, self.adapter)
+        self.harvest_ttl = harvest_ttl
+        self._harvest_cache: Dict[str, Tuple[float, List[Paper]]] = {}
+        self._harvest_lock = threading.Lock()
     
-    def search_papers(self, keywords: List[str], days_back: int = 1) -> List[Dict]:
+    @classmethod
+    def from_config(cls) -> 'ArxivFetcher':
+        """根据config.py中的配置创建获取器 / Create a fetcher from the settings in config.py"""
+        return cls(
+            max_results=config.MAX_RESULTS,
+            store=PaperStore(config.PAPER_STORE_PATH) if config.PAPER_STORE_PATH else None,
+            incremental=config.INCREMENTAL_FETCH,
+            fan_out=config.FAN_OUT_QUERIES,
+            max_workers=config.FAN_OUT_WORKERS,
+            chunk_size=config.FAN_OUT_CHUNK_SIZE,
+            limiter=shared_limiter(
+                rate=1 / config.ARXIV_REQUEST_INTERVAL,
+                capacity=config.ARXIV_REQUEST_BURST,
+                state_path=config.RATE_LIMIT_STATE_PATH or None
+            ),
+            harvest_ttl=config.HARVEST_CACHE_SECONDS,
+            response_cache=ResponseCache(
+                config.HTTP_CACHE_PATH,
+                ttl=config.HTTP_CACHE_TTL,
+                max_bytes=config.HTTP_CACHE_MAX_BYTES
+            ) if config.HTTP_CACHE_PATH else None,
+            index=PaperIndex() if config.LOCAL_INDEX else None,
+            api_url=config.ARXIV_API_URL
+        )
+    
+    def _make_client(self) -> arxiv.Client:
+        """创建共享限流器和连接池的arXiv客户端 / Create an arXiv client sharing the fetcher's limiter and connection pool"""
+        # 由共享限流器控制请求间隔，客户端自身不再等待 / The shared limiter spaces requests, so the client itself does not wait
+        client = arxiv.Client(delay_seconds=0)
+        client.query_url_format = f"{self.api_url}?{{}}"
+        client._session = ThrottledSession(self.limiter, self.response_cache, self.adapter)
+        return client
+    
+    def build_query(self, keywords: List[str]) -> str:
         """
-        根据关键词搜索arXiv论文 / Search arXiv papers by keywords
+        构建arXiv搜索查询 / Build arXiv search query
         
         Args:
             keywords: 搜索关键词列表 / List of search keywords
-            days_back: 搜索最近几天的论文 / Search papers from recent days
             
         Returns:
-            论文信息列表 / List of paper information
+            查询字符串 / Query string
         """
-        # 构建搜索查询 / Build search query
         query_parts = []
         for keyword in keywords:
             # 在标题、摘要和关键词中搜索 / Search in title, abstract and keywords
             query_parts.append(f'(ti:"{keyword}" OR abs:"{keyword}")')
         
-        query = " OR ".join(query_parts)
+        return " OR ".join(query_parts)
+    
+    def search_papers(self, keywords: List[str], days_back: int = 1, local: bool = False) -> List[Paper]:
+        """
+        根据关键词搜索arXiv论文 / Search arXiv papers by keywords
         
-        # 创建搜索对象
-        search = arxiv.Search(
-            query=query,
-            max_results=self.max_results * 2,  # 获取更多结果以便筛选
-            sort_by=arxiv.SortCriterion.SubmittedDate,
-            sort_order=arxiv.SortOrder.Descending
-        )
+        Args:
+            keywords: 搜索关键词列表 / List of search keywords
+            days_back: 搜索最近几天的论文 / Search papers from recent days
+            local: 只从本地索引中搜索已获取的论文 / Only search already ingested papers in the local index
+            
+        Returns:
+            论文信息列表 / List of paper information
+        """
+        if local:
+            return self.search_local(keywords, days_back)
         
-        papers = []
-        cutoff_date = datetime.now() - timedelta(days=days_back)
+        # arXiv和本地存储中的提交时间都是UTC / Submission times from arXiv and in the local store are UTC
+        cutoff_date = utc_now() - timedelta(days=days_back)
+        
+        if self.fan_out and len(keywords) > self.chunk_size:
+            return self._search_fan_out(keywords, cutoff_date)
+        
+        query = self.build_query(keywords)
+        start = time.perf_counter()
+        papers, stats = self._search_query(query, cutoff_date, self.client)
+        self.last_query_stats = [dict(stats, query=query, seconds=time.perf_counter() - start, results=len(papers))]
+        return papers
+    
+    def search_local(self, keywords: List[str], days_back: int = 1) -> List[Paper]:
+        """
+        从本地倒排索引搜索并按BM25相关度排序 / Search the local inverted index, ranked by BM25 relevance
+        
+        Args:
+            keywords: 搜索关键词列表 / List of search keywords
+            days_back: 搜索最近几天的论文 / Search papers from recent days
+            
+        Returns:
+            带 relevance 得分的论文信息列表 / List of paper information with a relevance score
+        """
+        if self.index is None:
+            raise ValueError("未配置本地索引 / No local index configured")
+        
+        # 首次使用时从本地存储加载已有论文，之后随获取增量更新 / Load stored papers on first use, then update incrementally as papers arrive
+        if not self._index_loaded and self.store is not None:
+            self.index.add_papers(self.store.load_all_papers())
+        self._index_loaded = True
+        
+        cutoff_date = utc_now() - timedelta(days=days_back)
+        start = time.perf_counter()
+        ranked = self.index.search(keywords, since=cutoff_date, limit=self.max_results)
+        self.last_query_stats = [dict(
+            self._empty_fetch_stats(), query=self.build_query(keywords),
+            seconds=time.perf_counter() - start, results=len(ranked)
+        )]
+        return [paper.replace(relevance=score) for score, paper in ranked]
+    
+    def _search_fan_out(self, keywords: List[str], cutoff_date: datetime) -> List[Paper]:
+        """
+        将关键词拆分为多个查询并发执行，再合并去重 / Run one query per keyword chunk concurrently, then merge and de-duplicate
+        """
+        queries = [
+            self.build_query(keywords[i:i + self.chunk_size])
+            for i in range(0, len(keywords), self.chunk_size)
+        ]
+        
+        def run(query: str) -> Tuple[List[Paper], Dict]:
+            start = time.perf_counter()
+            # 每个线程使用独立客户端，请求间隔由共享限流器保证 / Each thread uses its own client; spacing comes from the shared limiter
+            papers, stats = self._search_query(query, cutoff_date, self._make_client())
+            return papers, dict(stats, query=query, seconds=time.perf_counter() - start, results=len(papers))
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            outcomes = list(executor.map(run, queries))
+        
+        self.last_query_stats = [stats for _, stats in outcomes]
+        return self.merge_results([papers for papers, _ in outcomes])[:self.max_results]
+    
+    def merge_results(self, result_lists: List[List[Paper]]) -> List[Paper]:
+        """
+        合并多个查询结果，按arXiv编号去重并按提交时间倒序排列 /
+        Merge several result lists, de-duplicated by arXiv id and sorted by submission time (newest first)
+        """
+        merged = {}
+        for papers in result_lists:
+            for paper in papers:
+                arxiv_id, version = parse_arxiv_id(paper['url'])
+                existing = merged.get(arxiv_id)
+                if existing is None or parse_arxiv_id(existing['url'])[1] < version:
+                    merged[arxiv_id] = paper
+        
+        return sorted(merged.values(), key=lambda paper: paper['submitted'], reverse=True)
+    
+    def _search_query(self, query: str, cutoff_date: datetime, client: arxiv.Client) -> Tuple[List[Paper], Dict]:
+        """
+        执行单个查询，有本地存储时经由存储 / Run a single query, going through the store when one is configured
+        
+        Returns:
+            (论文列表, 分页统计) / (papers, paging statistics)
+        """
+        if self.store is None:
+            try:
+                papers, _, stats = self._fetch_remote(query, cutoff_date, client)
+            except Exception as e:
+                print(f"搜索论文时出错: {e}")
+                return [], self._empty_fetch_stats()
+            if self.index is not None:
+                self.index.add_papers(papers)
+            return papers, stats
+        
+        return self._search_with_store(query, cutoff_date, client)
+    
+    def _search_with_store(self, query: str, cutoff_date: datetime, client: arxiv.Client) -> Tuple[List[Paper], Dict]:
+        """
+        通过本地存储搜索，只从arXiv获取缺失的部分 / Search through the local store, fetching only the missing part from arXiv
+        """
+        state = self.store.get_query_state(query)
+        
+        # 上次已连续覆盖到截止时间之前时，只需获取更新的论文 / If the last run already covered back past the cutoff, only newer papers are needed
+        since = cutoff_date
+        if self.incremental and state and state['covered_from'] <= cutoff_date:
+            since = max(cutoff_date, state['last_seen'])
         
         try:
-            for paper in self.client.results(search):
-                # 检查论文提交日期
-                if paper.published.replace(tzinfo=None) < cutoff_date:
-                    continue
-                
-                paper_info = {
-                    'title': paper.title,
-                    'authors': [str(author) for author in paper.authors],
-                    'abstract': paper.summary,
-                    'url': paper.entry_id,
-                    'pdf_url': paper.pdf_url,
-                    'published': paper.published.strftime('%Y-%m-%d'),
-                    'categories': paper.categories
-                }
-                papers.append(paper_info)
+            papers, exhausted, stats = self._fetch_remote(query, since, client)
+        except Exception as e:
+            print(f"搜索论文时出错: {e}")
+            # 网络失败时仍返回本地已有的论文 / Still return locally stored papers on network failure
+            return self.store.load_papers(query, cutoff_date, self.max_results), self._empty_fetch_stats()
+        
+        self.store.upsert_papers(papers, query)
+        if self.index is not None:
+            self.index.add_papers(papers)
+        self._update_coverage(query, state, papers, since, cutoff_date, exhausted)
+        
+        return self.store.load_papers(query, cutoff_date, self.max_results), stats
+    
+    def _update_coverage(self, query: str, state: Optional[Dict], papers: List[Paper],
+                         since: datetime, cutoff_date: datetime, exhausted: bool):
+        """更新查询已连续覆盖的时间范围 / Update the contiguous time range covered by the query"""
+        newest = datetime.strptime(papers[0]['submitted'], TIMESTAMP_FORMAT) if papers else since
+        oldest = datetime.strptime(papers[-1]['submitted'], TIMESTAMP_FORMAT) if papers else since
+        
+        if since > cutoff_date:
+            # 增量获取：与旧范围相连时合并，否则旧范围失效 / Incremental: merge with the old range if contiguous, otherwise drop it
+            covered_from = state['covered_from'] if exhausted else oldest
+            last_seen = max(newest, state['last_seen'])
+        else:
+            covered_from = cutoff_date if exhausted else oldest
+            last_seen = newest
+        
+        self.store.update_query_state(query, last_seen, covered_from)
+    
+    def _fetch_remote(self, query: str, since: datetime, client: arxiv.Client) -> Tuple[List[Paper], bool, Dict]:
+        """
+        按提交时间窗口分页获取论文，越过 since 即停止 / Page through the submission-date window, stopping once past since
+        
+        时间窗口直接写入查询（submittedDate），页大小根据观察到的命中率自适应调整 /
+        The date window is pushed into the query (submittedDate) and page sizes adapt to the observed hit density
+        
+        Args:
+            query: 查询字符串 / Query string
+            since: 最早提交时间 / Earliest submission time
+            client: 使用的arXiv客户端 / arXiv client to use
+            
+        Returns:
+            (论文列表, 是否已覆盖到 since, 分页统计) / (papers, whether the range back to since was fully covered, paging statistics)
+        """
+        # arXiv的提交时间按GMT计算，since 和 until 都是UTC；窗口上界留出余量；边界取整到小时/天，使相近的搜索得到相同的URL便于缓存 /
+        # arXiv submission dates are in GMT and so are since and until; the upper bound gets headroom, and both
+        # bounds are rounded to the hour/day so near-identical searches produce the same url for the response cache
+        until = utc_now() + timedelta(days=2)
+        windowed_query = f"({query}) AND submittedDate:[{since.strftime('%Y%m%d%H00')} TO {until.strftime('%Y%m%d0000')}]"
+        
+        session = client._session
+        requests_before, bytes_before = session.request_count, session.bytes_received
+        
+        papers = []
+        seen = 0
+        offset = 0
+        exhausted = False
+        
+        while len(papers) < self.max_results and not exhausted:
+            page_size = self._next_page_size(self.max_results - len(papers))
+            client.page_size = page_size
+            search = arxiv.Search(
+                query=windowed_query,
+                max_results=offset + page_size,
+                sort_by=arxiv.SortCriterion.SubmittedDate,
+                sort_order=arxiv.SortOrder.Descending
+            )
+            
+            page_seen = 0
+            page_hits = 0
+            for paper in client.results(search, offset=offset):
+                page_seen += 1
+                # 按提交时间倒序，越过截止时间后不会再有命中 / Sorted newest first, nothing past the cutoff can match
+                if paper.published.astimezone(timezone.utc).replace(tzinfo=None) < since:
+                    exhausted = True
+                    break
                 
+                page_hits += 1
+                papers.append(self._result_to_paper(paper))
                 if len(papers) >= self.max_results:
                     break
-                    
+            
+            seen += page_seen
+            offset += page_seen
+            self._observe_hit_density(page_seen, page_hits)
+            
+            # 返回条数不足一页说明结果已取完 / A short page means the results are used up
+            if page_seen < page_size and len(papers) < self.max_results:
+                exhausted = True
+        
+        stats = {
+            'pages': session.request_count - requests_before,
+            'entries': seen,
+            'discarded': seen - len(papers),
+            'bytes': session.bytes_received - bytes_before
+        }
+        return papers, exhausted, stats
+    
+    def _next_page_size(self, needed: int) -> int:
+        """根据命中率估算还需要请求的条数 / Estimate how many entries to request from the hit density"""
+        return max(1, min(self.MAX_PAGE_SIZE, math.ceil(needed / self._hit_density)))
+    
+    def _observe_hit_density(self, seen: int, hits: int):
+        """用指数滑动平均更新命中率 / Update the hit density with an exponential moving average"""
+        if seen:
+            density = max(hits / seen, 0.05)
+            self._hit_density = 0.5 * self._hit_density + 0.5 * density
+    
+    def _empty_fetch_stats(self) -> Dict:
+        return {'pages': 0, 'entries': 0, 'discarded': 0, 'bytes': 0}
+    
+    def harvest_category_feed(self, categories: List[str]) -> List[Paper]:
+        """
+        批量获取分类的每日列表（订阅源）/ Harvest the daily listing of the given categories in bulk (feed)
+        
+        同一组分类在缓存有效期内只下载一次，多个关键词配置共享同一份结果 /
+        The same categories are downloaded once per cache period and shared by all keyword profiles
+        
+        Args:
+            categories: arXiv分类列表，如 ["cs.AI", "cs.LG"] / List of arXiv categories
+            
+        Returns:
+            论文信息列表 / List of paper information
+        """
+        # arXiv支持用+合并多个分类，一次请求即可取回全部 / arXiv accepts categories joined by +, so one request covers all of them
+        key = "+".join(sorted(categories))
+        
+        with self._harvest_lock:
+            cached = self._harvest_cache.get(key)
+            if cached and time.time() - cached[0] < self.harvest_ttl:
+                # 调用方会写入总结，每次返回副本，缓存中的记录保持原样 / Callers write summaries, so hand out copies and keep the cached records clean
+                return [paper.replace() for paper in cached[1]]
+            
+            response = self.session.get(config.ARXIV_FEED_URL.format(categories=key), timeout=60)
+            response.raise_for_status()
+            feed = feedparser.parse(response.content)
+            
+            papers = self.merge_results([[self._feed_entry_to_paper(entry) for entry in feed.entries]])
+            self._harvest_cache[key] = (time.time(), papers)
+        
+        if self.store is not None:
+            self.store.upsert_papers(papers)
+        if self.index is not None:
+            self.index.add_papers(papers)
+        
+        return [paper.replace() for paper in papers]
+    
+    def harvest_papers(self, keywords: List[str], categories: Optional[List[str]] = None,
+                       days_back: int = 1) -> List[Paper]:
+        """
+        从分类每日列表中本地匹配关键词 / Match keywords locally against the categories' daily listing
+        
+        每日列表只包含最近一次发布的论文，更早的论文请使用 search_papers /
+        The daily listing only holds the latest announcement; use search_papers for older papers
+        
+        Args:
+            keywords: 搜索关键词列表 / List of search keywords
+            categories: arXiv分类列表，默认使用配置 / List of arXiv categories, defaults to config
+            days_back: 搜索最近几天的论文 / Search papers from recent days
+            
+        Returns:
+            论文信息列表 / List of paper information
+        """
+        try:
+            papers = self.harvest_category_feed(categories or config.HARVEST_CATEGORIES)
         except Exception as e:
-            print(f"搜索论文时出错: {e}")
+            print(f"获取分类列表时出错: {e}")
             return []
         
-        return papers
+        # 订阅源的提交时间是UTC / Feed submission times are UTC
+        cutoff = (utc_now() - timedelta(days=days_back)).strftime(TIMESTAMP_FORMAT)
+        pattern = self.compile_keywords(keywords)
+        matched = [
+            paper for paper in papers
+            if paper['submitted'] >= cutoff and self.match_keywords(paper, pattern)
+        ]
+        return matched[:self.max_results]
+    
+    def compile_keywords(self, keywords: List[str]) -> re.Pattern:
+        """
+        将关键词编译为不区分大小写的短语匹配正则 / Compile keywords into a case-insensitive phrase regex
+        """
+        phrases = [r'\s+'.join(re.escape(word) for word in keyword.split()) for keyword in keywords if keyword.strip()]
+        if not phrases:
+            # 空的选择分支会匹配任意文本，没有关键词时应当什么都不匹配 / An empty alternation matches everything; no keywords must match nothing
+            return re.compile(r'(?!)')
+        return re.compile(r'\b(?:' + '|'.join(phrases) + r')\b', re.IGNORECASE)
+    
+    def match_keywords(self, paper: Paper, pattern: re.Pattern) -> bool:
+        """
+        判断论文标题或摘要是否包含任一关键词（与 ti:/abs: 查询一致）/
+        Whether the title or abstract contains any keyword (same as the ti:/abs: query)
+        """
+        return bool(pattern.search(paper['title']) or pattern.search(paper['abstract']))
+    
+    def _feed_entry_to_paper(self, entry) -> Paper:
+        """将订阅源条目转换为论文记录 / Convert a feed entry into a paper record"""
+        # 条目编号形如 oai:arXiv.org:2401.01234v1 / Entry ids look like oai:arXiv.org:2401.01234v1
+        arxiv_id = entry.get('id', entry.get('link', '')).split(':')[-1].split('/abs/')[-1]
+        if not re.search(r'v\d+$', arxiv_id):
+            arxiv_id += 'v1'
+        url = f"http://arxiv.org/abs/{arxiv_id}"
+        
+        # 摘要前带有 "arXiv:... Announce Type: new Abstract:" 前缀 / Abstracts are prefixed with "arXiv:... Announce Type: new Abstract:"
+        abstract = re.sub(r'^.*?Abstract:\s*', '', entry.get('summary', ''), count=1, flags=re.DOTALL)
+        
+        # 作者可能是一个逗号分隔的字符串 / Authors may come as a single comma-separated string
+        authors = []
+        for author in entry.get('authors', []) or [{'name': entry.get('author', '')}]:
+            authors.extend(name.strip() for name in author.get('name', '').split(',') if name.strip())
+        
+        parsed = entry.get('published_parsed') or entry.get('updated_parsed')
+        published = datetime(*parsed[:6]) if parsed else utc_now()
+        
+        return Paper(
+            title=self.clean_text(entry.get('title', '')),
+            authors=authors,
+            abstract=abstract.strip(),
+            url=url,
+            pdf_url=url.replace('/abs/', '/pdf/'),
+            published=published.strftime('%Y-%m-%d'),
+            categories=[tag['term'] for tag in entry.get('tags', [])],
+            submitted=published.strftime(TIMESTAMP_FORMAT)
+        )
+    
+    def _result_to_paper(self, paper: arxiv.Result) -> Paper:
+        """将arXiv结果转换为论文记录 / Convert an arXiv result into a paper record"""
+        return Paper(
+            title=paper.title,
+            authors=[str(author) for author in paper.authors],
+            abstract=paper.summary,
+            url=paper.entry_id,
+            pdf_url=paper.pdf_url,
+            published=paper.published.strftime('%Y-%m-%d'),
+            categories=paper.categories,
+            submitted=paper.published.strftime(TIMESTAMP_FORMAT)
+        )
     
     def clean_text(self, text: str) -> str:
         """清理文本，移除多余的空白字符和换行符"""
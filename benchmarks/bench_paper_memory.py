@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+论文记录内存基准 / Paper Record Memory Benchmark
+比较旧的字典表示（含总结阶段的复制）与 Paper 记录的每篇内存占用 /
+Compares bytes per paper of the old dict representation (including the summary-stage copy) with Paper records
+
+用法 / Usage: python benchmarks/bench_paper_memory.py [论文数量 / number of papers]
+"""
+
+import json
+import os
+import random
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from paper import Paper
+
+AUTHOR_POOL = [f"Author {i}" for i in range(2000)]
+CATEGORY_POOL = ["cs.AI", "cs.LG", "cs.CL", "cs.CV", "stat.ML", "cs.NE", "cs.IR"]
+
+
+def make_raw_papers(count: int):
+    """生成模拟的原始字段（每篇的字符串都是新对象，与解析网络响应时一致）/
+    Generate simulated raw fields (fresh string objects per paper, as when parsing responses)"""
+    rng = random.Random(42)
+    for i in range(count):
+        # 经过 JSON 往返得到独立的字符串对象 / Round-trip through JSON to get distinct string objects
+        yield json.loads(json.dumps({
+            'title': f"Paper title number {i} about neural networks",
+            'authors': rng.sample(AUTHOR_POOL, rng.randint(2, 8)),
+            'abstract': "We study neural networks. " * 40,
+            'url': f"http://arxiv.org/abs/2401.{i:05d}v1",
+            'pdf_url': f"http://arxiv.org/pdf/2401.{i:05d}v1",
+            'published': f"2024-01-{i % 28 + 1:02d}",
+            'categories': rng.sample(CATEGORY_POOL, 2),
+            'submitted': f"2024-01-{i % 28 + 1:02d}T12:00:00"
+        }))
+
+
+def measure(build, count: int) -> float:
+    """返回保留下来的论文结构（含字符串）每篇占用的字节数 / Return retained bytes per paper, strings included"""
+    tracemalloc.start()
+    raw = list(make_raw_papers(count))
+    papers = build(raw)
+    del raw
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del papers
+    return retained / count
+
+
+def build_dicts(raw):
+    # 旧流程：获取阶段生成字典，总结阶段再 copy 一份 / Old flow: dicts from the fetch stage, copied again by the summary stage
+    fetched = [dict(fields) for fields in raw]
+    summarized = []
+    for paper in fetched:
+        paper_copy = paper.copy()
+        paper_copy['summary'] = "summary"
+        summarized.append(paper_copy)
+    return fetched, summarized
+
+
+def build_records(raw):
+    papers = [Paper.from_dict(fields) for fields in raw]
+    for paper in papers:
+        paper['summary'] = "summary"
+    return papers
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+
+    # 旧流程同时保留获取结果和复制结果，两者都计入 / The old flow keeps both the fetched and the copied lists alive
+    dict_bytes = measure(build_dicts, count)
+    record_bytes = measure(build_records, count)
+
+    print(f"论文数量 / papers: {count}")
+    print(f"字典 + 复制 / dict + copy: {dict_bytes:,.0f} bytes/paper")
+    print(f"Paper 记录 / Paper record: {record_bytes:,.0f} bytes/paper")
+    print(f"节省 / saved: {1 - record_bytes / dict_bytes:.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+报告渲染基准 / Report Rendering Benchmark
+比较旧的 += 拼接整份HTML后再写文件，与预编译模板逐篇流式写入文件的耗时和峰值内存 /
+Compares time and peak memory of the old build-with-+=-then-write approach with streaming precompiled
+per-paper fragments straight into the file
+
+用法 / Usage: python benchmarks/bench_report_render.py [论文数量 / number of papers]
+"""
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from report_generator import ReportGenerator, escape_html
+
+
+def make_papers(count: int):
+    """生成带双语总结的模拟论文 / Generate simulated papers with bilingual summaries"""
+    return [{
+        'title': f"Paper title number {i} about <neural> networks & attention",
+        'authors': [f"Author {i + j}" for j in range(5)],
+        'published': f"2024-01-{i % 28 + 1:02d}",
+        'categories': ["cs.AI", "cs.LG"],
+        'summary': "本文提出了一种新的方法。" * 10,
+        'summaries': {
+            'chinese': "本文提出了一种新的方法。" * 10,
+            'english': "The paper proposes a new method. " * 10
+        },
+        'url': f"http://arxiv.org/abs/2401.{i:05d}v1",
+        'pdf_url': f"http://arxiv.org/pdf/2401.{i:05d}v1"
+    } for i in range(count)]
+
+
+def concat_report(reporter: ReportGenerator, papers, keywords, path: str):
+    # 旧流程：每篇论文 += 到同一个字符串，最后一次写入；同样转义字段，只比较拼接方式 /
+    # Old flow: += every paper onto one string, then write once; fields are escaped too so only the assembly differs
+    content = "<html><body>\n"
+    for i, paper in enumerate(papers, 1):
+        summary_html = "".join(f"""<div class="paper-summary">
+                    <strong>📝 {escape_html(label)}:</strong><br>
+                    {escape_html(summary)}
+                </div>""" for label, summary in reporter.summary_sections(paper))
+        content += f"""
+            <div class="paper">
+                <div class="paper-title">
+                    {i}. {escape_html(paper['title'])}
+                </div>
+                <div class="paper-authors">
+                    👥 作者: {escape_html(', '.join(paper['authors'][:3]))}{'等' if len(paper['authors']) > 3 else ''}
+                </div>
+                <div class="paper-info">
+                    📅 发布日期: {escape_html(paper['published'])} | 🏷️ 分类: {escape_html(', '.join(paper['categories']))}
+                </div>
+                {summary_html}
+                <div class="paper-links">
+                    <a href="{escape_html(paper['url'])}" target="_blank">📄 查看论文</a>
+                    <a href="{escape_html(paper['pdf_url'])}" target="_blank">📥 下载PDF</a>
+                </div>
+            </div>
+"""
+    content += "</body></html>\n"
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+
+def stream_report(reporter: ReportGenerator, papers, keywords, path: str):
+    with open(path, 'w', encoding='utf-8') as f:
+        reporter.render_html(papers, keywords, f)
+
+
+def measure(render, reporter, papers, path: str):
+    """
+    返回 (秒, 峰值额外内存字节)；tracemalloc 会拖慢大量小对象的分配，所以计时和内存分两次运行 /
+    Return (seconds, peak extra bytes); tracemalloc slows down many small allocations, so timing and memory
+    are measured in separate runs
+    """
+    start = time.perf_counter()
+    render(reporter, papers, ["neural networks"], path)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    render(reporter, papers, ["neural networks"], path)
+    peak = tracemalloc.get_traced_memory()[1] - baseline
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    papers = make_papers(count)
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        reporter = ReportGenerator(output_dir)
+        path = os.path.join(output_dir, "report.html")
+        concat_seconds, concat_peak = measure(concat_report, reporter, papers, path)
+        stream_seconds, stream_peak = measure(stream_report, reporter, papers, path)
+        size = os.path.getsize(path)
+
+    print(f"论文数量 / papers: {count}  报告大小 / report size: {size / 2**20:.1f} MiB")
+    print(f"+= 拼接 / += concat:  {concat_seconds:.2f}s, 峰值内存 / peak {concat_peak / 2**20:.2f} MiB")
+    print(f"流式渲染 / streaming: {stream_seconds:.2f}s, 峰值内存 / peak {stream_peak / 2**20:.2f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+本地模拟服务 / Local Mock Servers
+回放录制的arXiv Atom响应，并提供兼容OpenAI接口的桩服务，用于离线基准测试 /
+Replays recorded arXiv Atom responses and serves an OpenAI-compatible stub for offline benchmarks
+"""
+
+import itertools
+import json
+import math
+import os
+import re
+import threading
+import time
+from email import policy
+from email.parser import BytesParser
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from string import Template
+from urllib.parse import parse_qs, urlsplit
+
+# 合并总结请求中每篇论文的ID行 / ID line of each paper in a batched summary prompt
+BATCH_ID_PATTERN = re.compile(r'^ID: (\S+)$', re.MULTILINE)
+# 查询中的提交时间窗口，时间为GMT / Submission date window of a query, in GMT
+DATE_WINDOW_PATTERN = re.compile(r'submittedDate:\[(\d{12}) TO (\d{12})\]')
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+def load_fixture(name: str) -> str:
+    with open(os.path.join(FIXTURES_DIR, name), 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+class MockServer:
+    """
+    模拟arXiv查询接口和OpenAI接口 / Mock arXiv query API and OpenAI API
+
+    - GET  /api/query            按 start/max_results 返回录制条目生成的分页结果，查询中带 submittedDate 窗口时
+                                 只返回窗口内的论文（关键词不参与过滤）/ Paged results built from the recorded entry,
+                                 limited to the submittedDate window when the query has one (keywords are not matched)
+    - POST /v1/chat/completions  返回录制的对话补全响应；合并总结请求返回以论文ID为键的JSON /
+                                 Returns the recorded chat completion; batched prompts get JSON keyed by paper id
+    - POST /v1/files, GET /v1/files/{id}/content                上传/下载批处理文件 / Batch file upload and download
+    - POST /v1/batches, GET /v1/batches/{id}, POST .../cancel   批处理任务，batch_delay 秒后完成 /
+                                                                 Batch jobs, completed after batch_delay seconds
+    """
+
+    def __init__(self, total_papers: int = 0, days: int = 7, latency: float = 0.0, batch_delay: float = 0.0):
+        """
+        Args:
+            total_papers: arXiv接口可返回的论文总数 / Number of papers the arXiv API can return
+            days: 论文提交时间分布的天数 / Number of days the submission times are spread over
+            latency: 每个请求附加的延迟（秒）/ Extra latency added to every request (seconds)
+            batch_delay: 批处理任务从提交到完成的时间（秒）/ Seconds from batch submission to completion
+        """
+        self.total_papers = total_papers
+        self.days = days
+        self.latency = latency
+        self.batch_delay = batch_delay
+        self.files = {}
+        self.batches = {}
+        self._ids = itertools.count(1)
+        self.request_count = 0
+        self.feed_template = Template(load_fixture("arxiv_feed.xml"))
+        self.entry_template = Template(load_fixture("arxiv_entry.xml"))
+        self.completion = json.loads(load_fixture("openai_chat_completion.json"))
+        self._now = datetime.now(timezone.utc)
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def arxiv_api_url(self) -> str:
+        return f"{self.url}/api/query"
+
+    @property
+    def openai_base_url(self) -> str:
+        return f"{self.url}/v1"
+
+    def start(self) -> 'MockServer':
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                mock._count_request()
+                parts = urlsplit(self.path)
+                if parts.path == "/api/query":
+                    self._send(200, "application/atom+xml", mock.render_feed(parse_qs(parts.query)))
+                else:
+                    self._send(*mock.handle_get(parts.path))
+
+            def do_POST(self):
+                mock._count_request()
+                length = int(self.headers.get('Content-Length', 0))
+                body = self.rfile.read(length) if length else b""
+                status, content_type, payload = mock.handle_post(urlsplit(self.path).path, body, self.headers)
+                self._send(status, content_type, payload)
+
+            def _send(self, status: int, content_type: str, payload: bytes):
+                if mock.latency:
+                    time.sleep(mock.latency)
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+
+    def __enter__(self) -> 'MockServer':
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _count_request(self):
+        with self._lock:
+            self.request_count += 1
+
+    def date_window(self, query: str) -> tuple:
+        """
+        返回查询的提交时间窗口内论文的下标范围 [first, last) / Return the index range [first, last) of papers
+        inside the query's submission date window
+
+        第 i 篇论文的提交时间为 now - step * (i + 1)，因此窗口对应一段连续的下标 /
+        Paper i was submitted at now - step * (i + 1), so a window maps to a contiguous index range
+        """
+        match = DATE_WINDOW_PATTERN.search(query)
+        if not match:
+            return 0, self.total_papers
+        lower, upper = (datetime.strptime(bound, '%Y%m%d%H%M').replace(tzinfo=timezone.utc)
+                        for bound in match.groups())
+        step = self._step().total_seconds()
+        first = max(0, math.ceil((self._now - upper).total_seconds() / step) - 1)
+        last = min(self.total_papers, math.floor((self._now - lower).total_seconds() / step))
+        return first, max(first, last)
+
+    def _step(self) -> timedelta:
+        return timedelta(seconds=self.days * 86400 / (self.total_papers + 1))
+
+    def render_feed(self, params: dict) -> bytes:
+        """按分页参数生成Atom响应，论文按提交时间倒序 / Render an Atom page, papers newest first"""
+        first, last = self.date_window(params.get('search_query', [''])[0])
+        start = int(params.get('start', ['0'])[0])
+        max_results = int(params.get('max_results', ['10'])[0])
+        end = min(first + start + max_results, last)
+        step = self._step()
+
+        entries = []
+        for i in range(first + start, end):
+            published = (self._now - step * (i + 1)).strftime('%Y-%m-%dT%H:%M:%SZ')
+            arxiv_id = f"{2400 + i // 100000}.{i % 100000:05d}v1"
+            entries.append(self.entry_template.substitute(arxiv_id=arxiv_id, published=published))
+
+        feed = self.feed_template.substitute(
+            updated=self._now.strftime('%Y-%m-%dT%H:%M:%S-00:00'),
+            total=last - first,
+            start=start,
+            per_page=max(end - first - start, 0),
+            entries="".join(entries)
+        )
+        return feed.encode('utf-8')
+
+    def handle_get(self, path: str) -> tuple:
+        """处理批处理相关的GET请求，返回 (状态码, 内容类型, 响应体) / Handle batch GETs, returning (status, content type, body)"""
+        match = re.fullmatch(r'/v1/files/([^/]+)/content', path)
+        if match and match.group(1) in self.files:
+            return 200, "application/octet-stream", self.files[match.group(1)]['content']
+        match = re.fullmatch(r'/v1/batches/([^/]+)', path)
+        if match and match.group(1) in self.batches:
+            return self._json(self._batch_status(match.group(1)))
+        return 404, "application/json", b'{"error": {"message": "not found"}}'
+
+    def handle_post(self, path: str, body: bytes, headers) -> tuple:
+        """处理POST请求，返回 (状态码, 内容类型, 响应体) / Handle a POST, returning (status, content type, body)"""
+        if path == "/v1/chat/completions":
+            return self._json(self._chat_completion(json.loads(body or b"{}")))
+        if path == "/v1/files":
+            return self._json(self._upload_file(body, headers.get('Content-Type', "")))
+        if path == "/v1/batches":
+            return self._json(self._create_batch(json.loads(body)))
+        match = re.fullmatch(r'/v1/batches/([^/]+)/cancel', path)
+        if match and match.group(1) in self.batches:
+            self.batches[match.group(1)]['status'] = "cancelled"
+            return self._json(self._batch_status(match.group(1)))
+        return 404, "application/json", b'{"error": {"message": "not found"}}'
+
+    def _json(self, data: dict) -> tuple:
+        return 200, "application/json", json.dumps(data, ensure_ascii=False).encode('utf-8')
+
+    def _chat_completion(self, request: dict) -> dict:
+        completion = dict(self.completion, created=int(time.time()))
+        prompt = request.get('messages', [{}])[-1].get('content', "")
+        ids = BATCH_ID_PATTERN.findall(prompt)
+        if ids:
+            text = self.completion['choices'][0]['message']['content']
+            message = {'role': 'assistant', 'content': json.dumps({i: text for i in ids}, ensure_ascii=False)}
+            completion['choices'] = [dict(self.completion['choices'][0], message=message)]
+        return completion
+
+    def _new_id(self, prefix: str) -> str:
+        with self._lock:
+            return f"{prefix}-{next(self._ids)}"
+
+    def _add_file(self, filename: str, purpose: str, content: bytes) -> dict:
+        file_id = self._new_id("file")
+        self.files[file_id] = {'content': content}
+        info = {
+            'id': file_id, 'object': "file", 'bytes': len(content), 'created_at': int(time.time()),
+            'filename': filename, 'purpose': purpose, 'status': "processed"
+        }
+        self.files[file_id]['info'] = info
+        return info
+
+    def _upload_file(self, body: bytes, content_type: str) -> dict:
+        """解析multipart上传的文件 / Parse a multipart file upload"""
+        message = BytesParser(policy=policy.HTTP).parsebytes(f"Content-Type: {content_type}\r\n\r\n".encode('utf-8') + body)
+        fields, filename, content = {}, "upload.jsonl", b""
+        for part in message.iter_parts():
+            name = part.get_param('name', header='content-disposition')
+            if part.get_filename():
+                filename, content = part.get_filename(), part.get_payload(decode=True)
+            else:
+                fields[name] = part.get_content().strip()
+        return self._add_file(filename, fields.get('purpose', "batch"), content)
+
+    def _create_batch(self, request: dict) -> dict:
+        """立即执行请求文件中的每个请求，完成时间由 batch_delay 决定 / Run every request now; completion is delayed by batch_delay"""
+        lines = []
+        for line in self.files[request['input_file_id']]['content'].decode('utf-8').splitlines():
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            lines.append(json.dumps({
+                'id': self._new_id("batch_req"),
+                'custom_id': item['custom_id'],
+                'response': {'status_code': 200, 'body': self._chat_completion(item['body'])},
+                'error': None
+            }, ensure_ascii=False))
+        output = self._add_file("batch_output.jsonl", "batch_output", "\n".join(lines).encode('utf-8'))
+
+        batch_id = self._new_id("batch")
+        self.batches[batch_id] = {
+            'id': batch_id, 'object': "batch", 'endpoint': request['endpoint'],
+            'input_file_id': request['input_file_id'], 'completion_window': request['completion_window'],
+            'status': "in_progress", 'created_at': int(time.time()),
+            'request_counts': {'total': len(lines), 'completed': len(lines), 'failed': 0},
+            '_output_file_id': output['id'], '_ready_at': time.monotonic() + self.batch_delay
+        }
+        return self._batch_status(batch_id)
+
+    def _batch_status(self, batch_id: str) -> dict:
+        batch = self.batches[batch_id]
+        if batch['status'] == "in_progress" and time.monotonic() >= batch['_ready_at']:
+            batch['status'] = "completed"
+        info = {key: value for key, value in batch.items() if not key.startswith('_')}
+        info['output_file_id'] = batch['_output_file_id'] if batch['status'] == "completed" else None
+        return info
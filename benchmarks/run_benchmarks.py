@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+离线性能基准 / Offline Performance Benchmarks
+使用本地模拟的arXiv和OpenAI接口，对获取、总结、报告和端到端流程分别计时，结果写入JSON文件便于版本间对比 /
+Times fetching, summarizing, report writing and the end-to-end pipeline against local mock arXiv and OpenAI
+endpoints, writing a JSON results file that can be diffed between releases
+
+用法 / Usage:
+    python benchmarks/run_benchmarks.py
+    python benchmarks/run_benchmarks.py --sizes 10 1000 --output results.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from arxiv_fetcher import ArxivFetcher
+from main import ArxivPusher
+from mock_servers import MockServer
+from rate_limiter import TokenBucket
+from report_generator import ReportGenerator
+from summarizer import PaperSummarizer
+from summary_backends import MockBackend
+
+KEYWORDS = ["transformer", "sparse attention"]
+DAYS_BACK = 7
+# 模拟服务中论文分布的天数，一半落在搜索窗口之外，用于测量时间窗口查询和越过截止时间即停止 /
+# Days the mock papers are spread over; half fall outside the search window so the windowed query and the
+# stop at the cutoff are measured
+MOCK_DAYS = 2 * DAYS_BACK
+STAGES = ["fetch", "summarize", "offline", "loadtest", "report", "pipeline"]
+
+
+def make_fetcher(server: MockServer, size: int) -> ArxivFetcher:
+    # 本地模拟服务不需要限流，也不使用存储和缓存，只测量获取本身 / No rate limit, store or cache: measure fetching only
+    return ArxivFetcher(
+        max_results=size,
+        limiter=TokenBucket(rate=1e9, capacity=1e9),
+        api_url=server.arxiv_api_url
+    )
+
+
+def make_summarizer(server: MockServer) -> PaperSummarizer:
+    return PaperSummarizer(api_key="bench", base_url=server.openai_base_url)
+
+
+def timed(func):
+    """执行函数并返回 (结果, 耗时秒数)，期间屏蔽控制台输出 / Run func, returning (result, seconds), with console output silenced"""
+    with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+        start = time.perf_counter()
+        result = func()
+        return result, time.perf_counter() - start
+
+
+def record(results: list, stage: str, size: int, seconds: float, **extra):
+    entry = {
+        'stage': stage,
+        'papers': size,
+        'seconds': round(seconds, 6),
+        'papers_per_second': round(size / seconds, 2) if seconds else None
+    }
+    entry.update(extra)
+    results.append(entry)
+    print(f"  {stage:<10} {size:>7} papers  {seconds:>10.3f}s")
+
+
+def run_size(size: int, stages: list, output_dir: str) -> list:
+    results = []
+    with MockServer(total_papers=size, days=MOCK_DAYS) as server:
+        fetcher = make_fetcher(server, size)
+        papers, seconds = timed(lambda: fetcher.search_papers(KEYWORDS, DAYS_BACK))
+        if "fetch" in stages:
+            stats = fetcher.last_query_stats[0]
+            record(results, "fetch", len(papers), seconds, pages=stats['pages'], entries=stats['entries'],
+                   discarded=stats['discarded'], bytes=stats['bytes'])
+
+        if "summarize" in stages:
+            summarizer = make_summarizer(server)
+            _, seconds = timed(lambda: summarizer.summarize_papers(papers, language="chinese"))
+            record(results, "summarize", len(papers), seconds)
+
+        if "offline" in stages:
+            # 批处理任务在模拟服务中立即完成，测量的是提交、轮询和合并结果的开销 / Mock batches finish at once: measures submit, poll and merge overhead
+            summarizer = make_summarizer(server)
+            offline_papers = [paper.replace() for paper in papers]
+            _, seconds = timed(lambda: summarizer.summarize_papers_offline(
+                offline_papers, language="chinese", poll_interval=0.01))
+            record(results, "offline", len(papers), seconds)
+
+        if "loadtest" in stages:
+            # 进程内模拟后端：固定延迟、少量429和500，测量自适应并发下的持续吞吐 /
+            # In-process mock backend with fixed latency and some 429s and 500s: sustained throughput under adaptive concurrency
+            backend = MockBackend(latency=0.05, rate_limit_rate=0.02, error_rate=0.01, max_concurrency=16, seed=0)
+            summarizer = PaperSummarizer(backend=backend, batch_size=1, max_concurrency=32)
+            summarizer.retry_base_delay = 0.01
+            loadtest_papers = [paper.replace() for paper in papers]
+            _, seconds = timed(lambda: summarizer.summarize_papers(loadtest_papers, language="chinese"))
+            stats = summarizer.last_run_stats
+            record(results, "loadtest", len(papers), seconds, requests=backend.requests,
+                   retries=stats['retries'], concurrency_limit=stats['concurrency_limit'],
+                   peak_concurrency=stats['peak_concurrency'])
+
+        if "report" in stages:
+            reporter = ReportGenerator(output_dir)
+            for report_format in ("html", "markdown"):
+                path, seconds = timed(lambda: reporter.save_report(papers, KEYWORDS, report_format))
+                record(results, f"report_{report_format}", len(papers), seconds, bytes=os.path.getsize(path))
+
+        if "pipeline" in stages:
+            with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+                pusher = ArxivPusher()
+            pusher.fetcher = make_fetcher(server, size)
+            pusher.summarizer = make_summarizer(server)
+            pusher.reporter = ReportGenerator(output_dir)
+            processed, seconds = timed(lambda: pusher.fetch_and_process(KEYWORDS, DAYS_BACK, "html", True))
+            record(results, "pipeline", len(processed), seconds)
+
+    return results
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except Exception:
+        return "unknown"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="arXiv 论文推送系统离线基准测试")
+    parser.add_argument("--sizes", nargs="+", type=int, default=[10, 1000, 100000], help="论文数量")
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=STAGES, help="要测试的阶段")
+    parser.add_argument("--output", "-o", help="结果JSON文件路径 (默认: benchmarks/results/bench_<时间>.json)")
+    args = parser.parse_args()
+
+    output = os.path.abspath(args.output or os.path.join(
+        ROOT, "benchmarks", "results", f"bench_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    ))
+
+    results = []
+    # 在临时目录中运行，避免写入项目的 data/ 和 reports/ / Run inside a temp dir so data/ and reports/ stay untouched
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        try:
+            for size in args.sizes:
+                print(f"📊 {size} papers")
+                results.extend(run_size(size, args.stages, os.path.join(workdir, "reports")))
+        finally:
+            os.chdir(cwd)
+
+    report = {
+        'generated_at': datetime.now().isoformat(timespec='seconds'),
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'sizes': args.sizes,
+        'results': results
+    }
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"📄 结果已保存到: {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,11 +5,51 @@ load_dotenv()
 
 # OpenAI API配置
 OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
+OPENAI_BASE_URL = os.getenv('OPENAI_BASE_URL')  # 为空时使用官方接口，可指向兼容接口或本地模拟服务
+
+# 总结后端配置
+SUMMARY_BACKEND = os.getenv('SUMMARY_BACKEND', "openai")  # openai（官方或兼容OpenAI的自建服务）或 mock（本地模拟，用于压测）
+SUMMARY_TIMEOUT = 60.0          # 读取响应的超时（秒）
+SUMMARY_CONNECT_TIMEOUT = 10.0  # 建立连接的超时（秒）
+SUMMARY_POOL_SIZE = 16          # 连接池最大连接数
+SUMMARY_KEEP_ALIVE = True       # 是否复用空闲连接
+
+# 模拟后端配置（SUMMARY_BACKEND = "mock" 时生效）
+MOCK_BACKEND_LATENCY = 0.5            # 平均响应延迟（秒）
+MOCK_BACKEND_RATE_LIMIT_RATE = 0.0    # 返回429的概率
+MOCK_BACKEND_ERROR_RATE = 0.0         # 返回500的概率
+MOCK_BACKEND_MAX_CONCURRENCY = 0      # 超过此并发数的请求返回429，0 表示不限制
 
 # arXiv搜索配置
 MAX_RESULTS = 10  # 每次搜索的最大结果数
 DAYS_BACK = 1     # 搜索最近几天的论文
 
+# arXiv查询接口地址（可指向本地模拟服务）
+ARXIV_API_URL = os.getenv('ARXIV_API_URL', "https://export.arxiv.org/api/query")
+
+# 本地论文存储配置
+PAPER_STORE_PATH = "data/papers.db"  # SQLite数据库路径，设为空字符串则不做持久化
+INCREMENTAL_FETCH = True             # 只从arXiv获取上次运行之后的新论文
+LOCAL_INDEX = True                   # 在内存中为已获取的论文建立BM25倒排索引（--local 搜索）
+
+# 并发查询配置
+FAN_OUT_QUERIES = False      # 按关键词拆分为多个查询并发执行
+FAN_OUT_WORKERS = 4          # 并发查询的线程数
+FAN_OUT_CHUNK_SIZE = 1       # 每个查询包含的关键词数
+ARXIV_REQUEST_INTERVAL = 3.0 # 对arXiv两次请求之间的最小间隔（秒），arXiv要求不低于3秒
+ARXIV_REQUEST_BURST = 1      # 令牌桶容量，1表示不允许突发
+RATE_LIMIT_STATE_PATH = "data/arxiv_rate_limit.state"  # 同一台机器上的命令行、定时任务和Web进程共享的限流状态文件
+
+# HTTP响应缓存配置
+HTTP_CACHE_PATH = "data/http_cache.db"  # 设为空字符串则不缓存
+HTTP_CACHE_TTL = 600                    # 响应有效期（秒），过期后使用ETag/Last-Modified重新验证
+HTTP_CACHE_MAX_BYTES = 50 * 1024 * 1024 # 缓存总大小上限，超出时淘汰最久未访问的响应
+
+# 分类每日列表批量获取配置（--harvest 模式）
+ARXIV_FEED_URL = "https://rss.arxiv.org/atom/{categories}"
+HARVEST_CATEGORIES = ["cs.AI", "cs.LG", "cs.CL", "cs.CV"]
+HARVEST_CACHE_SECONDS = 3600  # 每日列表在进程内的缓存时间（秒）
+
 # 默认搜索关键词（可以通过命令行参数覆盖）
 DEFAULT_KEYWORDS = [
     "machine learning",
@@ -20,4 +60,43 @@ DEFAULT_KEYWORDS = [
 
 # 总结配置
 SUMMARY_MAX_LENGTH = 200  # 总结的最大字符数
-SUMMARY_LANGUAGE = "chinese"  # 总结语言：chinese 或 english
\ No newline at end of file
+SUMMARY_LANGUAGE = "chinese"  # 总结语言：chinese、english 或 bilingual（一次请求同时生成中英文）
+REPORT_SUMMARY_LANGUAGES = ["chinese", "english"]  # 论文有双语总结时报告显示的语言，可只保留一种
+EXTRACTIVE_MAX_SENTENCES = 2   # 未配置API密钥时本地抽取式总结每篇选取的句子数
+EXTRACTIVE_MAX_CHARS = 400     # 本地抽取式总结的最大字符数
+SUMMARY_MAX_CONCURRENCY = 8   # 同时进行的总结请求数上限，1 表示逐篇生成
+SUMMARY_INITIAL_CONCURRENCY = 2  # 初始并发数，延迟正常时逐步提高到上限，遇到429/5xx时减半
+SUMMARY_LATENCY_TARGET = 30.0    # 单个请求延迟超过此值（秒）时不再提高并发
+SUMMARY_MAX_RETRIES = 5          # 遇到429、5xx或连接错误时的最大重试次数
+SUMMARY_RETRY_BASE_DELAY = 1.0   # 指数退避的初始等待（秒），实际等待带随机抖动；有 Retry-After 头时以其为准
+SUMMARY_RETRY_MAX_DELAY = 60.0   # 单次重试的最长等待（秒）
+SUMMARY_MODEL = os.getenv('SUMMARY_MODEL', "gpt-3.5-turbo")  # 自建服务时填写其部署的模型名
+SUMMARY_TEMPERATURE = 0.3
+SUMMARY_MAX_TOKENS = 300
+SUMMARY_MAX_ABSTRACT_TOKENS = 600  # 摘要超过此token数时按句截断后再发送，0 表示不截断
+SUMMARY_RUN_TOKEN_BUDGET = 0       # 每次运行的token预算（提示词加预留输出），超出的论文按相关度改用摘要节选，0 表示不限制
+SUMMARY_RUN_TIME_BUDGET = 0        # 每次运行生成总结的时间预算（秒），超时后剩余论文使用摘要节选，0 表示不限制
+SUMMARY_BATCH_SIZE = 8              # 每个请求最多合并总结的论文数，1 表示逐篇请求
+SUMMARY_BATCH_TOKEN_BUDGET = 6000   # 每个合并请求的token预算（含预留的输出），按此自动调整每批篇数
+
+# OpenAI Batch API 配置（定时任务可离线生成总结，费用更低且不占用同步请求的限额）
+OPENAI_BATCH_MODE = False           # 定时推送时是否默认使用批处理任务生成总结
+OPENAI_BATCH_POLL_INTERVAL = 60     # 轮询批处理任务状态的间隔（秒）
+OPENAI_BATCH_TIMEOUT = 6 * 3600     # 最长等待时间（秒），超时后取消任务并改为同步生成
+
+# 总结缓存配置（按论文版本、语言、提示词、模型和温度区分）
+SUMMARY_CACHE_PATH = "data/summary_cache.db"  # 设为空字符串则不缓存
+SUMMARY_CACHE_MAX_BYTES = 20 * 1024 * 1024    # 缓存总大小上限，超出时淘汰最久未使用的总结
+
+# 报告片段缓存配置（渲染好的单篇论文片段，按论文版本、总结内容、格式和语言区分）
+# 进程内缓存供批量推送中的多个配置、网页端重复下载共用；磁盘缓存让每天重复出现的论文跨天复用片段
+REPORT_FRAGMENT_CACHE_PATH = "data/fragment_cache.db"     # 磁盘缓存路径，空字符串表示只在进程内缓存
+REPORT_FRAGMENT_CACHE_MAX_BYTES = 50 * 1024 * 1024        # 磁盘缓存大小上限，超出时淘汰最久未使用的片段
+REPORT_FRAGMENT_CACHE_MEMORY_BYTES = 8 * 1024 * 1024      # 进程内缓存大小上限；与路径都为空/0时不缓存片段
+
+# 报告归档配置（按日期分区的归档页面、增量更新的索引页和搜索清单）
+REPORT_ARCHIVE_DIR = ""  # 设为如 "reports/archive" 则每份报告同时追加到归档，空字符串表示不归档
+
+# 报告输出配置
+REPORT_PRECOMPRESS = []          # 同时生成的预压缩副本，可选 "gzip"、"br"（需要安装 brotli），供静态服务器直接返回
+REPORT_SKIP_UNCHANGED = False    # 内容与同一配置上一份报告相同时不再写入（如周末没有新论文），沿用上一份报告
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """
 arXiv 论文推送系统 - 演示版本
-不需要OpenAI API，使用论文摘要作为总结
+不需要OpenAI API，从论文摘要中抽取关键句作为总结
 """
 
 import argparse
@@ -9,26 +9,19 @@ from typing import List
 from datetime import datetime
 
 from arxiv_fetcher import ArxivFetcher
+from extractive_summarizer import ExtractiveSummarizer
 from report_generator import ReportGenerator
 import config
 
 class ArxivPusherDemo:
     def __init__(self):
-        self.fetcher = ArxivFetcher(max_results=config.MAX_RESULTS)
+        self.fetcher = ArxivFetcher.from_config()
         self.reporter = ReportGenerator()
+        self.summarizer = ExtractiveSummarizer()
     
     def process_papers_with_abstract_summary(self, papers: List[dict]) -> List[dict]:
-        """使用论文摘要作为总结（截取前200字符）"""
-        for paper in papers:
-            abstract = paper['abstract']
-            # 清理并截取摘要
-            clean_abstract = self.fetcher.clean_text(abstract)
-            if len(clean_abstract) > 200:
-                summary = clean_abstract[:200] + "..."
-            else:
-                summary = clean_abstract
-            paper['summary'] = summary
-        return papers
+        """从摘要中抽取关键句作为总结（本地计算，不调用API）"""
+        return self.summarizer.summarize_papers(papers, language=config.SUMMARY_LANGUAGE)
     
     def fetch_and_process(self, keywords: List[str], days_back: int = 1, 
                          output_format: str = "html", save_file: bool = True) -> List[dict]:
@@ -46,7 +39,7 @@ class ArxivPusherDemo:
         
         print(f"📚 找到 {len(papers)} 篇相关论文")
         
-        # 使用摘要作为总结
+        # 从摘要抽取总结
         papers = self.process_papers_with_abstract_summary(papers)
         
         # 生成报告
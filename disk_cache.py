@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+磁盘缓存模块 / Disk Cache Module
+基于SQLite的键值缓存，支持过期时间和按容量的LRU淘汰 / SQLite-backed key-value cache with TTL and size-bounded LRU eviction
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing, contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional
+
+
+class DiskCache:
+    """
+    磁盘键值缓存 / On-disk key-value cache
+    总大小超过上限时淘汰最久未访问的条目 / Evicts the least recently used entries once the total size exceeds the limit
+    """
+
+    def __init__(self, db_path: str, max_bytes: int = 50 * 1024 * 1024, ttl: Optional[float] = None):
+        """
+        初始化缓存 / Initialize the cache
+
+        Args:
+            db_path: SQLite数据库文件路径 / Path of the SQLite database file
+            max_bytes: 缓存值总大小上限 / Upper bound of the total size of cached values
+            ttl: 条目有效期（秒），为空表示不过期 / Entry lifetime in seconds, None means entries never expire
+        """
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(db_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        with self._connect() as conn:
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS entries (
+                    key TEXT PRIMARY KEY,
+                    value BLOB,
+                    meta TEXT,
+                    size INTEGER,
+                    created_at REAL,
+                    accessed_at REAL
+                );
+                CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries (accessed_at);
+            """)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # 提交后立即关闭连接，不等垃圾回收释放文件句柄 / Closed right after the commit instead of waiting for garbage collection
+        with closing(sqlite3.connect(self.db_path, timeout=30)) as conn, conn:
+            yield conn
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        读取条目 / Read an entry
+
+        Returns:
+            包含 value、meta 和 age（秒）的字典，不存在或已过期时返回 None /
+            Dict with value, meta and age (seconds), or None if missing or expired
+        """
+        now = time.time()
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT value, meta, created_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and (self.ttl is None or now - row[2] <= self.ttl):
+                conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+
+        with self._lock:
+            if row is None or (self.ttl is not None and now - row[2] > self.ttl):
+                self.misses += 1
+                return None
+            self.hits += 1
+
+        return {'value': row[0], 'meta': json.loads(row[1]), 'age': now - row[2]}
+
+    def peek(self, key: str) -> Optional[Dict]:
+        """
+        读取条目但不计入命中统计，也不检查有效期 / Read an entry without counting it or checking its lifetime
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT value, meta, created_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        return {'value': row[0], 'meta': json.loads(row[1]), 'age': time.time() - row[2]}
+
+    def set(self, key: str, value: bytes, meta: Optional[Dict] = None):
+        """
+        写入条目并按容量淘汰 / Write an entry and evict by size
+
+        Args:
+            key: 键 / Key
+            value: 值 / Value
+            meta: 附加元数据 / Extra metadata
+        """
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?)",
+                (key, value, json.dumps(meta or {}), len(value), now, now)
+            )
+            self._evict(conn)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Dict]:
+        """
+        在一个事务中读取多个条目 / Read several entries in one transaction
+
+        Returns:
+            键到条目的字典，只包含存在且未过期的键 / Dict of key to entry, only for present and unexpired keys
+        """
+        keys = list(dict.fromkeys(keys))
+        now = time.time()
+        found = {}
+        with self._connect() as conn:
+            # SQLite限制单条语句的参数个数 / SQLite limits the number of parameters per statement
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                for key, value, meta, created_at in conn.execute(
+                    f"SELECT key, value, meta, created_at FROM entries WHERE key IN ({placeholders})", chunk
+                ):
+                    if self.ttl is None or now - created_at <= self.ttl:
+                        found[key] = {'value': value, 'meta': json.loads(meta), 'age': now - created_at}
+            conn.executemany("UPDATE entries SET accessed_at = ? WHERE key = ?", [(now, key) for key in found])
+
+        with self._lock:
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return found
+
+    def get_first(self, keys: List[str]) -> Optional[Dict]:
+        """
+        按顺序返回第一个存在且未过期的条目，整体计为一次命中或未命中 /
+        Return the first present and unexpired entry in key order, counted as a single hit or miss
+
+        Args:
+            keys: 候选键，按优先级排列 / Candidate keys in order of preference
+        """
+        now = time.time()
+        placeholders = ",".join("?" * len(keys))
+        with self._connect() as conn:
+            rows = {
+                key: (value, meta, created_at) for key, value, meta, created_at in conn.execute(
+                    f"SELECT key, value, meta, created_at FROM entries WHERE key IN ({placeholders})", keys
+                ) if self.ttl is None or now - created_at <= self.ttl
+            }
+            key = next((key for key in keys if key in rows), None)
+            if key is not None:
+                conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+
+        with self._lock:
+            if key is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+
+        value, meta, created_at = rows[key]
+        return {'value': value, 'meta': json.loads(meta), 'age': now - created_at}
+
+    def set_many(self, items: Dict[str, bytes]):
+        """
+        在一个事务中写入多个条目并按容量淘汰 / Write several entries in one transaction and evict by size
+
+        Args:
+            items: 键到值的字典 / Dict of key to value
+        """
+        now = time.time()
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?)",
+                [(key, value, "{}", len(value), now, now) for key, value in items.items()]
+            )
+            self._evict(conn)
+
+    def mark_accessed(self, key: str):
+        """记录一次访问，只影响淘汰顺序，不改变有效期 / Record an access; affects eviction order only, not the lifetime"""
+        with self._connect() as conn:
+            conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (time.time(), key))
+
+    def touch(self, key: str):
+        """将条目重新标记为新鲜 / Mark an entry as fresh again"""
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("UPDATE entries SET created_at = ?, accessed_at = ? WHERE key = ?", (now, now, key))
+
+    def delete(self, key: str):
+        """删除条目 / Delete an entry"""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def _evict(self, conn: sqlite3.Connection):
+        """淘汰最久未访问的条目直到总大小不超过上限 / Evict least recently used entries until under the size limit"""
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        evicted = 0
+        for key, size in conn.execute("SELECT key, size FROM entries ORDER BY accessed_at").fetchall():
+            if total <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            total -= size
+            evicted += 1
+
+        with self._lock:
+            self.evictions += evicted
+
+    def stats(self) -> Dict:
+        """
+        返回缓存统计 / Return cache statistics
+        """
+        with self._connect() as conn:
+            entries, size = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'entries': entries,
+            'bytes': size
+        }
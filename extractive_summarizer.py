@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+本地抽取式总结模块 / Local Extractive Summarizer Module
+不调用任何API，对整批论文的摘要分句后用TF-IDF加TextRank挑选关键句，接口与 PaperSummarizer 相同 /
+Calls no API: splits every abstract in the batch into sentences and picks key sentences with TF-IDF and
+TextRank, behind the same interface as PaperSummarizer
+"""
+
+import math
+import re
+import time
+from typing import Dict, Iterator, List, Tuple
+
+import numpy as np
+
+import config
+from paper_index import tokenize
+
+# 抽取结果的前缀，提示读者这是原文句子而不是生成的总结 / Prefix marking the result as original sentences
+EXTRACT_PREFIX = {
+    "chinese": "【摘要要点】",
+    "english": "[Key sentences] "
+}
+
+BILINGUAL = "bilingual"
+
+_SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+(?=[A-Z0-9(\[])|(?<=[。！？])')
+# 以这些缩写结尾的片段不是完整句子 / Fragments ending in these abbreviations are not full sentences
+_ABBREVIATIONS = ('e.g.', 'i.e.', 'et al.', 'etc.', 'vs.', 'fig.', 'eq.', 'cf.', 'resp.', 'approx.')
+
+
+def sentence_spans(text: str) -> List[Tuple[int, int]]:
+    """
+    找出每个句子在原文中的位置，小数点和常见缩写不会断句 /
+    Locate every sentence in the original text; decimal points and common abbreviations do not end a sentence
+
+    Args:
+        text: 摘要文本 / Abstract text
+
+    Returns:
+        每个句子的 (起始, 结束) 下标，不含句间空白 / (start, end) offsets of each sentence, without the whitespace between
+    """
+    spans = []
+    start = 0
+    for boundary in list(_SENTENCE_BOUNDARY.finditer(text)) + [None]:
+        end = boundary.start() if boundary else len(text)
+        piece = text[start:end]
+        piece_start, piece_end = start + len(piece) - len(piece.lstrip()), start + len(piece.rstrip())
+        if spans and text[spans[-1][0]:spans[-1][1]].lower().endswith(_ABBREVIATIONS):
+            spans[-1] = (spans[-1][0], max(spans[-1][1], piece_end))
+        elif piece_start < piece_end:
+            spans.append((piece_start, piece_end))
+        start = boundary.end() if boundary else len(text)
+    return spans
+
+
+def split_sentences(text: str) -> List[str]:
+    """
+    将摘要切分为句子，句内空白合并为一个空格 / Split an abstract into sentences, collapsing whitespace inside each
+
+    Args:
+        text: 摘要文本 / Abstract text
+
+    Returns:
+        句子列表 / List of sentences
+    """
+    return [" ".join(text[start:end].split()) for start, end in sentence_spans(text)]
+
+
+class ExtractiveSummarizer:
+    """
+    抽取式总结器 / Extractive summarizer
+    整批论文共用一张词表，IDF按论文统计，每篇论文内部用句子向量的余弦相似度构图运行TextRank，
+    得分再按与标题的相似度加权；选出的句子按原文顺序拼接 /
+    One vocabulary for the whole batch with IDF counted over papers; inside each paper TextRank runs on the
+    cosine similarity graph of sentence vectors, boosted by similarity to the title; chosen sentences keep
+    their original order
+    """
+
+    def __init__(self, max_sentences: int = None, max_chars: int = None, damping: float = 0.85,
+                 iterations: int = 30):
+        """
+        初始化总结器 / Initialize the summarizer
+
+        Args:
+            max_sentences: 每篇最多选取的句子数 / Most sentences picked per paper
+            max_chars: 每篇总结的最大字符数 / Longest summary in characters
+            damping: TextRank阻尼系数 / TextRank damping factor
+            iterations: TextRank迭代次数 / TextRank power iterations
+        """
+        self.max_sentences = max_sentences or config.EXTRACTIVE_MAX_SENTENCES
+        self.max_chars = max_chars or config.EXTRACTIVE_MAX_CHARS
+        self.damping = damping
+        self.iterations = iterations
+        self.last_run_stats = {}
+
+    def extract(self, papers: List[Dict]) -> List[str]:
+        """
+        为整批论文抽取关键句 / Extract key sentences for a whole batch
+
+        Args:
+            papers: 论文信息列表 / List of paper information
+
+        Returns:
+            与输入顺序一致的抽取结果（不含前缀）/ Extracts in input order, without prefix
+        """
+        sentences = [split_sentences(paper['abstract']) for paper in papers]
+        vocabulary: Dict[str, int] = {}
+        sentence_terms = [
+            [np.array([vocabulary.setdefault(token, len(vocabulary)) for token in tokenize(sentence)], dtype=np.int64)
+             for sentence in paper_sentences]
+            for paper_sentences in sentences
+        ]
+        title_terms = [
+            np.array([vocabulary[token] for token in tokenize(paper['title']) if token in vocabulary], dtype=np.int64)
+            for paper in papers
+        ]
+
+        # 文档频率按论文统计：每篇论文中出现过的词各计一次 / Document frequency over papers: each paper counts a term once
+        size = max(len(vocabulary), 1)
+        document_frequency = np.zeros(size, dtype=np.float64)
+        for terms in sentence_terms:
+            if terms:
+                np.add.at(document_frequency, np.unique(np.concatenate(terms)), 1)
+        idf = np.log((1 + len(papers)) / (1 + document_frequency)) + 1
+
+        return [
+            self._select(paper_sentences, terms, title, idf)
+            for paper_sentences, terms, title in zip(sentences, sentence_terms, title_terms)
+        ]
+
+    def _select(self, sentences: List[str], terms: List[np.ndarray], title: np.ndarray, idf: np.ndarray) -> str:
+        if len(sentences) <= 1:
+            return self._truncate(sentences[0] if sentences else "")
+
+        # 句子 × 局部词表的TF-IDF矩阵 / Sentence × local vocabulary TF-IDF matrix
+        local, inverse = np.unique(np.concatenate(terms), return_inverse=True)
+        rows = np.repeat(np.arange(len(terms)), [len(t) for t in terms])
+        matrix = np.zeros((len(terms), len(local)))
+        np.add.at(matrix, (rows, inverse), 1)
+        matrix *= idf[local]
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        matrix = np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+
+        # TextRank：在相似度图上做幂迭代 / TextRank: power iteration on the similarity graph
+        similarity = matrix @ matrix.T
+        np.fill_diagonal(similarity, 0)
+        out_weight = similarity.sum(axis=1, keepdims=True)
+        transition = np.divide(similarity, out_weight, out=np.full_like(similarity, 1 / len(terms)), where=out_weight > 0)
+        scores = np.full(len(terms), 1 / len(terms))
+        for _ in range(self.iterations):
+            scores = (1 - self.damping) / len(terms) + self.damping * transition.T @ scores
+
+        # 与标题相似的句子更可能概括全文 / Sentences close to the title tend to summarize the paper
+        if len(title):
+            title_vector = np.isin(local, title) * idf[local]
+            title_norm = np.linalg.norm(title_vector)
+            if title_norm > 0:
+                scores = scores * (1 + matrix @ title_vector / title_norm)
+
+        chosen, length = [], 0
+        for index in np.argsort(-scores, kind='stable'):
+            if len(chosen) >= self.max_sentences:
+                break
+            if chosen and length + len(sentences[index]) + 1 > self.max_chars:
+                continue
+            chosen.append(int(index))
+            length += len(sentences[index]) + 1
+        return self._truncate(" ".join(sentences[i] for i in sorted(chosen)))
+
+    def _truncate(self, text: str) -> str:
+        if len(text) <= self.max_chars:
+            return text
+        return text[:self.max_chars].rsplit(" ", 1)[0] + "..."
+
+    def _format(self, extract: str, language: str):
+        if language == BILINGUAL:
+            return {lang: prefix + extract for lang, prefix in EXTRACT_PREFIX.items()}
+        return EXTRACT_PREFIX["chinese" if language == "chinese" else "english"] + extract
+
+    def summarize_paper(self, paper: Dict, language: str = "chinese") -> str:
+        """
+        为单篇论文抽取总结 / Extract a summary for one paper
+
+        Args:
+            paper: 论文信息字典 / Paper information
+            language: 总结语言，只影响前缀 / Summary language, only affects the prefix
+
+        Returns:
+            论文总结 / Paper summary
+        """
+        summary = self._format(self.extract([paper])[0], language)
+        return summary['chinese'] if language == BILINGUAL else summary
+
+    def summarize_papers(self, papers: List[Dict], language: str = "chinese") -> List[Dict]:
+        """
+        为整批论文抽取总结，结果写回每篇论文 / Extract summaries for a batch, written back into each paper
+
+        Args:
+            papers: 论文信息列表 / List of paper information
+            language: 总结语言（"chinese"、"english" 或 "bilingual"）/ Summary language
+
+        Returns:
+            包含总结的论文信息列表 / Papers with summaries
+        """
+        for _ in self.iter_summaries(papers, language, chunk_size=max(len(papers), 1)):
+            pass
+        return papers
+
+    def iter_summaries(self, papers: List[Dict], language: str = "chinese",
+                       chunk_size: int = 64) -> Iterator[Tuple[int, Dict]]:
+        """
+        分块抽取总结，每块完成后逐篇产出 (下标, 论文) / Extract in chunks, yielding (index, paper) after each chunk
+
+        IDF在每块内统计，块越大越接近整批统计 / IDF is counted per chunk; larger chunks approach whole-batch statistics
+
+        Args:
+            papers: 论文信息列表 / List of paper information
+            language: 总结语言（"chinese"、"english" 或 "bilingual"）/ Summary language
+            chunk_size: 每块的论文数 / Papers per chunk
+        """
+        start = time.perf_counter()
+        for offset in range(0, len(papers), chunk_size):
+            chunk = papers[offset:offset + chunk_size]
+            for index, (paper, extract) in enumerate(zip(chunk, self.extract(chunk)), offset):
+                summary = self._format(extract, language)
+                if language == BILINGUAL:
+                    paper['summaries'] = summary
+                    paper['summary'] = summary['chinese']
+                else:
+                    paper['summary'] = summary
+                yield index, paper
+
+        wall_seconds = time.perf_counter() - start
+        per_paper = wall_seconds / len(papers) if papers else 0.0
+        self.last_run_stats = {
+            'papers': len(papers),
+            'wall_seconds': wall_seconds,
+            'latency_mean': per_paper,
+            'latency_p95': per_paper,
+            'papers_per_second': len(papers) / wall_seconds if wall_seconds else math.inf
+        }
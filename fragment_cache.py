@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+报告片段缓存模块 / Report Fragment Cache Module
+按 (arXiv编号+版本, 总结内容, 格式, 语言, 模板哈希) 缓存渲染好的单篇论文HTML/Markdown片段，
+同一篇论文出现在多份报告中时只需渲染一次 /
+Caches rendered per-paper HTML/Markdown fragments keyed by (arXiv id + version, summary text, format, language,
+template hash), so a paper that appears in many reports is rendered once
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional
+
+from disk_cache import DiskCache
+from paper_store import parse_arxiv_id
+
+
+class FragmentCache:
+    """
+    报告片段缓存 / Report fragment cache
+    进程内的LRU缓存在前，可选的磁盘缓存在后，两者都有容量上限；跨天、跨配置的报告共用磁盘缓存 /
+    A size-bounded in-process LRU in front of an optional size-bounded disk cache; reports across days and
+    profiles share the disk cache
+    """
+
+    def __init__(self, db_path: Optional[str] = "data/fragment_cache.db", max_bytes: int = 50 * 1024 * 1024,
+                 memory_bytes: int = 8 * 1024 * 1024):
+        """
+        初始化缓存 / Initialize the cache
+
+        Args:
+            db_path: 磁盘缓存路径，为空时只使用进程内缓存 / Disk cache path, in-process only if empty
+            max_bytes: 磁盘缓存大小上限 / Size limit of the disk cache
+            memory_bytes: 进程内缓存大小上限 / Size limit of the in-process cache
+        """
+        self.store = DiskCache(db_path, max_bytes=max_bytes) if db_path else None
+        self.memory_bytes = memory_bytes
+        self.hits = 0
+        self.memory_hits = 0
+        self.misses = 0
+        self.memory_evictions = 0
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self._memory_size = 0
+        self._template_hashes: Dict[str, str] = {}
+        # 等待写入磁盘的片段，攒够一批再在一个事务中写入 / Fragments waiting for disk, written in one transaction per batch
+        self._pending: Dict[str, str] = {}
+        self._pending_size = 0
+        self._lock = threading.Lock()
+
+    def make_key(self, url: str, format: str, languages: List[str], sections: List, template: str) -> str:
+        """
+        生成缓存键 / Build a cache key
+
+        Args:
+            url: 论文链接（含版本号）/ Paper url (with version)
+            format: 报告格式 / Report format
+            languages: 报告显示的总结语言 / Summary languages shown in the report
+            sections: 要显示的 (标题, 总结) 列表 / (label, summary) pairs to show
+            template: 片段模板，修改模板后旧片段自动失效 / Fragment template; editing it invalidates old fragments
+        """
+        arxiv_id, version = parse_arxiv_id(url)
+        template_hash = self._template_hashes.get(template)
+        if template_hash is None:
+            template_hash = self._template_hashes[template] = hashlib.sha256(template.encode('utf-8')).hexdigest()[:16]
+        # 每篇论文都要生成一次键，用一次 blake2b 代替多次 JSON 序列化和哈希 /
+        # A key is built for every paper, so one blake2b pass replaces several JSON dumps and hashes
+        summary = "\x1e".join(f"{label}\x1f{text}" for label, text in sections)
+        parts = f"{arxiv_id}v{version}\x1d{format}\x1d{','.join(languages)}\x1d{template_hash}\x1d{summary}"
+        return hashlib.blake2b(parts.encode('utf-8'), digest_size=16).hexdigest()
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, str]:
+        """
+        读取多个片段，先查进程内缓存，其余一次查询磁盘缓存 /
+        Read several fragments: the in-process cache first, the rest from disk in one query
+
+        Returns:
+            键到片段的字典，只包含命中的键 / Dict of key to fragment, only for hits
+        """
+        keys = list(dict.fromkeys(keys))
+        found = {}
+        with self._lock:
+            for key in keys:
+                fragment = self._memory.get(key)
+                if fragment is not None:
+                    self._memory.move_to_end(key)
+                    found[key] = fragment
+            self.memory_hits += len(found)
+
+        with self._lock:
+            for key in keys:
+                if key not in found and key in self._pending:
+                    found[key] = self._pending[key]
+        missing = [key for key in keys if key not in found]
+        if missing and self.store is not None:
+            loaded = {key: entry['value'].decode('utf-8') for key, entry in self.store.get_many(missing).items()}
+            with self._lock:
+                for key, fragment in loaded.items():
+                    self._remember(key, fragment)
+            found.update(loaded)
+
+        with self._lock:
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return found
+
+    def set_many(self, fragments: Dict[str, str]):
+        """
+        保存多个片段；磁盘写入先缓冲，超过进程内缓存上限或调用 flush 时再写入 /
+        Store several fragments; disk writes are buffered until they exceed the in-process limit or flush is called
+        """
+        with self._lock:
+            for key, fragment in fragments.items():
+                self._remember(key, fragment)
+            if self.store is None:
+                return
+            self._pending.update(fragments)
+            self._pending_size += sum(len(fragment) for fragment in fragments.values())
+            full = self._pending_size > self.memory_bytes
+        if full:
+            self.flush()
+
+    def flush(self):
+        """将缓冲的片段写入磁盘缓存 / Write buffered fragments to the disk cache"""
+        with self._lock:
+            pending, self._pending, self._pending_size = self._pending, {}, 0
+        if pending:
+            self.store.set_many({key: fragment.encode('utf-8') for key, fragment in pending.items()})
+
+    def _remember(self, key: str, fragment: str):
+        # 调用方持有锁；按字符数近似计算大小 / Caller holds the lock; size is approximated by characters
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_size -= len(previous)
+        self._memory[key] = fragment
+        self._memory_size += len(fragment)
+        while self._memory_size > self.memory_bytes and self._memory:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_size -= len(evicted)
+            self.memory_evictions += 1
+
+    def stats(self) -> Dict:
+        """返回命中、未命中和淘汰统计 / Return hit, miss and eviction statistics"""
+        disk = self.store.stats() if self.store is not None else {'evictions': 0, 'entries': 0, 'bytes': 0}
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'memory_hits': self.memory_hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.memory_evictions + disk['evictions'],
+            'memory_entries': len(self._memory),
+            'memory_bytes': self._memory_size,
+            'entries': disk['entries'],
+            'bytes': disk['bytes']
+        }
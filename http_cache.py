@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+HTTP响应缓存模块 / HTTP Response Cache Module
+在磁盘上缓存arXiv接口的响应，过期后通过ETag/Last-Modified条件请求重新验证 /
+Caches arXiv responses on disk and revalidates expired ones with ETag/Last-Modified conditional requests
+"""
+
+import threading
+from typing import Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from disk_cache import DiskCache
+
+
+def normalize_url(url: str) -> str:
+    """
+    规范化URL作为缓存键（协议和主机小写，查询参数排序）/
+    Normalize a url into a cache key (lowercase scheme and host, sorted query parameters)
+    """
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or '/', query, ''))
+
+
+class ResponseCache:
+    """
+    HTTP响应缓存 / HTTP response cache
+    有效期内直接返回缓存；过期后若服务器提供了验证信息则发送条件请求 /
+    Serves cached responses within the TTL; after that, sends a conditional request when the server provided validators
+    """
+
+    def __init__(self, db_path: str = "data/http_cache.db", ttl: float = 600,
+                 max_bytes: int = 50 * 1024 * 1024):
+        """
+        初始化缓存 / Initialize the cache
+
+        Args:
+            db_path: 缓存数据库路径 / Path of the cache database
+            ttl: 响应有效期（秒）/ Response lifetime in seconds
+            max_bytes: 缓存总大小上限 / Upper bound of the total cache size
+        """
+        self.ttl = ttl
+        # 过期条目仍需保留以便重新验证，有效期在这里判断 / Expired entries are kept for revalidation, so freshness is checked here
+        self.store = DiskCache(db_path, max_bytes=max_bytes)
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.bytes_saved = 0
+        self._lock = threading.Lock()
+
+    def lookup(self, url: str) -> Optional[Dict]:
+        """
+        查找缓存条目 / Look up a cached entry
+
+        Returns:
+            包含 response、fresh 和 headers（条件请求头）的字典，未缓存时返回 None /
+            Dict with response, fresh and headers (conditional request headers), or None if not cached
+        """
+        entry = self.store.peek(normalize_url(url))
+        if entry is None:
+            return None
+
+        meta = entry['meta']
+        conditional = {}
+        if meta.get('etag'):
+            conditional['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            conditional['If-Modified-Since'] = meta['last_modified']
+
+        return {
+            'response': self._build_response(url, entry['value'], meta),
+            'fresh': entry['age'] <= self.ttl,
+            'headers': conditional
+        }
+
+    def record_hit(self, url: str, size: int, revalidated: bool = False):
+        """记录一次缓存命中 / Record a cache hit"""
+        if revalidated:
+            # 304 响应表示缓存内容仍然有效，重新计算有效期 / A 304 means the cached body is still valid; restart its lifetime
+            self.store.touch(normalize_url(url))
+        else:
+            # lookup 不更新访问时间，命中后再记录，淘汰才是按最近使用 / lookup does not record access, so hits do it to keep eviction LRU
+            self.store.mark_accessed(normalize_url(url))
+        with self._lock:
+            self.hits += 1
+            self.bytes_saved += size
+            if revalidated:
+                self.revalidated += 1
+
+    def store_response(self, url: str, response: requests.Response):
+        """保存成功的响应 / Store a successful response"""
+        with self._lock:
+            self.misses += 1
+        if response.status_code != 200:
+            return
+
+        meta = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'content_type': response.headers.get('Content-Type'),
+            'encoding': response.encoding
+        }
+        self.store.set(normalize_url(url), response.content, meta)
+
+    def _build_response(self, url: str, body: bytes, meta: Dict) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response.url = url
+        response._content = body
+        response.encoding = meta.get('encoding')
+        response.headers = CaseInsensitiveDict({'X-Cache': 'HIT'})
+        if meta.get('content_type'):
+            response.headers['Content-Type'] = meta['content_type']
+        return response
+
+    def stats(self) -> Dict:
+        """
+        返回命中、未命中和节省的字节数 / Return hits, misses and bytes saved
+        """
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'revalidated': self.revalidated,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'bytes_saved': self.bytes_saved,
+            'evictions': self.store.evictions
+        }
@@ -5,92 +5,293 @@ arXiv 论文推送系统
 """
 
 import argparse
+import json
 import sys
-from typing import List
+from typing import Dict, List, Union
 import schedule
 import time
-from datetime import datetime
+from datetime import timedelta
 
 from arxiv_fetcher import ArxivFetcher
-from summarizer import PaperSummarizer
+from paper_store import TIMESTAMP_FORMAT, utc_now
+from summarizer import BILINGUAL, LANGUAGES, PaperSummarizer
+from extractive_summarizer import ExtractiveSummarizer
 from report_generator import ReportGenerator
+from report_archive import ReportArchive
 import config
 
 class ArxivPusher:
     def __init__(self):
-        self.fetcher = ArxivFetcher(max_results=config.MAX_RESULTS)
+        self.fetcher = ArxivFetcher.from_config()
         self.summarizer = None
-        self.reporter = ReportGenerator()
+        self.reporter = ReportGenerator.from_config()
+        # 归档目录不为空时，每份报告同时追加到按日期分区的归档中
+        self.archive = ReportArchive(config.REPORT_ARCHIVE_DIR, self.reporter) if config.REPORT_ARCHIVE_DIR else None
         
         # 初始化总结器（如果有API密钥）
-        if config.OPENAI_API_KEY:
+        if config.OPENAI_API_KEY or config.SUMMARY_BACKEND == "mock":
             try:
-                self.summarizer = PaperSummarizer()
-                print("✅ OpenAI API 已配置，将生成论文总结")
+                self.summarizer = PaperSummarizer.from_config()
+                print(f"✅ 总结后端 {config.SUMMARY_BACKEND} ({config.SUMMARY_MODEL}) 已配置，将生成论文总结")
             except Exception as e:
                 print(f"⚠️  OpenAI API 配置失败: {e}")
-                print("📝 将跳过总结生成功能")
         else:
-            print("⚠️  未配置 OpenAI API 密钥，将跳过总结生成功能")
+            print("⚠️  未配置 OpenAI API 密钥")
+        
+        if self.summarizer is None:
+            # 没有可用的API时用本地抽取式总结代替
+            self.summarizer = ExtractiveSummarizer()
+            print("📝 将使用本地抽取式总结（从摘要中选取关键句）")
     
     def fetch_and_process(self, keywords: List[str], days_back: int = 1, 
-                         output_format: str = "html", save_file: bool = True) -> List[dict]:
-        """获取并处理论文"""
+                         output_format: Union[str, List[str]] = "html", save_file: bool = True,
+                         harvest: bool = False, local: bool = False,
+                         offline_batch: bool = False) -> List[dict]:
+        """获取并处理论文（offline_batch 时通过OpenAI批处理任务生成总结）"""
         
         print(f"🔍 正在搜索关键词: {', '.join(keywords)}")
         print(f"📅 搜索最近 {days_back} 天的论文...")
         
-        # 获取论文
-        papers = self.fetcher.search_papers(keywords, days_back)
+        # 获取论文（harvest 模式下从分类每日列表中本地匹配）
+        if harvest:
+            papers = self.fetcher.harvest_papers(keywords, days_back=days_back)
+        else:
+            papers = self.fetcher.search_papers(keywords, days_back, local=local)
         
         if not papers:
             print("❌ 未找到相关论文")
             return []
         
         print(f"📚 找到 {len(papers)} 篇相关论文")
+        if not harvest and not local:
+            stats = self.fetcher.last_query_stats
+            print(f"📡 arXiv 请求 {sum(s['pages'] for s in stats)} 页, "
+                  f"丢弃 {sum(s['discarded'] for s in stats)} 条, "
+                  f"传输 {sum(s['bytes'] for s in stats) / 1024:.1f} KB")
+        if self.fetcher.response_cache is not None:
+            cache_stats = self.fetcher.response_cache.stats()
+            print(f"💾 响应缓存: 命中 {cache_stats['hits']} 次, 未命中 {cache_stats['misses']} 次, "
+                  f"节省 {cache_stats['bytes_saved'] / 1024:.1f} KB")
         
         # 生成总结
+        printed = False
         if self.summarizer:
             print("🤖 正在生成论文总结...")
-            papers = self.summarizer.summarize_papers(
-                papers, 
-                language=config.SUMMARY_LANGUAGE
-            )
-            print("✅ 总结生成完成")
+            # 本地抽取式总结没有批处理任务，直接同步计算
+            if offline_batch and isinstance(self.summarizer, PaperSummarizer):
+                papers = self.summarizer.summarize_papers_offline(papers, language=config.SUMMARY_LANGUAGE)
+                stats = self.summarizer.last_run_stats
+                print(f"✅ 批处理总结完成 (耗时 {stats['wall_seconds']:.1f}s, "
+                      f"批处理 {stats['batch_requests']} 篇, 改为同步 {stats['batch_fallbacks']} 篇)")
+            else:
+                # 每篇总结完成后立即在控制台显示，不必等待整批完成
+                self.reporter.print_console_stream(
+                    self.summarizer.iter_summaries(papers, language=config.SUMMARY_LANGUAGE),
+                    keywords, len(papers)
+                )
+                printed = True
+                stats = self.summarizer.last_run_stats
+                print(f"✅ 总结生成完成 (耗时 {stats['wall_seconds']:.1f}s, "
+                      f"单篇平均 {stats['latency_mean']:.1f}s, P95 {stats['latency_p95']:.1f}s)")
+            if stats.get('retries'):
+                print(f"🔁 重试 {stats['retries']} 次 (限流 {stats['throttled']} 次), "
+                      f"当前并发上限 {stats['concurrency_limit']}")
+            if stats.get('budget_skipped'):
+                print(f"⚠️  超出本次预算，{stats['budget_skipped']} 篇论文使用摘要节选")
+            if 'cache_hit_rate' in stats:
+                print(f"💾 总结缓存命中 {stats['cache_hits']} 篇 ({stats['cache_hit_rate']:.0%})")
         
         # 生成报告
         if save_file:
-            report_path = self.reporter.save_report(papers, keywords, output_format)
-            print(f"📄 报告已保存到: {report_path}")
+            self.save_report(papers, keywords, output_format)
         
-        # 在控制台显示
-        self.reporter.print_console_report(papers, keywords)
+        # 在控制台显示（流式生成总结时已逐篇显示）
+        if not printed:
+            self.reporter.print_console_report(papers, keywords)
         
         return papers
     
+    def save_report(self, papers: List[dict], keywords: List[str], output_format: Union[str, List[str]] = "html",
+                    name: str = None) -> Dict[str, str]:
+        """
+        保存报告（可同时输出多种格式，只遍历一次论文），启用归档时同时追加到归档页面
+        内容与上一份报告相同的格式沿用上一份报告，全部相同时也不再归档
+        """
+        formats = [output_format] if isinstance(output_format, str) else output_format
+        report_paths = self.reporter.save_reports(papers, keywords, formats, name=name)
+        for format, report_path in report_paths.items():
+            if format in self.reporter.last_skipped:
+                print(f"♻️  内容与上次相同，沿用报告: {report_path}")
+            else:
+                print(f"📄 报告已保存到: {report_path}")
+        render_stats = self.reporter.last_render_stats
+        if render_stats.get('fragment_hits'):
+            print(f"💾 报告片段缓存命中 {render_stats['fragment_hits']} 篇 ({render_stats['fragment_hit_rate']:.0%})")
+        if self.archive is not None and len(self.reporter.last_skipped) < len(report_paths):
+            archive_path = self.archive.add_run(papers, keywords, name=name)
+            print(f"🗂️  已归档到: {archive_path}")
+        return report_paths
+    
+    def load_profiles(self, path: str) -> List[Dict]:
+        """
+        读取批量推送配置文件
+        
+        文件为JSON列表，每项包含 name、keywords，可选 days、format（单个格式或格式列表，
+        可选 html、markdown、jsonl、atom）、language（chinese、english 或 bilingual），例如：
+        [{"name": "nlp", "keywords": ["language model"], "days": 1, "format": "html", "language": "chinese"}]
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            raw_profiles = json.load(f)
+        
+        profiles = []
+        for raw in raw_profiles:
+            if not raw.get('name') or not raw.get('keywords'):
+                raise ValueError(f"配置项缺少 name 或 keywords: {raw}")
+            profiles.append({
+                'name': raw['name'],
+                'keywords': list(raw['keywords']),
+                'days': int(raw.get('days', config.DAYS_BACK)),
+                'format': raw.get('format', 'html'),
+                'language': raw.get('language', config.SUMMARY_LANGUAGE)
+            })
+        return profiles
+    
+    def run_batch(self, profiles_path: str, save_file: bool = True, harvest: bool = False,
+                  offline_batch: bool = False) -> Dict[str, List]:
+        """
+        批量推送：合并所有配置的关键词只获取一次，再按配置筛选并分别生成报告
+        多个配置共享的论文，每种语言的总结只生成一次
+        """
+        profiles = self.load_profiles(profiles_path)
+        
+        # 合并关键词（忽略大小写去重）和时间范围，只获取一次
+        union_keywords = list({keyword.lower(): keyword for profile in profiles for keyword in profile['keywords']}.values())
+        max_days = max(profile['days'] for profile in profiles)
+        
+        print(f"📦 批量推送 {len(profiles)} 个配置，共 {len(union_keywords)} 个关键词")
+        print(f"📅 搜索最近 {max_days} 天的论文...")
+        
+        # 合并后的查询需要为每个配置留出足够的结果数
+        max_results = self.fetcher.max_results
+        self.fetcher.max_results = max_results * len(profiles)
+        try:
+            if harvest:
+                papers = self.fetcher.harvest_papers(union_keywords, days_back=max_days)
+            else:
+                papers = self.fetcher.search_papers(union_keywords, max_days)
+        finally:
+            self.fetcher.max_results = max_results
+        
+        print(f"📚 共获取 {len(papers)} 篇论文")
+        
+        # 按配置在本地筛选；论文的提交时间是UTC，截止时间与获取器一致按UTC计算
+        selections = {}
+        for profile in profiles:
+            pattern = self.fetcher.compile_keywords(profile['keywords'])
+            cutoff = (utc_now() - timedelta(days=profile['days'])).strftime(TIMESTAMP_FORMAT)
+            selections[profile['name']] = [
+                paper for paper in papers
+                if paper['submitted'] >= cutoff and self.fetcher.match_keywords(paper, pattern)
+            ][:max_results]
+        
+        # 每种语言只为去重后的论文生成一次总结；同时需要中英文时合并为一次双语请求
+        summaries = {}
+        if self.summarizer:
+            requested = {profile['language'] for profile in profiles}
+            combine = BILINGUAL in requested or set(LANGUAGES) <= requested
+            request_language = {
+                language: BILINGUAL if combine and language in LANGUAGES + (BILINGUAL,) else language
+                for language in requested
+            }
+            for language in set(request_language.values()):
+                unique = {}
+                for profile in profiles:
+                    if request_language[profile['language']] == language:
+                        for paper in selections[profile['name']]:
+                            unique.setdefault(paper['url'], paper)
+                
+                print(f"🤖 正在为 {len(unique)} 篇论文生成{language}总结...")
+                if offline_batch and isinstance(self.summarizer, PaperSummarizer):
+                    summarize = self.summarizer.summarize_papers_offline
+                else:
+                    summarize = self.summarizer.summarize_papers
+                summarized = summarize([paper.replace() for paper in unique.values()], language=language)
+                for paper in summarized:
+                    summaries[(paper['url'], language)] = (paper['summary'], paper.get('summaries'))
+                    if language == BILINGUAL and paper.get('summaries'):
+                        for half in LANGUAGES:
+                            summaries[(paper['url'], half)] = (paper['summaries'][half], None)
+        
+        # 分别生成报告
+        results = {}
+        for profile in profiles:
+            profile_papers = []
+            for paper in selections[profile['name']]:
+                summary, language_summaries = summaries.get((paper['url'], profile['language']), (None, None))
+                profile_papers.append(paper.replace(summary=summary, summaries=language_summaries))
+            results[profile['name']] = profile_papers
+            
+            print(f"\n📋 配置 {profile['name']}: {len(profile_papers)} 篇论文")
+            if save_file and profile_papers:
+                self.save_report(profile_papers, profile['keywords'], profile['format'], name=profile['name'])
+        
+        return results
+    
     def run_once(self, keywords: List[str], days_back: int = 1, 
-                output_format: str = "html", save_file: bool = True):
+                output_format: Union[str, List[str]] = "html", save_file: bool = True, harvest: bool = False,
+                local: bool = False, offline_batch: bool = False):
         """运行一次推送"""
         try:
-            papers = self.fetch_and_process(keywords, days_back, output_format, save_file)
+            papers = self.fetch_and_process(keywords, days_back, output_format, save_file, harvest, local,
+                                            offline_batch)
             print(f"\n✅ 推送完成! 处理了 {len(papers)} 篇论文")
         except Exception as e:
             print(f"❌ 推送过程中出错: {e}")
     
-    def schedule_daily_push(self, keywords: List[str], time_str: str = "09:00"):
-        """安排每日定时推送"""
+    def run_batch_once(self, profiles_path: str, save_file: bool = True, harvest: bool = False,
+                       offline_batch: bool = False):
+        """运行一次批量推送"""
+        try:
+            results = self.run_batch(profiles_path, save_file, harvest, offline_batch)
+            print(f"\n✅ 批量推送完成! 处理了 {len(results)} 个配置")
+        except Exception as e:
+            print(f"❌ 批量推送过程中出错: {e}")
+    
+    def schedule_daily_push(self, keywords: List[str], time_str: str = "09:00", harvest: bool = False,
+                            profiles_path: str = None, offline_batch: bool = None):
+        """
+        安排每日定时推送
+        
+        定时任务无人等待，offline_batch 为真时通过OpenAI批处理任务生成总结，
+        结果全部返回后再生成报告；为 None 时使用 config.OPENAI_BATCH_MODE
+        """
+        if offline_batch is None:
+            offline_batch = config.OPENAI_BATCH_MODE
         print(f"⏰ 已安排每日 {time_str} 自动推送")
-        print(f"🔍 搜索关键词: {', '.join(keywords)}")
+        if offline_batch:
+            print("📤 总结将通过 OpenAI 批处理任务离线生成")
+        if profiles_path:
+            print(f"📦 批量配置文件: {profiles_path}")
+            schedule.every().day.at(time_str).do(
+                self.run_batch_once,
+                profiles_path=profiles_path,
+                save_file=True,
+                harvest=harvest,
+                offline_batch=offline_batch
+            )
+        else:
+            print(f"🔍 搜索关键词: {', '.join(keywords)}")
+            schedule.every().day.at(time_str).do(
+                self.run_once, 
+                keywords=keywords,
+                days_back=config.DAYS_BACK,
+                output_format="html",
+                save_file=True,
+                harvest=harvest,
+                offline_batch=offline_batch
+            )
         print("按 Ctrl+C 停止定时任务")
         
-        schedule.every().day.at(time_str).do(
-            self.run_once, 
-            keywords=keywords,
-            days_back=config.DAYS_BACK,
-            output_format="html",
-            save_file=True
-        )
-        
         try:
             while True:
                 schedule.run_pending()
@@ -114,9 +315,10 @@ def main():
     )
     parser.add_argument(
         "--format", "-f", 
-        choices=["html", "markdown"], 
-        default="html",
-        help="输出格式 (默认: html)"
+        nargs="+",
+        choices=["html", "markdown", "jsonl", "atom"], 
+        default=["html"],
+        help="输出格式，可同时指定多个，只遍历一次论文 (默认: html)"
     )
     parser.add_argument(
         "--schedule", "-s", 
@@ -128,22 +330,60 @@ def main():
         action="store_true",
         help="不保存报告文件，只在控制台显示"
     )
+    parser.add_argument(
+        "--harvest", 
+        action="store_true",
+        help="从分类每日列表批量获取并在本地匹配关键词，而不是调用搜索API"
+    )
+    parser.add_argument(
+        "--local", 
+        action="store_true",
+        help="只在本地已保存的论文中搜索（BM25排序），不访问arXiv"
+    )
+    parser.add_argument(
+        "--profiles", "-p", 
+        type=str,
+        help="批量推送配置文件（JSON），所有配置共享一次获取"
+    )
+    parser.add_argument(
+        "--offline-batch", 
+        action="store_true",
+        default=None,
+        help="通过 OpenAI Batch API 离线生成总结（适合定时推送，费用更低）"
+    )
+    
+    parser.add_argument(
+        "--archive", 
+        nargs="?",
+        const="reports/archive",
+        help="同时将报告追加到按日期分区的归档目录（默认: reports/archive），并更新索引页和搜索清单"
+    )
     
     args = parser.parse_args()
+    if args.archive:
+        config.REPORT_ARCHIVE_DIR = args.archive
     
     # 创建推送器
     pusher = ArxivPusher()
     
     if args.schedule:
         # 定时推送模式
-        pusher.schedule_daily_push(args.keywords, args.schedule)
+        pusher.schedule_daily_push(args.keywords, args.schedule, harvest=args.harvest,
+                                   profiles_path=args.profiles, offline_batch=args.offline_batch)
+    elif args.profiles:
+        # 批量推送模式
+        pusher.run_batch_once(args.profiles, save_file=not args.no_save, harvest=args.harvest,
+                              offline_batch=bool(args.offline_batch))
     else:
         # 单次运行模式
         pusher.run_once(
             keywords=args.keywords,
             days_back=args.days,
             output_format=args.format,
-            save_file=not args.no_save
+            save_file=not args.no_save,
+            harvest=args.harvest,
+            local=args.local,
+            offline_batch=bool(args.offline_batch)
         )
 
 if __name__ == "__main__":
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+论文记录模块 / Paper Record Module
+紧凑的论文记录类型，同时提供与字典兼容的只读视图供报告模板使用 /
+Compact paper record type that also offers a dict-compatible view for the report templates
+"""
+
+import sys
+from collections.abc import Mapping
+from typing import Dict, Iterable, Iterator, Optional
+
+
+class Paper(Mapping):
+    """
+    论文记录 / Paper record
+    使用 __slots__ 存储字段，作者和分类为驻留字符串组成的元组，以降低大批量论文的内存占用；
+    可以像字典一样用 paper['title'] 访问，未设置的可选字段（summary、summaries、relevance）视为不存在 /
+    Stores fields in __slots__ with authors and categories as tuples of interned strings to keep large
+    backfills small; supports dict-style access such as paper['title'], with unset optional fields
+    (summary, summaries, relevance) treated as missing keys
+    """
+
+    __slots__ = ('title', 'authors', 'abstract', 'url', 'pdf_url', 'published',
+                 'categories', 'submitted', 'summary', 'summaries', 'relevance')
+
+    # 可选字段，值为 None 时不出现在字典视图中 / Optional fields, hidden from the dict view while None
+    OPTIONAL_FIELDS = ('summary', 'summaries', 'relevance')
+
+    def __init__(self, title: str, authors: Iterable[str], abstract: str, url: str, pdf_url: str,
+                 published: str, categories: Iterable[str], submitted: str,
+                 summary: Optional[str] = None, summaries: Optional[Dict[str, str]] = None,
+                 relevance: Optional[float] = None):
+        self.title = title
+        # 作者、分类和日期在大量论文间重复出现，驻留后共享同一份字符串 / Authors, categories and dates repeat across papers; interning shares one copy
+        self.authors = tuple(sys.intern(author) for author in authors)
+        self.abstract = abstract
+        self.url = url
+        self.pdf_url = pdf_url
+        self.published = sys.intern(published)
+        self.categories = tuple(sys.intern(category) for category in categories)
+        self.submitted = submitted
+        self.summary = summary
+        # 双语模式下按语言保存的总结 {语言: 总结} / Per-language summaries in bilingual mode
+        self.summaries = summaries
+        self.relevance = relevance
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> 'Paper':
+        """从论文信息字典创建记录 / Create a record from a paper info dict"""
+        if isinstance(data, cls):
+            return data
+        return cls(**{field: data[field] for field in cls.__slots__ if field in data})
+
+    def to_dict(self) -> Dict:
+        """转换为普通字典（用于JSON序列化）/ Convert to a plain dict (for JSON serialization)"""
+        return {field: getattr(self, field) for field in self}
+
+    def replace(self, **changes) -> 'Paper':
+        """返回修改了部分字段的浅拷贝 / Return a shallow copy with some fields changed"""
+        paper = Paper.__new__(Paper)
+        for field in self.__slots__:
+            setattr(paper, field, changes.get(field, getattr(self, field)))
+        return paper
+
+    def __getitem__(self, key: str):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        value = getattr(self, key)
+        if value is None and key in self.OPTIONAL_FIELDS:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: str, value):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __iter__(self) -> Iterator[str]:
+        for field in self.__slots__:
+            if field not in self.OPTIONAL_FIELDS or getattr(self, field) is not None:
+                yield field
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"Paper(url={self.url!r}, title={self.title!r})"
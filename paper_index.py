@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+本地倒排索引模块 / Local Inverted Index Module
+对已获取论文的标题和摘要建立倒排索引，使用BM25排序，支持多词短语匹配 /
+Builds an inverted index over the titles and abstracts of fetched papers with BM25 ranking and phrase matching
+"""
+
+import math
+import re
+import threading
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from paper import Paper
+from paper_store import PaperStore, TIMESTAMP_FORMAT, parse_arxiv_id
+
+_TOKEN_PATTERN = re.compile(r'\w+')
+
+
+def tokenize(text: str) -> List[str]:
+    """将文本切分为小写词元 / Split text into lowercase tokens"""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+class PaperIndex:
+    """
+    论文倒排索引 / Paper inverted index
+    词元 → {论文编号: 位置列表}，同一论文的新版本会替换旧版本 /
+    token → {arXiv id: positions}; a newer version of a paper replaces the older one
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        """
+        初始化索引 / Initialize the index
+
+        Args:
+            k1: BM25词频饱和参数 / BM25 term frequency saturation
+            b: BM25文档长度归一化参数 / BM25 document length normalization
+        """
+        self.k1 = k1
+        self.b = b
+        self.postings: Dict[str, Dict[str, List[int]]] = defaultdict(dict)
+        self.papers: Dict[str, Paper] = {}
+        self._versions: Dict[str, int] = {}
+        self._lengths: Dict[str, int] = {}
+        self._total_length = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_store(cls, store: PaperStore) -> 'PaperIndex':
+        """从本地论文存储构建索引 / Build an index from the local paper store"""
+        index = cls()
+        index.add_papers(store.load_all_papers())
+        return index
+
+    def __len__(self) -> int:
+        return len(self.papers)
+
+    def add_papers(self, papers: List[Paper]):
+        """
+        增量加入论文 / Add papers incrementally
+
+        Args:
+            papers: 论文信息列表 / List of paper information
+        """
+        with self._lock:
+            for paper in papers:
+                # 保存不含总结的副本，调用方之后写入的总结不会出现在本地搜索结果中 /
+                # Keep a copy without summaries so summaries callers write later never leak into local searches
+                paper = Paper.from_dict(paper).replace(summary=None, summaries=None, relevance=None)
+                arxiv_id, version = parse_arxiv_id(paper.url)
+                if arxiv_id in self._versions:
+                    if self._versions[arxiv_id] >= version:
+                        continue
+                    self._remove(arxiv_id)
+                self._add(arxiv_id, version, paper)
+
+    def _add(self, arxiv_id: str, version: int, paper: Paper):
+        tokens = tokenize(paper['title']) + tokenize(paper['abstract'])
+        for position, token in enumerate(tokens):
+            self.postings[token].setdefault(arxiv_id, []).append(position)
+
+        self.papers[arxiv_id] = paper
+        self._versions[arxiv_id] = version
+        self._lengths[arxiv_id] = len(tokens)
+        self._total_length += len(tokens)
+
+    def _remove(self, arxiv_id: str):
+        paper = self.papers.pop(arxiv_id)
+        for token in set(tokenize(paper['title']) + tokenize(paper['abstract'])):
+            postings = self.postings[token]
+            postings.pop(arxiv_id, None)
+            if not postings:
+                del self.postings[token]
+
+        del self._versions[arxiv_id]
+        self._total_length -= self._lengths.pop(arxiv_id)
+
+    def _phrase_positions(self, terms: List[str]) -> Dict[str, int]:
+        """
+        统计每篇论文中短语出现的次数 / Count phrase occurrences per paper
+
+        Returns:
+            {论文编号: 出现次数} / {arXiv id: occurrences}
+        """
+        if any(term not in self.postings for term in terms):
+            return {}
+        if len(terms) == 1:
+            return {arxiv_id: len(positions) for arxiv_id, positions in self.postings[terms[0]].items()}
+
+        # 从最短的倒排表开始求交集 / Intersect starting from the shortest posting list
+        candidates = set(min((self.postings[term] for term in terms), key=len))
+        for term in terms:
+            candidates &= self.postings[term].keys()
+
+        counts = {}
+        for arxiv_id in candidates:
+            following = [set(self.postings[term][arxiv_id]) for term in terms[1:]]
+            count = sum(
+                1 for start in self.postings[terms[0]][arxiv_id]
+                if all(start + offset + 1 in positions for offset, positions in enumerate(following))
+            )
+            if count:
+                counts[arxiv_id] = count
+        return counts
+
+    def search(self, keywords: List[str], since: Optional[datetime] = None,
+               limit: Optional[int] = None) -> List[Tuple[float, Paper]]:
+        """
+        用BM25对包含任一关键词（短语）的论文排序 / Rank papers containing any keyword (phrase) with BM25
+
+        Args:
+            keywords: 关键词列表，多词关键词按短语匹配 / Keywords; multi-word keywords are matched as phrases
+            since: 最早提交时间 / Earliest submission time
+            limit: 最大数量 / Maximum number of results
+
+        Returns:
+            按得分从高到低排列的 (得分, 论文) 列表 / (score, paper) pairs, highest score first
+        """
+        with self._lock:
+            total = len(self.papers)
+            if not total:
+                return []
+            average_length = self._total_length / total
+            cutoff = since.strftime(TIMESTAMP_FORMAT) if since else None
+
+            scores: Dict[str, float] = defaultdict(float)
+            for keyword in keywords:
+                terms = tokenize(keyword)
+                if not terms:
+                    continue
+                counts = self._phrase_positions(terms)
+                if not counts:
+                    continue
+
+                # 短语整体视为一个词项计算IDF / The whole phrase is treated as one term for IDF
+                idf = math.log(1 + (total - len(counts) + 0.5) / (len(counts) + 0.5))
+                for arxiv_id, tf in counts.items():
+                    if cutoff and self.papers[arxiv_id]['submitted'] < cutoff:
+                        continue
+                    norm = self.k1 * (1 - self.b + self.b * self._lengths[arxiv_id] / average_length)
+                    scores[arxiv_id] += idf * tf * (self.k1 + 1) / (tf + norm)
+
+            ranked = sorted(
+                ((score, self.papers[arxiv_id]) for arxiv_id, score in scores.items()),
+                key=lambda item: (item[0], item[1]['submitted']),
+                reverse=True
+            )
+
+        return ranked[:limit] if limit is not None else ranked
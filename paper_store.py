@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+本地论文存储模块 / Local Paper Store Module
+使用SQLite持久化保存已获取的论文，支持增量获取 / Persists fetched papers in SQLite to support incremental fetching
+"""
+
+import json
+import os
+import re
+import sqlite3
+from contextlib import closing, contextmanager
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from paper import Paper
+
+# 论文发布时间在数据库中的存储格式 / Storage format of paper timestamps in the database
+TIMESTAMP_FORMAT = '%Y-%m-%dT%H:%M:%S'
+
+_ARXIV_ID_PATTERN = re.compile(r'abs/(.+?)(?:v(\d+))?$')
+
+
+def parse_arxiv_id(url: str) -> Tuple[str, int]:
+    """
+    从论文链接中解析arXiv编号和版本 / Parse arXiv id and version from a paper url
+
+    Args:
+        url: 论文链接，如 http://arxiv.org/abs/2401.01234v2 / Paper url
+
+    Returns:
+        (arXiv编号, 版本号) / (arXiv id, version)
+    """
+    match = _ARXIV_ID_PATTERN.search(url.strip())
+    if not match:
+        return url.strip(), 1
+    return match.group(1), int(match.group(2) or 1)
+
+
+def utc_now() -> datetime:
+    """
+    当前的UTC时间（不带时区），与arXiv和数据库中的提交时间一致 /
+    Current UTC time without tzinfo, matching the submission times from arXiv and in the database
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class PaperStore:
+    """
+    本地论文存储 / Local paper store
+    以 (arXiv编号, 版本号) 为主键保存论文，并记录每个查询已覆盖的时间范围 /
+    Stores papers keyed by (arXiv id, version) and records the time range covered by each query
+    """
+
+    def __init__(self, db_path: str = "data/papers.db"):
+        """
+        初始化存储 / Initialize the store
+
+        Args:
+            db_path: SQLite数据库文件路径 / Path of the SQLite database file
+        """
+        self.db_path = db_path
+        directory = os.path.dirname(db_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        self._init_schema()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # 每次操作使用独立连接，便于在Web后台线程中使用；提交后立即关闭，不等垃圾回收释放文件句柄 /
+        # One connection per operation so background threads can use the store; closed right after the commit
+        # instead of holding the file handle until garbage collection
+        with closing(sqlite3.connect(self.db_path)) as conn, conn:
+            yield conn
+
+    def _init_schema(self):
+        with self._connect() as conn:
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS papers (
+                    arxiv_id TEXT NOT NULL,
+                    version INTEGER NOT NULL,
+                    title TEXT,
+                    authors TEXT,
+                    abstract TEXT,
+                    url TEXT,
+                    pdf_url TEXT,
+                    published TEXT,
+                    categories TEXT,
+                    fetched_at TEXT,
+                    PRIMARY KEY (arxiv_id, version)
+                );
+                CREATE INDEX IF NOT EXISTS idx_papers_published ON papers (published);
+                CREATE TABLE IF NOT EXISTS query_papers (
+                    query TEXT NOT NULL,
+                    arxiv_id TEXT NOT NULL,
+                    PRIMARY KEY (query, arxiv_id)
+                );
+                CREATE TABLE IF NOT EXISTS query_state (
+                    query TEXT PRIMARY KEY,
+                    last_seen TEXT,
+                    covered_from TEXT,
+                    updated_at TEXT
+                );
+            """)
+
+    def upsert_papers(self, papers: List[Paper], query: Optional[str] = None):
+        """
+        写入论文，可选地关联到查询 / Write papers, optionally linking them to a query
+
+        Args:
+            papers: 论文信息列表（需包含 submitted 完整时间戳）/ Paper list (must contain the full submitted timestamp)
+            query: 产生这些论文的查询 / Query that produced these papers
+        """
+        if not papers:
+            return
+
+        now = utc_now().strftime(TIMESTAMP_FORMAT)
+        paper_rows = []
+        link_rows = []
+        for paper in papers:
+            arxiv_id, version = parse_arxiv_id(paper['url'])
+            paper_rows.append((
+                arxiv_id, version, paper['title'], json.dumps(paper['authors'], ensure_ascii=False),
+                paper['abstract'], paper['url'], paper['pdf_url'], paper['submitted'],
+                json.dumps(paper['categories']), now
+            ))
+            if query is not None:
+                link_rows.append((query, arxiv_id))
+
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO papers VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                paper_rows
+            )
+            conn.executemany("INSERT OR IGNORE INTO query_papers VALUES (?, ?)", link_rows)
+
+    def load_papers(self, query: str, since: datetime, limit: Optional[int] = None) -> List[Paper]:
+        """
+        读取某个查询在指定时间之后的论文（每篇只取最新版本）/
+        Load papers of a query published after the given time (latest version only)
+
+        Args:
+            query: 查询字符串 / Query string
+            since: 最早发布时间 / Earliest publication time
+            limit: 最大数量 / Maximum number of papers
+
+        Returns:
+            按发布时间倒序排列的论文列表 / Papers sorted by publication time, newest first
+        """
+        sql = """
+            SELECT p.title, p.authors, p.abstract, p.url, p.pdf_url, p.published, p.categories
+            FROM papers p
+            JOIN query_papers q ON q.arxiv_id = p.arxiv_id
+            WHERE q.query = ? AND p.published >= ?
+              AND p.version = (SELECT MAX(version) FROM papers WHERE arxiv_id = p.arxiv_id)
+            ORDER BY p.published DESC, p.arxiv_id DESC
+        """
+        params = [query, since.strftime(TIMESTAMP_FORMAT)]
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._connect() as conn:
+            rows = conn.execute(sql, params).fetchall()
+
+        return [self._row_to_paper(row) for row in rows]
+
+    def load_all_papers(self, since: Optional[datetime] = None) -> List[Paper]:
+        """
+        读取所有论文（每篇只取最新版本）/ Load all papers (latest version only)
+
+        Args:
+            since: 最早发布时间，为空时不限制 / Earliest publication time, unbounded if None
+        """
+        sql = """
+            SELECT p.title, p.authors, p.abstract, p.url, p.pdf_url, p.published, p.categories
+            FROM papers p
+            WHERE p.published >= ?
+              AND p.version = (SELECT MAX(version) FROM papers WHERE arxiv_id = p.arxiv_id)
+            ORDER BY p.published DESC
+        """
+        cutoff = since.strftime(TIMESTAMP_FORMAT) if since else ''
+        with self._connect() as conn:
+            rows = conn.execute(sql, (cutoff,)).fetchall()
+
+        return [self._row_to_paper(row) for row in rows]
+
+    def _row_to_paper(self, row) -> Paper:
+        title, authors, abstract, url, pdf_url, published, categories = row
+        return Paper(
+            title=title,
+            authors=json.loads(authors),
+            abstract=abstract,
+            url=url,
+            pdf_url=pdf_url,
+            published=published[:10],
+            categories=json.loads(categories),
+            submitted=published
+        )
+
+    def get_query_state(self, query: str) -> Optional[Dict]:
+        """
+        获取查询已覆盖的时间范围 / Get the time range already covered by a query
+
+        Returns:
+            包含 last_seen 和 covered_from 的字典，未记录时返回 None /
+            Dict with last_seen and covered_from, or None if unknown
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT last_seen, covered_from FROM query_state WHERE query = ?", (query,)
+            ).fetchone()
+
+        if row is None:
+            return None
+        return {
+            'last_seen': datetime.strptime(row[0], TIMESTAMP_FORMAT),
+            'covered_from': datetime.strptime(row[1], TIMESTAMP_FORMAT)
+        }
+
+    def update_query_state(self, query: str, last_seen: datetime, covered_from: datetime):
+        """
+        记录查询已连续覆盖的时间范围 [covered_from, last_seen] /
+        Record the contiguous time range [covered_from, last_seen] covered by a query
+        """
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO query_state VALUES (?, ?, ?, ?)",
+                (query, last_seen.strftime(TIMESTAMP_FORMAT), covered_from.strftime(TIMESTAMP_FORMAT),
+                 utc_now().strftime(TIMESTAMP_FORMAT))
+            )
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+共享限流模块 / Shared Rate Limiting Module
+令牌桶限流器，可跨线程并通过本地文件锁跨进程共享；进程内共享的HTTP连接池；以及按AIMD调整的并发限制器 /
+Token bucket limiter shared across threads and, via a local file lock, across processes; a process-wide HTTP
+connection pool; and an AIMD concurrency limiter
+"""
+
+import os
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from requests.adapters import HTTPAdapter
+
+try:
+    import fcntl
+except ImportError:  # Windows 上没有 fcntl，只在进程内限流 / No fcntl on Windows, limit within the process only
+    fcntl = None
+
+
+class TokenBucket:
+    """
+    令牌桶限流器 / Token bucket rate limiter
+    以 rate 个/秒的速度补充令牌，最多积累 capacity 个；指定 state_path 时，
+    令牌状态保存在文件中并用文件锁保护，同一台机器上的所有进程共享同一个桶 /
+    Refills rate tokens per second up to capacity; with a state_path the bucket state lives in a
+    file guarded by a file lock, so every process on the machine shares one bucket
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0, state_path: Optional[str] = None):
+        """
+        初始化限流器 / Initialize the limiter
+
+        Args:
+            rate: 每秒补充的令牌数 / Tokens added per second
+            capacity: 桶容量（允许的最大突发）/ Bucket capacity (largest allowed burst)
+            state_path: 跨进程共享的状态文件，为空时只在进程内共享 / State file shared across processes, process-local if None
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.state_path = state_path if fcntl is not None else None
+        self.acquired = 0
+        self.total_wait = 0.0
+        self._lock = threading.Lock()
+        self._tokens = capacity
+        self._updated = time.time()
+
+        if self.state_path:
+            directory = os.path.dirname(self.state_path)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+
+    def acquire(self, tokens: float = 1.0):
+        """
+        阻塞直到取得令牌 / Block until the tokens are available
+
+        Args:
+            tokens: 需要的令牌数 / Number of tokens needed
+        """
+        start = time.monotonic()
+        while True:
+            with self._lock:
+                wait = self._take(tokens)
+            if wait <= 0:
+                break
+            time.sleep(wait)
+
+        with self._lock:
+            self.acquired += 1
+            self.total_wait += time.monotonic() - start
+
+    def _take(self, tokens: float) -> float:
+        """尝试取令牌，返回还需等待的秒数（0表示成功）/ Try to take tokens; return seconds still to wait (0 on success)"""
+        if not self.state_path:
+            self._tokens, self._updated, wait = self._refill_and_take(self._tokens, self._updated, tokens)
+            return wait
+
+        with open(self.state_path, 'a+') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                fields = f.read().split()
+                if len(fields) == 2:
+                    available, updated = float(fields[0]), float(fields[1])
+                else:
+                    available, updated = self.capacity, time.time()
+
+                available, updated, wait = self._refill_and_take(available, updated, tokens)
+
+                f.seek(0)
+                f.truncate()
+                f.write(f"{available} {updated}")
+                f.flush()
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+        return wait
+
+    def _refill_and_take(self, available: float, updated: float, tokens: float) -> Tuple[float, float, float]:
+        now = time.time()
+        available = min(self.capacity, available + max(0.0, now - updated) * self.rate)
+        if available >= tokens:
+            return available - tokens, now, 0.0
+        return available, now, (tokens - available) / self.rate
+
+    def stats(self) -> Dict:
+        """
+        返回已发放的令牌次数和累计等待时间 / Return the number of acquisitions and the total wait time
+        """
+        return {
+            'rate': self.rate,
+            'capacity': self.capacity,
+            'acquired': self.acquired,
+            'total_wait': self.total_wait,
+            'shared_across_processes': bool(self.state_path)
+        }
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD并发限制器 / AIMD concurrency limiter
+    请求延迟不超过目标时，每完成约 limit 个请求把并发上限加一（加性增）；遇到限流或服务端错误时
+    上限乘以 decrease（乘性减），同一时刻的一串失败只减一次 /
+    While latency stays under the target the limit grows by one per limit completions (additive increase);
+    a throttled or failed request multiplies it by decrease (multiplicative decrease), once per burst of failures
+    """
+
+    def __init__(self, initial: int = 2, min_limit: int = 1, max_limit: int = 16,
+                 latency_target: float = 10.0, decrease: float = 0.5):
+        """
+        初始化限制器 / Initialize the limiter
+
+        Args:
+            initial: 初始并发上限 / Initial concurrency limit
+            min_limit: 并发上限的下界 / Lower bound of the limit
+            max_limit: 并发上限的上界 / Upper bound of the limit
+            latency_target: 视为健康的最大请求延迟（秒）/ Largest request latency considered healthy (seconds)
+            decrease: 过载时上限乘以的系数 / Factor applied to the limit on overload
+        """
+        self.min_limit = min_limit
+        self.max_limit = max(max_limit, min_limit)
+        self.latency_target = latency_target
+        self.decrease = decrease
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.increases = 0
+        self.decreases = 0
+        self._limit = float(min(max(initial, min_limit), self.max_limit))
+        self._last_decrease = 0.0
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        """当前并发上限 / Current concurrency limit"""
+        return int(self._limit)
+
+    def acquire(self):
+        """阻塞直到进行中的请求数低于当前上限 / Block until in-flight requests drop below the current limit"""
+        with self._condition:
+            while self.in_flight >= self.limit:
+                self._condition.wait()
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    def release(self, latency: float, overloaded: bool = False):
+        """
+        请求结束后调用，根据结果调整上限 / Call when a request ends; adjusts the limit from its outcome
+
+        Args:
+            latency: 请求耗时（秒）/ Request latency (seconds)
+            overloaded: 是否遇到限流或服务端错误 / Whether the request was throttled or hit a server error
+        """
+        with self._condition:
+            self.in_flight -= 1
+            now = time.monotonic()
+            if overloaded:
+                # 只有在上次减小之后才发出的请求会再次减小上限，同一批并发请求的失败只算一次 /
+                # Only requests sent after the last decrease shrink the limit again, so one burst counts once
+                if now - latency > self._last_decrease:
+                    self._limit = max(self.min_limit, self._limit * self.decrease)
+                    self._last_decrease = now
+                    self.decreases += 1
+            elif latency <= self.latency_target and self._limit < self.max_limit:
+                previous = self.limit
+                self._limit = min(self.max_limit, self._limit + 1.0 / self._limit)
+                if self.limit > previous:
+                    self.increases += 1
+            self._condition.notify_all()
+
+    def stats(self) -> Dict:
+        """
+        返回当前上限和调整次数 / Return the current limit and adjustment counts
+        """
+        return {
+            'limit': self.limit,
+            'in_flight': self.in_flight,
+            'peak_in_flight': self.peak_in_flight,
+            'increases': self.increases,
+            'decreases': self.decreases
+        }
+
+
+_shared_limiters: Dict[Tuple, TokenBucket] = {}
+_shared_adapters: Dict[int, HTTPAdapter] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_limiter(rate: float, capacity: float = 1.0, state_path: Optional[str] = None) -> TokenBucket:
+    """
+    获取进程内共享的限流器，相同参数返回同一个实例 / Get a process-wide limiter; the same arguments return the same instance
+    """
+    key = (rate, capacity, state_path)
+    with _shared_lock:
+        if key not in _shared_limiters:
+            _shared_limiters[key] = TokenBucket(rate, capacity, state_path)
+        return _shared_limiters[key]
+
+
+def shared_adapter(pool_size: int = 10) -> HTTPAdapter:
+    """
+    获取进程内共享的HTTP连接池，所有会话复用同一批keep-alive连接 /
+    Get the process-wide HTTP connection pool so every session reuses the same keep-alive connections
+    """
+    with _shared_lock:
+        if pool_size not in _shared_adapters:
+            _shared_adapters[pool_size] = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        return _shared_adapters[pool_size]
@@ -0,0 +1,449 @@
+#!/usr/bin/env python3
+"""
+报告归档模块 / Report Archive Module
+把每次运行的报告追加到按日期分区的归档页面，增量更新索引页，并维护供静态搜索页加载的JSON清单 /
+Appends every run's report to date-partitioned archive pages, updates an index page incrementally and keeps a
+JSON Lines manifest that a static search page loads
+
+归档目录结构 / Layout:
+    index.html                       每次运行一行，按时间顺序追加 / One line per run, appended in time order
+    days/2024-01/2024-01-15.html     当天所有运行的论文 / Papers of every run on that day
+    manifest.jsonl                   搜索清单，每次运行一行，只追加 / Search manifest, one line per run, append-only
+    search.html                      在浏览器中过滤清单的静态页面 / Static page that filters the manifest in the browser
+
+每个页面都以固定的结尾收尾，追加时原样复制已有内容并在结尾前插入新内容，不重新生成已有内容；
+页面先写入临时文件再替换，写入中断时原文件保持完整；追加在归档锁内进行，同时运行的多个进程依次写入 /
+Every page ends with a fixed tail; appending copies the existing content verbatim and inserts the new content
+before the tail, never regenerating what is there; pages are written to a temporary file that then replaces the
+original, so an interrupted write leaves the original intact; appends happen under an archive lock, so processes
+running at the same time write one after another
+"""
+
+import json
+import os
+import re
+import stat
+import tempfile
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, IO, Iterable, Iterator, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows 上没有 fcntl，只在进程内加锁 / No fcntl on Windows, lock within the process only
+    fcntl = None
+
+from paper_store import parse_arxiv_id
+from report_generator import HTML_STYLE, ReportGenerator, escape_html
+
+_PAGE_HEAD = """<!DOCTYPE html>
+<html lang="zh-CN">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title}</title>
+    <style>
+{style}        .runs li {{
+            margin-bottom: 8px;
+        }}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>{heading}</h1>
+            <p>{subtitle}</p>
+        </div>
+""".format
+
+_PAGE_TAIL = """
+        <div class="footer">
+            <p>🤖 由 arXiv 论文推送系统自动生成</p>
+        </div>
+    </div>
+</body>
+</html>
+"""
+
+_INDEX_HEAD = """
+        <ul class="runs">
+"""
+
+_INDEX_TAIL = """        </ul>
+""" + _PAGE_TAIL
+
+_INDEX_ENTRY = """            <li><a href="{href}">{date} {time}</a> {name}🔍 {keywords} | 📊 {count} 篇</li>
+""".format
+
+_RUN_HEAD = """
+        <div class="keywords" id="{run_id}">
+            <strong>🕘 {time} {name}</strong> 🔍 搜索关键词: {keywords} | 📊 {count} 篇
+        </div>
+
+        <div class="papers">
+""".format
+
+_RUN_TAIL = """        </div>
+"""
+
+_PAPER_PREFIX = """
+            <div class="paper" id="{anchor}">
+                <div class="paper-title">
+                    {index}""".format
+
+# 清单每行是一次运行的JSON记录，每次运行只追加一行 / Each manifest line is one run's JSON record; a run appends one line
+MANIFEST_NAME = "manifest.jsonl"
+# 旧版本的清单是一个JSON数组，打开归档时转换 / Older manifests were one JSON array, converted when the archive opens
+_LEGACY_MANIFEST_NAME = "manifest.json"
+
+# 同一进程内的线程共用的归档锁；跨进程由归档目录中的锁文件保证 /
+# Archive lock shared by threads of one process; the lock file in the archive directory covers other processes
+_THREAD_LOCK = threading.Lock()
+
+# 归档页面中已有的锚点 / Anchors already present in an archive page
+_ANCHOR_PATTERN = re.compile(r' id="([^"]+)"')
+
+# 复制已有页面内容时每次读取的字节数 / Bytes read at a time when copying existing page content
+_COPY_CHUNK_SIZE = 1024 * 1024
+
+_SEARCH_PAGE = """<!DOCTYPE html>
+<html lang="zh-CN">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>arXiv 论文归档搜索</title>
+    <style>
+{style}        #query {{
+            width: 100%;
+            padding: 10px;
+            font-size: 1.1em;
+            box-sizing: border-box;
+        }}
+        .result {{
+            padding: 8px 0;
+            border-bottom: 1px solid #eee;
+        }}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>🔎 arXiv 论文归档搜索</h1>
+            <p><a href="index.html">返回归档索引</a></p>
+        </div>
+        <input id="query" type="search" placeholder="按标题、arXiv编号或关键词过滤" autofocus>
+        <p id="status">正在加载清单...</p>
+        <div id="results"></div>
+    </div>
+    <script>
+        // 需要通过HTTP访问归档目录，浏览器不允许 file:// 页面读取清单
+        const results = document.getElementById("results");
+        const status = document.getElementById("status");
+        let rows = [];
+
+        function render(query) {{
+            const terms = query.toLowerCase().split(/\\s+/).filter(Boolean);
+            const matched = rows.filter(row => terms.every(term => row.text.includes(term)));
+            status.textContent = `共 ${{matched.length}} 条结果`;
+            results.replaceChildren(...matched.slice(0, 500).map(row => {{
+                const item = document.createElement("div");
+                item.className = "result";
+                const link = document.createElement("a");
+                link.href = row.href;
+                link.textContent = row.title;
+                item.append(link, ` — ${{row.id}} | ${{row.date}} | ${{row.keywords}}`);
+                return item;
+            }}));
+        }}
+
+        fetch("manifest.jsonl").then(response => response.text()).then(text => {{
+            for (const line of text.split("\\n")) {{
+                let run;
+                try {{
+                    run = JSON.parse(line);
+                }} catch (error) {{
+                    continue;  // 跳过空行和中断写入留下的半行
+                }}
+                const keywords = run.keywords.join(", ");
+                run.papers.forEach(([id, title], i) => rows.push({{
+                    id, title, keywords, date: run.date,
+                    href: `${{run.page}}#${{run.run}}-${{i + 1}}`,
+                    text: `${{id}} ${{title}} ${{keywords}} ${{run.name}}`.toLowerCase()
+                }}));
+            }}
+            rows.reverse();
+            render("");
+        }}).catch(error => {{ status.textContent = `无法加载清单: ${{error}}`; }});
+
+        document.getElementById("query").addEventListener("input", event => render(event.target.value));
+    </script>
+</body>
+</html>
+""".format
+
+
+def _paper_id(paper: Dict) -> str:
+    arxiv_id, version = parse_arxiv_id(paper['url'])
+    return f"{arxiv_id}v{version}"
+
+
+@contextmanager
+def _replace_atomically(path: str) -> Iterator[IO[bytes]]:
+    """
+    写入同目录下唯一命名的临时文件，成功后替换原文件；出错时删除临时文件，原文件保持完整 /
+    Write a uniquely named temporary file in the same directory and replace the original on success; on error the
+    temporary file is removed and the original stays intact
+    """
+    directory = os.path.dirname(path) or "."
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        # mkstemp 创建的文件只有属主可读，沿用原文件的权限，静态服务器仍可读取 /
+        # mkstemp files are owner-only; keep the original's permissions so static servers can still read them
+        mode = stat.S_IMODE(os.stat(path).st_mode) if os.path.exists(path) else 0o644
+        os.chmod(temp_path, mode)
+        with os.fdopen(fd, 'wb') as out:
+            yield out
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def append_before_tail(path: str, head: str, pieces: Iterable[str], tail: str):
+    """
+    把内容插入文件固定结尾之前；文件不存在时先写入开头 /
+    Insert content just before a file's fixed tail, writing the head first if the file does not exist
+
+    已有内容原样复制到临时文件，写完新内容和结尾后再替换原文件，写入中断时原文件保持完整；
+    结尾与预期不一致时新内容接在文件末尾，页面仍可显示。多个进程同时写入同一文件时调用方需持有归档锁 /
+    Existing content is copied verbatim to a temporary file that replaces the original once the new content and
+    tail are written, so an interrupted write leaves the original intact; if the tail is not the expected one the
+    new content follows the end of the file and the page still renders. Callers hold the archive lock when several
+    processes may write the same file
+
+    Args:
+        path: 文件路径 / File path
+        head: 新文件的开头 / Head of a new file
+        pieces: 依次写入的内容片段 / Content pieces written in order
+        tail: 固定结尾 / Fixed tail
+    """
+    tail_bytes = tail.encode('utf-8')
+    with _replace_atomically(path) as out:
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                size = f.seek(0, os.SEEK_END)
+                f.seek(max(0, size - len(tail_bytes)))
+                remaining = size - len(tail_bytes) if f.read() == tail_bytes else size
+                f.seek(0)
+                while remaining > 0:
+                    chunk = f.read(min(remaining, _COPY_CHUNK_SIZE))
+                    if not chunk:
+                        break
+                    out.write(chunk)
+                    remaining -= len(chunk)
+        else:
+            out.write(head.encode('utf-8'))
+        for piece in pieces:
+            out.write(piece.encode('utf-8'))
+        out.write(tail_bytes)
+
+
+def append_manifest(path: str, entry: Dict):
+    """
+    在清单末尾追加一行运行记录，不重写已有内容 / Append one run record to the manifest without rewriting it
+
+    上次写入中断留下的半行会被补上换行，新记录总是从新的一行开始 /
+    A half line left by an interrupted write is terminated, so the new record always starts on a line of its own
+
+    Args:
+        path: 清单路径 / Manifest path
+        entry: 运行记录 / Run record
+    """
+    line = json.dumps(entry, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b"\n"
+    with open(path, 'a+b') as f:
+        if f.seek(0, os.SEEK_END) > 0:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                line = b"\n" + line
+        f.write(line)
+
+
+def load_manifest(path: str) -> List[Dict]:
+    """
+    读取搜索清单，跳过无法解析的行（如中断写入留下的半行）/
+    Read the search manifest, skipping lines that do not parse (such as a half line left by an interrupted write)
+
+    每条记录单独占一行，也能读取旧版本JSON数组格式的清单 /
+    Every record sits on its own line, so manifests in the older JSON array format can be read as well
+
+    Args:
+        path: 清单路径 / Manifest path
+
+    Returns:
+        运行记录列表，文件不存在时为空 / Run entries, empty if the file does not exist
+    """
+    if not os.path.exists(path):
+        return []
+    decoder = json.JSONDecoder()
+    runs = []
+    skipped = 0
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        for line in f:
+            start = line.find("{")
+            if start < 0:
+                continue
+            try:
+                run, _ = decoder.raw_decode(line, start)
+            except ValueError:
+                skipped += 1
+                continue
+            if isinstance(run, dict):
+                runs.append(run)
+    if skipped:
+        print(f"⚠️  搜索清单中有 {skipped} 行无法解析，已跳过")
+    return runs
+
+
+def _unique_run_id(page_path: str, base: str, suffix: str) -> str:
+    # 同一秒内的多次运行用序号区分；序号用下划线连接，不会与论文锚点的 "-序号" 冲突 /
+    # Runs within the same second get a counter; it is joined by an underscore so it never clashes with the
+    # "-index" paper anchors
+    taken = set()
+    if os.path.exists(page_path):
+        with open(page_path, 'r', encoding='utf-8', errors='replace') as f:
+            taken.update(_ANCHOR_PATTERN.findall(f.read()))
+    run_id, counter = f"{base}{suffix}", 2
+    while run_id in taken:
+        run_id, counter = f"{base}_{counter}{suffix}", counter + 1
+    return run_id
+
+
+class ReportArchive:
+    """
+    报告归档 / Report archive
+    论文片段由 ReportGenerator 渲染，因此与普通报告共用片段缓存 /
+    Paper fragments are rendered by ReportGenerator, so the archive shares the fragment cache with regular reports
+    """
+
+    def __init__(self, root: str = "reports/archive", reporter: Optional[ReportGenerator] = None):
+        """
+        初始化归档 / Initialize the archive
+
+        Args:
+            root: 归档目录 / Archive directory
+            reporter: 渲染论文片段的报告生成器 / Report generator that renders paper fragments
+        """
+        self.root = root
+        self.reporter = reporter or ReportGenerator(output_dir=root)
+        os.makedirs(root, exist_ok=True)
+        with self._locked():
+            self._convert_legacy_manifest()
+            self._write_search_page()
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """
+        持有归档锁：线程锁加归档目录中的文件锁，定时任务和命令行同时归档时依次写入 /
+        Hold the archive lock: a thread lock plus a file lock in the archive directory, so a scheduled run and a CLI
+        run archiving at the same time write one after another
+        """
+        with _THREAD_LOCK, open(os.path.join(self.root, ".lock"), 'a') as f:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _convert_legacy_manifest(self):
+        # 旧版本的JSON数组清单转换为每行一条记录，只在升级后第一次打开时执行 /
+        # Convert an older JSON array manifest to one record per line, only on the first open after upgrading
+        legacy_path = os.path.join(self.root, _LEGACY_MANIFEST_NAME)
+        manifest_path = os.path.join(self.root, MANIFEST_NAME)
+        if not os.path.exists(legacy_path) or os.path.exists(manifest_path):
+            return
+        with _replace_atomically(manifest_path) as out:
+            for run in load_manifest(legacy_path):
+                out.write(json.dumps(run, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b"\n")
+        os.remove(legacy_path)
+
+    def _write_search_page(self):
+        # 搜索页是静态的，只在内容变化时重写 / The search page is static and only rewritten when it changes
+        path = os.path.join(self.root, "search.html")
+        content = _SEARCH_PAGE(style=HTML_STYLE)
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                if f.read() == content:
+                    return
+        with _replace_atomically(path) as out:
+            out.write(content.encode('utf-8'))
+
+    def add_run(self, papers: List[Dict], keywords: List[str], name: str = None,
+                now: datetime = None) -> str:
+        """
+        将一次运行的论文追加到当天的归档页面，并更新索引页和搜索清单 /
+        Append one run's papers to the day's archive page and update the index page and search manifest
+
+        Args:
+            papers: 已生成总结的论文列表 / Papers with summaries
+            keywords: 搜索关键词 / Search keywords
+            name: 配置名称（批量推送时）/ Profile name (batch runs)
+            now: 运行时间，默认为当前时间 / Run time, now by default
+
+        Returns:
+            当天归档页面的路径 / Path of the day's archive page
+        """
+        with self._locked():
+            return self._add_run(papers, keywords, name, now or datetime.now())
+
+    def _add_run(self, papers: List[Dict], keywords: List[str], name: Optional[str], now: datetime) -> str:
+        date = now.strftime('%Y-%m-%d')
+        page = f"days/{now.strftime('%Y-%m')}/{date}.html"
+        page_path = os.path.join(self.root, *page.split("/"))
+        os.makedirs(os.path.dirname(page_path), exist_ok=True)
+        run_id = _unique_run_id(page_path, f"run-{now.strftime('%H%M%S')}",
+                                f"-{re.sub(r'[^A-Za-z0-9_-]+', '-', name)}" if name else "")
+
+        label = f"{escape_html(name)} " if name else ""
+        joined_keywords = escape_html(', '.join(keywords))
+
+        def run_pieces():
+            yield _RUN_HEAD(run_id=run_id, time=now.strftime('%H:%M'), name=label, keywords=joined_keywords,
+                            count=len(papers))
+            for index, fragment in enumerate(self.reporter.paper_fragments(papers, "html"), 1):
+                yield _PAPER_PREFIX(anchor=f"{run_id}-{index}", index=index)
+                yield fragment
+            yield _RUN_TAIL
+
+        append_before_tail(
+            page_path,
+            _PAGE_HEAD(title=f"arXiv 论文归档 - {date}", style=HTML_STYLE, heading="📚 arXiv 论文归档",
+                       subtitle=f"日期: {now.strftime('%Y年%m月%d日')} | <a href=\"../../index.html\">归档索引</a>"),
+            run_pieces(),
+            _PAGE_TAIL
+        )
+
+        append_before_tail(
+            os.path.join(self.root, "index.html"),
+            _PAGE_HEAD(title="arXiv 论文归档", style=HTML_STYLE, heading="📚 arXiv 论文归档",
+                       subtitle="每次推送一行，按时间顺序排列 | <a href=\"search.html\">搜索归档</a>") + _INDEX_HEAD,
+            [_INDEX_ENTRY(href=f"{page}#{run_id}", date=date, time=now.strftime('%H:%M'), name=label,
+                          keywords=joined_keywords, count=len(papers))],
+            _INDEX_TAIL
+        )
+
+        entry = {
+            'date': date,
+            'time': now.strftime('%H:%M'),
+            'name': name or "",
+            'keywords': list(keywords),
+            'page': page,
+            'run': run_id,
+            # 每篇论文只记录 [arXiv编号+版本, 标题]，锚点由顺序得出 / Only [id+version, title]; anchors follow from the order
+            'papers': [[_paper_id(paper), paper['title']] for paper in papers]
+        }
+        append_manifest(os.path.join(self.root, MANIFEST_NAME), entry)
+        return page_path
@@ -1,88 +1,95 @@
-from typing import List, Dict
-from datetime import datetime
+from typing import List, Dict, Iterable, Iterator, TextIO, Tuple
+from contextlib import ExitStack
+from datetime import datetime, timezone
+from itertools import islice
+from urllib.parse import quote
+import gzip
+import hashlib
+import html
+import io
+import json
 import os
+import config
 
-class ReportGenerator:
-    def __init__(self, output_dir: str = "reports"):
-        self.output_dir = output_dir
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
-    
-    def generate_html_report(self, papers: List[Dict], keywords: List[str]) -> str:
-        """生成HTML格式的报告"""
-        
-        html_content = f"""
-<!DOCTYPE html>
-<html lang="zh-CN">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>arXiv 论文日报 - {datetime.now().strftime('%Y-%m-%d')}</title>
-    <style>
-        body {{
+try:
+    import brotli
+except ImportError:  # 未安装 brotli 时只能生成 gzip 副本
+    brotli = None
+from fragment_cache import FragmentCache
+from paper_store import parse_arxiv_id
+
+# 双语总结在报告中的标题
+SUMMARY_LABELS = {
+    "chinese": "中文总结",
+    "english": "English Summary"
+}
+
+# 报告页面样式，归档页面也使用同一份样式
+HTML_STYLE = """\
+        body {
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             line-height: 1.6;
             margin: 0;
             padding: 20px;
             background-color: #f5f5f5;
-        }}
-        .container {{
+        }
+        .container {
             max-width: 1200px;
             margin: 0 auto;
             background-color: white;
             padding: 30px;
             border-radius: 10px;
             box-shadow: 0 0 20px rgba(0,0,0,0.1);
-        }}
-        .header {{
+        }
+        .header {
             text-align: center;
             margin-bottom: 30px;
             border-bottom: 3px solid #4CAF50;
             padding-bottom: 20px;
-        }}
-        .header h1 {{
+        }
+        .header h1 {
             color: #333;
             margin-bottom: 10px;
-        }}
-        .keywords {{
+        }
+        .keywords {
             background-color: #e8f5e8;
             padding: 15px;
             border-radius: 5px;
             margin-bottom: 30px;
-        }}
-        .paper {{
+        }
+        .paper {
             margin-bottom: 30px;
             padding: 20px;
             border: 1px solid #ddd;
             border-radius: 8px;
             background-color: #fafafa;
-        }}
-        .paper-title {{
+        }
+        .paper-title {
             font-size: 1.3em;
             font-weight: bold;
             color: #2c3e50;
             margin-bottom: 10px;
-        }}
-        .paper-authors {{
+        }
+        .paper-authors {
             color: #7f8c8d;
             margin-bottom: 10px;
             font-style: italic;
-        }}
-        .paper-info {{
+        }
+        .paper-info {
             margin-bottom: 15px;
             font-size: 0.9em;
             color: #666;
-        }}
-        .paper-summary {{
+        }
+        .paper-summary {
             background-color: white;
             padding: 15px;
             border-left: 4px solid #4CAF50;
             margin: 15px 0;
-        }}
-        .paper-links {{
+        }
+        .paper-links {
             margin-top: 15px;
-        }}
-        .paper-links a {{
+        }
+        .paper-links a {
             display: inline-block;
             margin-right: 15px;
             padding: 8px 15px;
@@ -91,140 +98,651 @@ class ReportGenerator:
             text-decoration: none;
             border-radius: 4px;
             font-size: 0.9em;
-        }}
-        .paper-links a:hover {{
+        }
+        .paper-links a:hover {
             background-color: #45a049;
-        }}
-        .footer {{
+        }
+        .footer {
             text-align: center;
             margin-top: 40px;
             padding-top: 20px;
             border-top: 1px solid #ddd;
             color: #666;
-        }}
-    </style>
+        }
+"""
+
+# 报告模板在导入时编译一次：每个模板预先绑定 str.format，渲染时只填入已转义的字段
+_HTML_HEAD = """
+<!DOCTYPE html>
+<html lang="zh-CN">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>arXiv 论文日报 - {date}</title>
+    <style>
+{style}    </style>
 </head>
 <body>
     <div class="container">
         <div class="header">
             <h1>📚 arXiv 论文日报</h1>
-            <p>日期: {datetime.now().strftime('%Y年%m月%d日')}</p>
+            <p>日期: {long_date}</p>
         </div>
         
         <div class="keywords">
-            <strong>🔍 搜索关键词:</strong> {', '.join(keywords)}
+            <strong>🔍 搜索关键词:</strong> {keywords}
         </div>
         
         <div class="papers">
-"""
-        
-        for i, paper in enumerate(papers, 1):
-            html_content += f"""
+""".format
+
+# 片段不含序号，同一篇论文在不同报告中的片段可以复用
+_HTML_PAPER_PREFIX = """
             <div class="paper">
                 <div class="paper-title">
-                    {i}. {paper['title']}
+                    """
+
+_HTML_PAPER = """. {title}
                 </div>
                 <div class="paper-authors">
-                    👥 作者: {', '.join(paper['authors'][:3])}{'等' if len(paper['authors']) > 3 else ''}
+                    👥 作者: {authors}
                 </div>
                 <div class="paper-info">
-                    📅 发布日期: {paper['published']} | 🏷️ 分类: {', '.join(paper['categories'])}
-                </div>
-                <div class="paper-summary">
-                    <strong>📝 总结:</strong><br>
-                    {paper.get('summary', '暂无总结')}
+                    📅 发布日期: {published} | 🏷️ 分类: {categories}
                 </div>
+                {summaries}
                 <div class="paper-links">
-                    <a href="{paper['url']}" target="_blank">📄 查看论文</a>
-                    <a href="{paper['pdf_url']}" target="_blank">📥 下载PDF</a>
+                    <a href="{url}" target="_blank">📄 查看论文</a>
+                    <a href="{pdf_url}" target="_blank">📥 下载PDF</a>
                 </div>
             </div>
-"""
-        
-        html_content += f"""
+""".format
+
+_HTML_SUMMARY = """<div class="paper-summary">
+                    <strong>📝 {label}:</strong><br>
+                    {summary}
+                </div>""".format
+
+_HTML_TAIL = """
         </div>
         
         <div class="footer">
-            <p>📊 共找到 {len(papers)} 篇相关论文</p>
+            <p>📊 共找到 {count} 篇相关论文</p>
             <p>🤖 由 arXiv 论文推送系统自动生成</p>
         </div>
     </div>
 </body>
 </html>
-"""
-        
-        return html_content
-    
-    def generate_markdown_report(self, papers: List[Dict], keywords: List[str]) -> str:
-        """生成Markdown格式的报告"""
-        
-        md_content = f"""# 📚 arXiv 论文日报
+""".format
+
+_MARKDOWN_HEAD = """# 📚 arXiv 论文日报
 
-**日期:** {datetime.now().strftime('%Y年%m月%d日')}  
-**搜索关键词:** {', '.join(keywords)}  
-**论文数量:** {len(papers)}
+**日期:** {long_date}  
+**搜索关键词:** {keywords}  
+**论文数量:** {count}
 
 ---
 
-"""
-        
-        for i, paper in enumerate(papers, 1):
-            authors_str = ', '.join(paper['authors'][:3])
-            if len(paper['authors']) > 3:
-                authors_str += '等'
-            
-            md_content += f"""## {i}. {paper['title']}
+""".format
+
+_MARKDOWN_PAPER_PREFIX = "## "
+
+_MARKDOWN_PAPER = """. {title}
 
-**👥 作者:** {authors_str}  
-**📅 发布日期:** {paper['published']}  
-**🏷️ 分类:** {', '.join(paper['categories'])}
+**👥 作者:** {authors}  
+**📅 发布日期:** {published}  
+**🏷️ 分类:** {categories}
 
-**📝 总结:**  
-{paper.get('summary', '暂无总结')}
+{summaries}
 
 **🔗 链接:**  
-- [查看论文]({paper['url']})  
-- [下载PDF]({paper['pdf_url']})
+- [查看论文]({url})  
+- [下载PDF]({pdf_url})
 
 ---
 
-"""
+""".format
+
+_MARKDOWN_SUMMARY = "**📝 {label}:**  \n{summary}".format
+
+_ATOM_HEAD = """<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>arXiv 论文日报 - {keywords}</title>
+  <id>{feed_id}</id>
+  <updated>{updated}</updated>
+  <author><name>arXiv 论文推送系统</name></author>
+""".format
+
+_ATOM_ENTRY = """  <entry>
+    <title>{title}</title>
+    <id>{url}</id>
+    <link href="{url}"/>
+    <link rel="related" type="application/pdf" href="{pdf_url}"/>
+    <updated>{updated}</updated>
+{authors}{categories}    <summary type="text">{summary}</summary>
+  </entry>
+""".format
+
+_ATOM_AUTHOR = "    <author><name>{name}</name></author>\n".format
+
+_ATOM_CATEGORY = "    <category term=\"{term}\"/>\n".format
+
+_ATOM_TAIL = "</feed>\n"
+
+# 各格式报告文件的扩展名
+REPORT_EXTENSIONS = {
+    "html": "html",
+    "markdown": "md",
+    "jsonl": "jsonl",
+    "atom": "xml"
+}
+
+# 带序号的格式在每篇论文片段前写入的前缀
+_PAPER_PREFIXES = {
+    "html": _HTML_PAPER_PREFIX,
+    "markdown": _MARKDOWN_PAPER_PREFIX
+}
+
+# 片段缓存键中的模板，修改模板后旧片段自动失效
+_FRAGMENT_TEMPLATES = {
+    "html": _HTML_PAPER.__self__ + _HTML_SUMMARY.__self__,
+    "markdown": _MARKDOWN_PAPER.__self__ + _MARKDOWN_SUMMARY.__self__
+}
+
+# 每次从片段缓存批量读取的论文数
+FRAGMENT_CHUNK_SIZE = 256
+
+# Markdown中需要转义的字符，链接地址中只需转义括号和空格
+_MARKDOWN_ESCAPES = str.maketrans({c: "\\" + c for c in "\\`*_[]<>#|"})
+_MARKDOWN_URL_ESCAPES = str.maketrans({"(": "%28", ")": "%29", " ": "%20"})
+
+
+# 预压缩副本的压缩级别：报告只写一次、会被多次下载，取较高的级别
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 9
+
+# 预压缩副本的扩展名
+PRECOMPRESS_EXTENSIONS = {
+    "gzip": "gz",
+    "br": "br"
+}
+
+
+class _BrotliFile:
+    """逐块写入的 brotli 压缩文件"""
+    
+    def __init__(self, path: str):
+        self.file = open(path, 'wb')
+        self.compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+    
+    def write(self, data: bytes):
+        self.file.write(self.compressor.process(data))
+    
+    def close(self):
+        self.file.write(self.compressor.finish())
+        self.file.close()
+
+
+class _ReportFile:
+    """报告文件及其预压缩副本：写入的文本只编码一次，同时写入所有文件，不需要在写完后再读一遍"""
+    
+    def __init__(self, path: str, precompress: Iterable[str] = ()):
+        self.files = []
+        try:
+            self.files.append(open(path, 'wb'))
+            for encoding in precompress:
+                sibling = f"{path}.{PRECOMPRESS_EXTENSIONS[encoding]}"
+                if encoding == "gzip":
+                    # mtime=0 使相同内容的压缩结果完全一致
+                    self.files.append(gzip.GzipFile(sibling, 'wb', compresslevel=GZIP_LEVEL, mtime=0))
+                else:
+                    self.files.append(_BrotliFile(sibling))
+        except Exception:
+            self.close()
+            raise
+    
+    def write(self, text: str):
+        data = text.encode('utf-8')
+        for f in self.files:
+            f.write(data)
+    
+    def close(self):
+        for f in self.files:
+            f.close()
+    
+    def __enter__(self) -> '_ReportFile':
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+# 转义HTML文本和属性值（包括引号），直接使用 html.escape 避免多一层函数调用
+escape_html = html.escape
+
+
+def escape_markdown(value) -> str:
+    """转义Markdown文本中的格式字符"""
+    return str(value).translate(_MARKDOWN_ESCAPES)
+
+
+def escape_markdown_url(value) -> str:
+    """转义Markdown链接地址"""
+    return str(value).strip().translate(_MARKDOWN_URL_ESCAPES)
+
+
+class ReportGenerator:
+    def __init__(self, output_dir: str = "reports", summary_languages: List[str] = None,
+                 fragment_cache: FragmentCache = None, precompress: Iterable[str] = (),
+                 skip_unchanged: bool = False):
+        self.output_dir = output_dir
+        # 论文有双语总结时显示的语言，可以只显示其中一种
+        self.summary_languages = summary_languages or config.REPORT_SUMMARY_LANGUAGES
+        # 渲染好的单篇论文片段缓存，为空时每篇都重新渲染
+        self.fragment_cache = fragment_cache
+        # 最近一次渲染报告的片段缓存统计
+        self.last_render_stats = {}
+        # 保存报告时同时生成的预压缩副本（gzip、br），供静态服务器直接返回
+        self.precompress = []
+        for encoding in precompress:
+            if encoding not in PRECOMPRESS_EXTENSIONS:
+                raise ValueError(f"未知的预压缩格式: {encoding}（可选: {', '.join(PRECOMPRESS_EXTENSIONS)}）")
+            if encoding == "br" and brotli is None:
+                print("⚠️  未安装 brotli，跳过 .br 预压缩副本")
+                continue
+            self.precompress.append(encoding)
+        # 内容与同一配置上一份报告相同时不再写入，直接返回上一份的路径
+        self.skip_unchanged = skip_unchanged
+        # 最近一次保存时因内容未变而跳过的格式
+        self.last_skipped = []
+        if not os.path.exists(output_dir):
+            os.makedirs(output_dir)
+    
+    @classmethod
+    def from_config(cls, output_dir: str = "reports") -> 'ReportGenerator':
+        """根据config.py中的配置创建报告生成器"""
+        fragment_cache = None
+        if config.REPORT_FRAGMENT_CACHE_PATH or config.REPORT_FRAGMENT_CACHE_MEMORY_BYTES:
+            fragment_cache = FragmentCache(
+                config.REPORT_FRAGMENT_CACHE_PATH,
+                max_bytes=config.REPORT_FRAGMENT_CACHE_MAX_BYTES,
+                memory_bytes=config.REPORT_FRAGMENT_CACHE_MEMORY_BYTES
+            )
+        return cls(output_dir, fragment_cache=fragment_cache, precompress=config.REPORT_PRECOMPRESS,
+                   skip_unchanged=config.REPORT_SKIP_UNCHANGED)
+    
+    def summary_sections(self, paper: Dict) -> List[Tuple[str, str]]:
+        """返回要显示的 (标题, 总结) 列表；没有双语总结时只显示 summary"""
+        summaries = paper.get('summaries') or {}
+        sections = [
+            (SUMMARY_LABELS.get(language, language), summaries[language])
+            for language in self.summary_languages if language in summaries
+        ]
+        return sections or [("总结", paper.get('summary', '暂无总结'))]
+    
+    def _authors(self, paper: Dict) -> str:
+        authors = paper['authors']
+        return ', '.join(authors[:3]) + ('等' if len(authors) > 3 else '')
+    
+    def _format_key(self, format: str) -> str:
+        format = format.lower()
+        if format == "md":
+            return "markdown"
+        if format not in REPORT_EXTENSIONS:
+            raise ValueError(f"未知的报告格式: {format}（可选: {', '.join(REPORT_EXTENSIONS)}）")
+        return format
+    
+    def render_paper(self, paper: Dict, format: str, sections: List[Tuple[str, str]] = None) -> str:
+        """渲染一篇论文的片段（不含序号），format 为 html 或 markdown"""
+        sections = sections or self.summary_sections(paper)
+        if format == "html":
+            return _HTML_PAPER(
+                title=escape_html(paper['title']),
+                authors=escape_html(self._authors(paper)),
+                published=escape_html(paper['published']),
+                categories=escape_html(', '.join(paper['categories'])),
+                summaries="".join(
+                    _HTML_SUMMARY(label=escape_html(label), summary=escape_html(summary))
+                    for label, summary in sections
+                ),
+                url=escape_html(paper['url']),
+                pdf_url=escape_html(paper['pdf_url'])
+            )
+        return _MARKDOWN_PAPER(
+            title=escape_markdown(paper['title']),
+            authors=escape_markdown(self._authors(paper)),
+            published=escape_markdown(paper['published']),
+            categories=escape_markdown(', '.join(paper['categories'])),
+            summaries="\n\n".join(
+                _MARKDOWN_SUMMARY(label=label, summary=escape_markdown(summary))
+                for label, summary in sections
+            ),
+            url=escape_markdown_url(paper['url']),
+            pdf_url=escape_markdown_url(paper['pdf_url'])
+        )
+    
+    def render_json(self, paper: Dict) -> str:
+        """将一篇论文渲染为一行JSON（含 arXiv 编号和全部字段）"""
+        arxiv_id, version = parse_arxiv_id(paper['url'])
+        record = {'id': f"{arxiv_id}v{version}"}
+        record.update(paper)
+        return json.dumps(record, ensure_ascii=False) + "\n"
+    
+    def render_atom_entry(self, paper: Dict) -> str:
+        """将一篇论文渲染为 Atom 条目"""
+        submitted = paper.get('submitted')
+        return _ATOM_ENTRY(
+            title=escape_html(paper['title']),
+            url=escape_html(paper['url']),
+            pdf_url=escape_html(paper['pdf_url']),
+            # arXiv 的时间均为UTC
+            updated=f"{submitted}Z" if submitted else f"{paper['published']}T00:00:00Z",
+            authors="".join(_ATOM_AUTHOR(name=escape_html(author)) for author in paper['authors']),
+            categories="".join(_ATOM_CATEGORY(term=escape_html(category)) for category in paper['categories']),
+            summary=escape_html("\n\n".join(f"{label}: {summary}" for label, summary in self.summary_sections(paper)))
+        )
+    
+    def _chunks(self, papers: Iterable[Dict]) -> Iterator[List[Dict]]:
+        papers = iter(papers)
+        while True:
+            chunk = list(islice(papers, FRAGMENT_CHUNK_SIZE))
+            if not chunk:
+                return
+            yield chunk
+    
+    def _chunk_fragments(self, chunk: List[Dict], format: str, stats: Dict) -> List[str]:
+        """渲染一块论文的片段；HTML和Markdown片段先查片段缓存，每块只读写一次缓存"""
+        if format == "jsonl":
+            return [self.render_json(paper) for paper in chunk]
+        if format == "atom":
+            return [self.render_atom_entry(paper) for paper in chunk]
+        if self.fragment_cache is None:
+            return [self.render_paper(paper, format) for paper in chunk]
         
-        return md_content
+        sections = [self.summary_sections(paper) for paper in chunk]
+        keys = [
+            self.fragment_cache.make_key(paper['url'], format, self.summary_languages, paper_sections,
+                                         _FRAGMENT_TEMPLATES[format])
+            for paper, paper_sections in zip(chunk, sections)
+        ]
+        cached = self.fragment_cache.get_many(keys)
+        rendered = {}
+        fragments = []
+        for paper, paper_sections, key in zip(chunk, sections, keys):
+            fragment = cached.get(key) or rendered.get(key)
+            if fragment is None:
+                fragment = rendered[key] = self.render_paper(paper, format, paper_sections)
+            fragments.append(fragment)
+        stats['fragment_hits'] += len(chunk) - len(rendered)
+        stats['fragment_misses'] += len(rendered)
+        if rendered:
+            self.fragment_cache.set_many(rendered)
+        return fragments
+    
+    def _finish_render(self, count: int, stats: Dict):
+        """记录本次渲染的片段缓存统计"""
+        self.last_render_stats = {'papers': count}
+        if self.fragment_cache is not None:
+            self.fragment_cache.flush()
+            lookups = stats['fragment_hits'] + stats['fragment_misses']
+            self.last_render_stats.update(stats)
+            self.last_render_stats['fragment_hit_rate'] = stats['fragment_hits'] / lookups if lookups else 0.0
     
-    def save_report(self, papers: List[Dict], keywords: List[str], format: str = "html") -> str:
-        """保存报告到文件"""
+    def paper_fragments(self, papers: Iterable[Dict], format: str) -> Iterator[str]:
+        """
+        按顺序逐篇产出论文片段，命中片段缓存的直接复用
         
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        论文按 FRAGMENT_CHUNK_SIZE 分块，每块只读写一次缓存；渲染结束后 last_render_stats 记录本次的命中情况
+        """
+        format = self._format_key(format)
+        count = 0
+        stats = {'fragment_hits': 0, 'fragment_misses': 0}
+        for chunk in self._chunks(papers):
+            count += len(chunk)
+            yield from self._chunk_fragments(chunk, format, stats)
+        self._finish_render(count, stats)
+    
+    def _render_head(self, format: str, keywords: List[str], count: int, now: datetime) -> str:
+        if format == "html":
+            return _HTML_HEAD(
+                date=now.strftime('%Y-%m-%d'),
+                long_date=now.strftime('%Y年%m月%d日'),
+                keywords=escape_html(', '.join(keywords)),
+                style=HTML_STYLE
+            )
+        if format == "markdown":
+            return _MARKDOWN_HEAD(
+                long_date=now.strftime('%Y年%m月%d日'),
+                keywords=escape_markdown(', '.join(keywords)),
+                count=count
+            )
+        if format == "atom":
+            return _ATOM_HEAD(
+                keywords=escape_html(', '.join(keywords)),
+                feed_id=escape_html("urn:arxiv-paper-push:" + quote(",".join(keywords).lower())),
+                updated=now.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+            )
+        return ""
+    
+    def _render_tail(self, format: str, count: int) -> str:
+        if format == "html":
+            return _HTML_TAIL(count=count)
+        if format == "atom":
+            return _ATOM_TAIL
+        return ""
+    
+    def render_many(self, papers: Iterable[Dict], keywords: List[str], outputs: Dict[str, TextIO],
+                    count: int = None) -> int:
+        """
+        只遍历一次论文，同时将报告逐篇写入多个输出
         
-        if format.lower() == "html":
-            content = self.generate_html_report(papers, keywords)
-            filename = f"arxiv_report_{timestamp}.html"
-        else:
-            content = self.generate_markdown_report(papers, keywords)
-            filename = f"arxiv_report_{timestamp}.md"
+        论文按块读取，每块依次渲染为各格式的片段并写入对应输出，增加输出格式不会增加对论文的遍历
+        
+        Args:
+            papers: 论文列表，也可以是逐篇产出论文的迭代器
+            keywords: 搜索关键词
+            outputs: {格式: 输出}，格式为 html、markdown、jsonl 或 atom；输出是任何有 write(str) 方法的对象，
+                     如文件、io.StringIO 或 socket.makefile('w')
+            count: 论文总数；papers 为迭代器时HTML页脚使用实际写入的篇数
+            
+        Returns:
+            写入的论文数
+        """
+        outputs = {self._format_key(format): out for format, out in outputs.items()}
+        if count is None and "markdown" in outputs:
+            # Markdown标题中需要论文数量，迭代器只能先取成列表
+            papers = papers if isinstance(papers, (list, tuple)) else list(papers)
+            count = len(papers)
+        
+        now = datetime.now()
+        for format, out in outputs.items():
+            out.write(self._render_head(format, keywords, count, now))
+        
+        written = 0
+        stats = {'fragment_hits': 0, 'fragment_misses': 0}
+        for chunk in self._chunks(papers):
+            for format, out in outputs.items():
+                write = out.write
+                prefix = _PAPER_PREFIXES.get(format)
+                for index, fragment in enumerate(self._chunk_fragments(chunk, format, stats), written + 1):
+                    write(f"{prefix}{index}{fragment}" if prefix else fragment)
+            written += len(chunk)
+        self._finish_render(written, stats)
+        
+        for format, out in outputs.items():
+            out.write(self._render_tail(format, written if count is None else count))
+        return written
+    
+    def render_html(self, papers: Iterable[Dict], keywords: List[str], out: TextIO, count: int = None) -> int:
+        """将HTML报告逐篇写入 out，不在内存中拼接整份报告；参数与 render_many 相同，返回写入的论文数"""
+        return self.render_many(papers, keywords, {"html": out}, count)
+    
+    def render_markdown(self, papers: Iterable[Dict], keywords: List[str], out: TextIO, count: int = None) -> int:
+        """将Markdown报告逐篇写入 out，参数与 render_many 相同，返回写入的论文数"""
+        return self.render_many(papers, keywords, {"markdown": out}, count)
+    
+    def render(self, papers: Iterable[Dict], keywords: List[str], out: TextIO, format: str = "html",
+               count: int = None) -> int:
+        """按格式（html、markdown、jsonl 或 atom）将报告写入 out，返回写入的论文数"""
+        return self.render_many(papers, keywords, {format: out}, count)
+    
+    def generate_html_report(self, papers: List[Dict], keywords: List[str]) -> str:
+        """生成HTML格式的报告"""
+        buffer = io.StringIO()
+        self.render_html(papers, keywords, buffer)
+        return buffer.getvalue()
+    
+    def generate_markdown_report(self, papers: List[Dict], keywords: List[str]) -> str:
+        """生成Markdown格式的报告"""
+        buffer = io.StringIO()
+        self.render_markdown(papers, keywords, buffer)
+        return buffer.getvalue()
+    
+    def _content_hash(self, papers: List[Dict], keywords: List[str]) -> str:
+        """报告内容的哈希：关键词、显示的总结语言和论文字段（不含只用于排序的相关度）"""
+        digest = hashlib.sha256(json.dumps([keywords, self.summary_languages], ensure_ascii=False).encode('utf-8'))
+        for paper in papers:
+            fields = {key: value for key, value in paper.items() if key != 'relevance'}
+            digest.update(json.dumps(fields, ensure_ascii=False, sort_keys=True).encode('utf-8'))
+        return digest.hexdigest()
+    
+    def _report_files(self, path: str) -> List[str]:
+        """报告文件及当前配置要求的预压缩副本的路径"""
+        return [path] + [f"{path}.{PRECOMPRESS_EXTENSIONS[encoding]}" for encoding in self.precompress]
+    
+    def _latest_path(self) -> str:
+        return os.path.join(self.output_dir, ".latest_reports.json")
+    
+    def _load_latest(self) -> Dict:
+        """读取每个配置、每种格式上一份报告的内容哈希和路径"""
+        try:
+            with open(self._latest_path(), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_latest(self, latest: Dict):
+        temp_path = self._latest_path() + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(latest, f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, self._latest_path())
+    
+    def save_reports(self, papers: List[Dict], keywords: List[str], formats: Iterable[str] = ("html",),
+                     name: str = None) -> Dict[str, str]:
+        """
+        只遍历一次论文，同时保存多种格式的报告
+        
+        启用 skip_unchanged 时，内容与同一配置（name，没有时为关键词）上一份报告相同的格式不再写入，
+        直接返回上一份报告的路径，并记录在 last_skipped 中
         
-        filepath = os.path.join(self.output_dir, filename)
+        Args:
+            papers: 论文列表
+            keywords: 搜索关键词
+            formats: 报告格式（html、markdown、jsonl、atom）
+            name: 用于区分同一次运行中不同配置的报告
+            
+        Returns:
+            {格式: 报告路径}
+        """
+        formats = list(dict.fromkeys(self._format_key(format) for format in formats))
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        if name:
+            timestamp = f"{name}_{timestamp}"
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+        paths = {}
+        hashes = {}
+        self.last_skipped = []
+        if self.skip_unchanged:
+            papers = papers if isinstance(papers, (list, tuple)) else list(papers)
+            profile = name or ", ".join(keywords)
+            latest = self._load_latest()
+            content_hash = self._content_hash(papers, keywords)
+            for format in formats:
+                # 模板修改后即使论文相同也重新生成
+                hashes[format] = hashlib.sha256(
+                    f"{content_hash}{format}{_FRAGMENT_TEMPLATES.get(format, '')}".encode('utf-8')
+                ).hexdigest()
+                previous = latest.get(profile, {}).get(format)
+                # 上一份报告缺少当前要求的预压缩副本时也重新生成
+                if previous and previous['hash'] == hashes[format] and all(
+                    os.path.exists(path) for path in self._report_files(previous['path'])
+                ):
+                    paths[format] = previous['path']
+                    self.last_skipped.append(format)
         
-        return filepath
+        pending = {
+            format: os.path.join(self.output_dir, f"arxiv_report_{timestamp}.{REPORT_EXTENSIONS[format]}")
+            for format in formats if format not in paths
+        }
+        if pending:
+            with ExitStack() as stack:
+                outputs = {
+                    format: stack.enter_context(_ReportFile(path, self.precompress))
+                    for format, path in pending.items()
+                }
+                self.render_many(papers, keywords, outputs)
+            paths.update(pending)
+            
+            if self.skip_unchanged:
+                # 重新读取，减少多个进程同时保存时互相覆盖
+                latest = self._load_latest()
+                latest.setdefault(profile, {}).update(
+                    {format: {'hash': hashes[format], 'path': path} for format, path in pending.items()}
+                )
+                self._save_latest(latest)
+        else:
+            self.last_render_stats = {'papers': 0}
+        
+        return {format: paths[format] for format in formats}
+    
+    def save_report(self, papers: List[Dict], keywords: List[str], format: str = "html",
+                    name: str = None) -> str:
+        """保存报告到文件，name 用于区分同一次运行中不同配置的报告；报告直接流式写入文件"""
+        return self.save_reports(papers, keywords, [format], name)[self._format_key(format)]
     
     def print_console_report(self, papers: List[Dict], keywords: List[str]):
         """在控制台打印报告"""
         
+        self.print_console_header(keywords, len(papers))
+        for i, paper in enumerate(papers, 1):
+            self.print_console_paper(i, paper)
+    
+    def print_console_header(self, keywords: List[str], count: int):
+        """在控制台打印报告标题"""
+        
         print("=" * 80)
         print(f"📚 arXiv 论文日报 - {datetime.now().strftime('%Y年%m月%d日')}")
         print("=" * 80)
         print(f"🔍 搜索关键词: {', '.join(keywords)}")
-        print(f"📊 找到论文数量: {len(papers)}")
+        print(f"📊 找到论文数量: {count}")
         print("=" * 80)
+    
+    def print_console_paper(self, i: int, paper: Dict):
+        """在控制台打印一篇论文"""
         
-        for i, paper in enumerate(papers, 1):
-            print(f"\n{i}. {paper['title']}")
-            print(f"   👥 作者: {', '.join(paper['authors'][:3])}{'等' if len(paper['authors']) > 3 else ''}")
-            print(f"   📅 发布: {paper['published']} | 🏷️ 分类: {', '.join(paper['categories'])}")
-            print(f"   📝 总结: {paper.get('summary', '暂无总结')}")
-            print(f"   🔗 链接: {paper['url']}")
-            print("-" * 80)
\ No newline at end of file
+        print(f"\n{i}. {paper['title']}")
+        print(f"   👥 作者: {', '.join(paper['authors'][:3])}{'等' if len(paper['authors']) > 3 else ''}")
+        print(f"   📅 发布: {paper['published']} | 🏷️ 分类: {', '.join(paper['categories'])}")
+        for label, summary in self.summary_sections(paper):
+            print(f"   📝 {label}: {summary}")
+        print(f"   🔗 链接: {paper['url']}")
+        print("-" * 80)
+    
+    def print_console_stream(self, items: Iterable[Tuple[int, Dict]], keywords: List[str], count: int) -> int:
+        """
+        边生成边在控制台打印报告
+        
+        Args:
+            items: 逐篇产出的 (下标, 论文)，如 PaperSummarizer.iter_summaries 的结果
+            keywords: 搜索关键词
+            count: 论文总数
+            
+        Returns:
+            打印的论文数
+        """
+        self.print_console_header(keywords, count)
+        printed = 0
+        for index, paper in items:
+            self.print_console_paper(index + 1, paper)
+            printed += 1
+        return printed
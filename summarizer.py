@@ -1,31 +1,28 @@
-from openai import OpenAI
-from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
+import json
+import random
+import re
+import threading
+import time
 import config
 
-class PaperSummarizer:
-    def __init__(self, api_key: str = None):
-        self.api_key = api_key or config.OPENAI_API_KEY
-        if not self.api_key:
-            raise ValueError("需要提供OpenAI API密钥")
-        
-        self.client = OpenAI(api_key=self.api_key)
-    
-    def summarize_paper(self, paper: Dict, language: str = "chinese") -> str:
-        """
-        为单篇论文生成总结
-        
-        Args:
-            paper: 论文信息字典
-            language: 总结语言 ("chinese" 或 "english")
-            
-        Returns:
-            论文总结
-        """
-        title = paper['title']
-        abstract = paper['abstract']
-        
-        if language == "chinese":
-            prompt = f"""
+try:
+    import tiktoken
+except ImportError:  # 未安装 tiktoken 时使用粗略估计
+    tiktoken = None
+from extractive_summarizer import sentence_spans
+from paper_store import parse_arxiv_id
+from rate_limiter import AdaptiveConcurrencyLimiter
+from summary_backends import BackendError, create_backend
+from summary_cache import SummaryCache
+
+SYSTEM_PROMPT = "你是一个专业的学术论文总结助手。"
+
+# 单篇总结的提示词模板，修改后摘要缓存会自动失效
+PROMPT_TEMPLATES = {
+    "chinese": """
 请为以下学术论文生成一个简洁的中文总结（不超过150字）：
 
 标题：{title}
@@ -38,9 +35,8 @@ class PaperSummarizer:
 3. 实际应用价值
 
 总结要简洁明了，适合快速了解论文要点。
-"""
-        else:
-            prompt = f"""
+""",
+    "english": """
 Please provide a concise summary (no more than 150 words) for the following academic paper:
 
 Title: {title}
@@ -54,43 +50,761 @@ Please summarize:
 
 Keep the summary concise and suitable for quick understanding.
 """
+}
+
+# 多篇合并总结的提示词模板，{papers} 为按 ID 列出的论文，要求返回以 ID 为键的 JSON
+BATCH_PROMPT_TEMPLATES = {
+    "chinese": """
+请为以下 {count} 篇学术论文分别生成简洁的中文总结（每篇不超过150字），
+概括主要研究内容、核心方法或贡献以及实际应用价值。
+
+{papers}
+
+只返回一个JSON对象，键为论文ID，值为该论文的总结，例如 {{"2401.01234": "总结"}}，不要输出其他内容。
+""",
+    "english": """
+Please write a concise summary (no more than 150 words each) for each of the following {count} academic papers,
+covering the main research content, key methods or contributions, and practical application value.
+
+{papers}
+
+Return only a JSON object whose keys are the paper IDs and whose values are the summaries,
+e.g. {{"2401.01234": "summary"}}, with no other text.
+"""
+}
+
+# 双语模式：一次请求同时生成中英文总结，两部分分别缓存
+BILINGUAL = "bilingual"
+LANGUAGES = ("chinese", "english")
+
+BILINGUAL_PROMPT_TEMPLATE = """
+请为以下学术论文分别生成一个简洁的中文总结（不超过150字）和英文总结（no more than 150 words）：
+
+标题 / Title: {title}
+
+摘要 / Abstract: {abstract}
+
+两个总结都应概括：
+1. 主要研究内容 / Main research content
+2. 核心方法或贡献 / Key methods or contributions
+3. 实际应用价值 / Practical application value
+
+只返回一个JSON对象，格式为 {{"chinese": "中文总结", "english": "English summary"}}，不要输出其他内容。
+"""
+
+BATCH_PAPER_TEMPLATE = """ID: {id}
+标题 / Title: {title}
+摘要 / Abstract: {abstract}
+"""
+
+# 预算不足时用摘要节选代替总结，加上前缀以便读者区分
+EXCERPT_PREFIX = {
+    "chinese": "（摘要节选）",
+    "english": "(Abstract excerpt) "
+}
+
+ERROR_PREFIX = {
+    "chinese": "无法生成总结: ",
+    "english": "Failed to generate summary: "
+}
+
+_CJK_PATTERN = re.compile(r'[\u3000-\u9fff\uac00-\ud7af\uff00-\uffef]')
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    粗略估计文本的token数：中日韩字符约每字1个token，其余约每4个字符1个token
+    """
+    cjk = len(_CJK_PATTERN.findall(text))
+    return cjk + (len(text) - cjk + 3) // 4
+
+
+@lru_cache(maxsize=None)
+def _encoding(model: str):
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
+def count_tokens(text: str, model: str = None) -> int:
+    """
+    统计文本的token数，安装了 tiktoken 时按模型的分词器精确计算，否则粗略估计
+    """
+    if tiktoken is not None and model:
+        try:
+            return len(_encoding(model).encode(text))
+        except Exception:
+            pass
+    return estimate_tokens(text)
+
+
+def trim_text(text: str, max_tokens: int, model: str = None) -> str:
+    """
+    按完整句子截断过长的文本，使其不超过 max_tokens；max_tokens 为 0 时不截断
+    
+    保留原文中句子之间的空白，小数点和常见缩写不会被当作句末
+    """
+    if not max_tokens or count_tokens(text, model) <= max_tokens:
+        return text
+    
+    kept_end, used = 0, 0
+    for start, end in sentence_spans(text):
+        tokens = count_tokens(text[start:end], model) + 1
+        if used + tokens > max_tokens:
+            break
+        kept_end, used = end, used + tokens
+    if not kept_end:
+        # 第一句就超出限制时按比例截断字符
+        return text[:max(1, len(text) * max_tokens // count_tokens(text, model))].rstrip() + "…"
+    return text[:kept_end] + " …"
+
+
+def abstract_excerpt(abstract: str, max_chars: int) -> str:
+    """
+    取摘要开头不超过 max_chars 个字符的完整句子作为节选
+    """
+    abstract = abstract.strip()
+    excerpt_end = 0
+    for _, end in sentence_spans(abstract):
+        if end > max_chars:
+            break
+        excerpt_end = end
+    return abstract[:excerpt_end] if excerpt_end else abstract[:max_chars].rstrip() + "…"
+
+
+def parse_batch_response(content: str) -> Dict[str, str]:
+    """
+    解析多篇合并总结的响应，返回 {论文ID: 总结}，无法解析时返回空字典
+    
+    兼容模型在JSON外包裹代码块或说明文字的情况，只保留值为非空字符串的条目
+    """
+    start, end = content.find('{'), content.rfind('}')
+    if start < 0 or end <= start:
+        return {}
+    try:
+        data = json.loads(content[start:end + 1])
+    except ValueError:
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    return {
+        str(key).strip(): value.strip()
+        for key, value in data.items()
+        if isinstance(value, str) and value.strip()
+    }
+
+class PaperSummarizer:
+    def __init__(self, api_key: str = None, base_url: str = None, max_concurrency: int = None,
+                 cache: SummaryCache = None, batch_size: int = None, batch_token_budget: int = None,
+                 token_budget: int = None, time_budget: float = None, backend=None, model: str = None):
+        self.api_key = api_key or config.OPENAI_API_KEY
+        
+        # 发送请求的后端：名称（openai、mock）或已创建的后端对象，为空时使用 config.SUMMARY_BACKEND
+        if backend is None or isinstance(backend, str):
+            backend = create_backend(backend, api_key=self.api_key, base_url=base_url or config.OPENAI_BASE_URL)
+        self.backend = backend
+        self.model = model or config.SUMMARY_MODEL
+        self.temperature = config.SUMMARY_TEMPERATURE
+        self.max_tokens = config.SUMMARY_MAX_TOKENS
+        # 同时进行的请求数上限，1 表示逐篇生成
+        self.max_concurrency = max_concurrency or config.SUMMARY_MAX_CONCURRENCY
+        # 在上限内按AIMD调整实际并发：延迟正常时逐步提高，遇到429/5xx时减半
+        self.limiter = AdaptiveConcurrencyLimiter(
+            initial=config.SUMMARY_INITIAL_CONCURRENCY,
+            max_limit=self.max_concurrency,
+            latency_target=config.SUMMARY_LATENCY_TARGET
+        )
+        self.max_retries = config.SUMMARY_MAX_RETRIES
+        self.retry_base_delay = config.SUMMARY_RETRY_BASE_DELAY
+        self.retry_max_delay = config.SUMMARY_RETRY_MAX_DELAY
+        self.retries = 0
+        self.throttled = 0
+        self._retry_lock = threading.Lock()
+        # 调用API前先查询的总结缓存，为空时不缓存
+        self.cache = cache
+        # 每个请求最多合并的论文数和token预算，batch_size 为 1 时逐篇请求
+        self.batch_size = batch_size or config.SUMMARY_BATCH_SIZE
+        self.batch_token_budget = batch_token_budget or config.SUMMARY_BATCH_TOKEN_BUDGET
+        # 摘要超过此token数时按句截断，0 表示不截断
+        self.max_abstract_tokens = config.SUMMARY_MAX_ABSTRACT_TOKENS
+        # 每次运行的token和时间预算，超出预算的论文使用摘要节选，0 表示不限制
+        self.token_budget = config.SUMMARY_RUN_TOKEN_BUDGET if token_budget is None else token_budget
+        self.time_budget = config.SUMMARY_RUN_TIME_BUDGET if time_budget is None else time_budget
+        # 最近一次批量总结的耗时统计
+        self.last_run_stats = {}
+    
+    @classmethod
+    def from_config(cls) -> 'PaperSummarizer':
+        """根据config.py中的配置创建总结器"""
+        cache = None
+        if config.SUMMARY_CACHE_PATH:
+            cache = SummaryCache(config.SUMMARY_CACHE_PATH, max_bytes=config.SUMMARY_CACHE_MAX_BYTES)
+        return cls(cache=cache)
+    
+    def _prompt_template(self, language: str) -> str:
+        return PROMPT_TEMPLATES[self._language_key(language)]
+    
+    def _batch_template(self, language: str) -> str:
+        return BATCH_PROMPT_TEMPLATES[self._language_key(language)] + BATCH_PAPER_TEMPLATE
+    
+    def _cache_key(self, paper: Dict, language: str, template: str = None) -> str:
+        """
+        生成总结缓存键，template 为生成该总结实际使用的提示词模板，默认为单篇模板
+        （合并请求和双语请求生成的总结传入各自的模板）
+        """
+        if template is None:
+            template = self._prompt_template(language)
+        # 摘要截断长度不同，发送的提示词也不同
+        template = SYSTEM_PROMPT + template + f"\nmax_abstract_tokens={self.max_abstract_tokens}"
+        return self.cache.make_key(paper['url'], language, template, self.model, self.temperature)
+    
+    def _language_key(self, language: str) -> str:
+        return "chinese" if language == "chinese" else "english"
+    
+    def _cached_summary(self, paper: Dict, language: str) -> Optional[str]:
+        """查询单语言总结：逐篇请求生成的总结，启用合并请求时也接受合并请求生成的总结"""
+        if self.cache is None:
+            return None
+        templates = [None]
+        if self.batch_size > 1:
+            templates.append(self._batch_template(language))
+        return self.cache.get_first([self._cache_key(paper, language, template) for template in templates])
+    
+    def _store_summary(self, paper: Dict, language: str, summary: str, template: str = None):
+        if self.cache is not None:
+            self.cache.set(self._cache_key(paper, language, template), summary)
+    
+    def _cached_halves(self, paper: Dict) -> Dict[str, str]:
+        """返回双语总结中已缓存的部分 {语言: 总结}，也接受缺少一种语言时单独生成的总结"""
+        if self.cache is None:
+            return {}
+        halves = {}
+        for language in LANGUAGES:
+            summary = self.cache.get_first([self._cache_key(paper, language, BILINGUAL_PROMPT_TEMPLATE),
+                                            self._cache_key(paper, language)])
+            if summary is not None:
+                halves[language] = summary
+        return halves
+    
+    def _set_summary(self, paper: Dict, language: str, summary):
+        """写回总结；双语模式下 summaries 保存两种语言，summary 保存中文部分"""
+        if language == BILINGUAL:
+            paper['summaries'] = summary
+            paper['summary'] = summary['chinese']
+        else:
+            paper['summary'] = summary
+    
+    def _set_excerpt(self, paper: Dict, language: str):
+        if language == BILINGUAL:
+            self._set_summary(paper, language, {lang: self._excerpt(paper, lang) for lang in LANGUAGES})
+        else:
+            self._set_summary(paper, language, self._excerpt(paper, language))
+    
+    def _prompt_abstract(self, paper: Dict) -> str:
+        return trim_text(paper['abstract'], self.max_abstract_tokens, self.model)
+    
+    def _excerpt(self, paper: Dict, language: str) -> str:
+        return EXCERPT_PREFIX[self._language_key(language)] + abstract_excerpt(paper['abstract'], config.SUMMARY_MAX_LENGTH)
+    
+    def summarize_paper(self, paper: Dict, language: str = "chinese") -> str:
+        """
+        为单篇论文生成总结
+        
+        Args:
+            paper: 论文信息字典
+            language: 总结语言 ("chinese" 或 "english")
+            
+        Returns:
+            论文总结
+        """
+        cached = self._cached_summary(paper, language)
+        if cached is not None:
+            return cached
+        return self._generate_summary(paper, language)
+    
+    def _generate_summary(self, paper: Dict, language: str) -> str:
+        """调用API生成总结，成功时写入缓存"""
+        try:
+            summary = self._request_summary(paper, language)
+        except Exception as e:
+            print(f"生成总结时出错: {e}")
+            return ERROR_PREFIX[self._language_key(language)] + str(e)
+        
+        # 只缓存成功生成的总结
+        self._store_summary(paper, language, summary)
+        return summary
+    
+    def _request_summary(self, paper: Dict, language: str) -> str:
+        """调用API为单篇论文生成总结，不查询缓存"""
+        prompt = self._prompt_template(language).format(title=paper['title'], abstract=self._prompt_abstract(paper))
+        
+        response = self._create_completion(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=self.max_tokens,
+            temperature=self.temperature
+        )
+        
+        return response.strip()
+    
+    def summarize_bilingual(self, paper: Dict, known: Dict[str, str] = None) -> Dict[str, str]:
+        """
+        在一次请求中为单篇论文生成中英文总结
+        
+        要求模型返回 {"chinese": ..., "english": ...} 格式的JSON，两部分分别缓存；
+        只缺一种语言或解析失败时，对缺少的语言单独请求
+        
+        Args:
+            paper: 论文信息字典
+            known: 已从缓存取得的部分，为 None 时查询缓存
+            
+        Returns:
+            {语言: 总结}
+        """
+        halves = dict(self._cached_halves(paper) if known is None else known)
+        
+        if not halves:
+            prompt = BILINGUAL_PROMPT_TEMPLATE.format(title=paper['title'], abstract=self._prompt_abstract(paper))
+            try:
+                response = self._create_completion(
+                    model=self.model,
+                    messages=[
+                        {"role": "system", "content": SYSTEM_PROMPT},
+                        {"role": "user", "content": prompt}
+                    ],
+                    max_tokens=self.max_tokens * len(LANGUAGES),
+                    temperature=self.temperature
+                )
+                parsed = parse_batch_response(response)
+            except Exception as e:
+                print(f"生成双语总结时出错，改为分别生成: {e}")
+                parsed = {}
+            for language in LANGUAGES:
+                if parsed.get(language):
+                    halves[language] = parsed[language]
+                    self._store_half(paper, language, parsed[language])
+        
+        for language in LANGUAGES:
+            if language in halves:
+                continue
+            try:
+                halves[language] = self._request_summary(paper, language)
+            except Exception as e:
+                print(f"生成总结时出错: {e}")
+                halves[language] = ERROR_PREFIX[language] + str(e)
+                continue
+            # 单独请求使用的是单语言提示词，按单语言总结缓存
+            self._store_summary(paper, language, halves[language])
+        return halves
+    
+    def _store_half(self, paper: Dict, language: str, summary: str):
+        if self.cache is not None:
+            # 双语请求生成的每一半按各自的语言单独缓存
+            self.cache.set(self._cache_key(paper, language, BILINGUAL_PROMPT_TEMPLATE), summary)
+    
+    def _create_completion(self, **kwargs):
+        """
+        通过后端发送对话补全请求并返回回复文本，受自适应并发限制
+        
+        遇到429、5xx或连接错误时按 Retry-After 头等待，没有该头时按带随机抖动的指数退避等待，
+        最多重试 max_retries 次；其他错误直接抛出
+        """
+        for attempt in range(self.max_retries + 1):
+            self.limiter.acquire()
+            start = time.perf_counter()
+            # 超时、回复无法解析等非 BackendError 的失败也算过载，不能当作正常样本提高并发
+            overloaded = True
+            try:
+                reply = self.backend.complete(**kwargs)
+                overloaded = False
+                return reply
+            except BackendError as e:
+                status = e.status_code
+                overloaded = status is None or status == 429 or status >= 500
+                if not (overloaded or status in (408, 409)) or attempt == self.max_retries:
+                    raise
+                error = e
+            finally:
+                self.limiter.release(time.perf_counter() - start, overloaded)
+            
+            delay = error.retry_after
+            if delay is None:
+                delay = random.uniform(0, min(self.retry_max_delay, self.retry_base_delay * 2 ** attempt))
+            with self._retry_lock:
+                self.retries += 1
+                self.throttled += status == 429
+            time.sleep(min(delay, self.retry_max_delay))
+    
+    def summarize_batch(self, papers: List[Dict], language: str = "chinese") -> List[Optional[str]]:
+        """
+        在一个请求中为多篇论文生成总结
+        
+        要求模型返回以论文ID为键的JSON，逐条校验后按输入顺序返回；
+        缺失、为空或无法解析的条目为 None，由调用方改为逐篇请求
+        
+        Args:
+            papers: 论文信息列表
+            language: 总结语言
+            
+        Returns:
+            与输入顺序一致的总结列表
+        """
+        ids = [parse_arxiv_id(paper['url'])[0] for paper in papers]
+        blocks = "\n".join(
+            BATCH_PAPER_TEMPLATE.format(id=paper_id, title=paper['title'], abstract=self._prompt_abstract(paper))
+            for paper_id, paper in zip(ids, papers)
+        )
+        prompt = BATCH_PROMPT_TEMPLATES[self._language_key(language)].format(count=len(papers), papers=blocks)
         
         try:
-            response = self.client.chat.completions.create(
-                model="gpt-3.5-turbo",
+            response = self._create_completion(
+                model=self.model,
                 messages=[
-                    {"role": "system", "content": "你是一个专业的学术论文总结助手。"},
+                    {"role": "system", "content": SYSTEM_PROMPT},
                     {"role": "user", "content": prompt}
                 ],
-                max_tokens=300,
-                temperature=0.3
+                max_tokens=self.max_tokens * len(papers),
+                temperature=self.temperature
             )
-            
-            summary = response.choices[0].message.content.strip()
-            return summary
-            
+            summaries = parse_batch_response(response)
         except Exception as e:
-            print(f"生成总结时出错: {e}")
-            return f"无法生成总结: {str(e)}"
+            print(f"合并生成总结时出错，改为逐篇生成: {e}")
+            return [None] * len(papers)
+        
+        # 同一批中重复的ID无法区分，交给逐篇请求
+        duplicated = {paper_id for paper_id in ids if ids.count(paper_id) > 1}
+        return [summaries.get(paper_id) if paper_id not in duplicated else None for paper_id in ids]
+    
+    def _paper_tokens(self, paper: Dict) -> int:
+        """一篇论文在合并请求中占用的token：输入部分加上预留的输出部分"""
+        return (count_tokens(paper['title'], self.model) + count_tokens(self._prompt_abstract(paper), self.model)
+                + 20 + self.max_tokens)
+    
+    def _select_within_budget(self, papers: List[Dict], indices: List[int],
+                              language: str) -> Tuple[List[int], List[int]]:
+        """
+        按相关度从高到低选出不超过本次token预算的论文（没有相关度时保持原顺序）
+        
+        Returns:
+            (在预算内的论文下标, 超出预算的论文下标)，均保持原顺序
+        """
+        if not self.token_budget:
+            return indices, []
+        
+        if language == BILINGUAL:
+            # 双语请求预留两份输出
+            overhead = count_tokens(SYSTEM_PROMPT + BILINGUAL_PROMPT_TEMPLATE, self.model) + self.max_tokens
+        else:
+            overhead = count_tokens(SYSTEM_PROMPT + self._prompt_template(language), self.model)
+        ranked = sorted(indices, key=lambda i: -(papers[i].get('relevance') or 0.0))
+        selected, used = set(), 0
+        for index in ranked:
+            tokens = overhead + self._paper_tokens(papers[index])
+            if used + tokens > self.token_budget:
+                continue
+            selected.add(index)
+            used += tokens
+        return [i for i in indices if i in selected], [i for i in indices if i not in selected]
+    
+    def _make_batches(self, papers: List[Dict], indices: List[int], language: str) -> List[List[int]]:
+        """
+        按token预算和数量上限把论文分组，预算不足以容纳一篇的论文单独成组
+        """
+        overhead = count_tokens(SYSTEM_PROMPT + BATCH_PROMPT_TEMPLATES[self._language_key(language)], self.model)
+        batches, current, used = [], [], overhead
+        for index in indices:
+            tokens = self._paper_tokens(papers[index])
+            if current and (len(current) >= self.batch_size or used + tokens > self.batch_token_budget):
+                batches.append(current)
+                current, used = [], overhead
+            current.append(index)
+            used += tokens
+        if current:
+            batches.append(current)
+        return batches
     
     def summarize_papers(self, papers: List[Dict], language: str = "chinese") -> List[Dict]:
         """
-        为多篇论文生成总结
+        为多篇论文生成总结，全部完成后返回
         
         Args:
             papers: 论文信息列表
-            language: 总结语言
+            language: 总结语言 ("chinese"、"english" 或 "bilingual")
             
         Returns:
             包含总结的论文信息列表
         """
-        summarized_papers = []
+        for done, _ in enumerate(self.iter_summaries(papers, language), 1):
+            print(f"已完成 {done}/{len(papers)} 篇论文的总结...")
+        return papers
+    
+    def iter_summaries(self, papers: List[Dict], language: str = "chinese") -> Iterator[Tuple[int, Dict]]:
+        """
+        为多篇论文生成总结，每篇完成后立即产出 (下标, 论文)
+        
+        缓存命中和使用摘要节选的论文最先产出，其余按请求完成的先后顺序产出；
+        最多同时进行 max_concurrency 个请求，结果按原顺序写回每篇论文，
+        整体耗时取决于最慢的请求而不是所有请求之和；batch_size 大于 1 时，
+        未命中缓存的论文按token预算合并为多篇一次的请求，解析失败的条目再逐篇请求；
+        超出本次运行token或时间预算的论文按相关度排在后面的改用摘要节选；
+        language 为 "bilingual" 时每篇论文一次请求同时生成中英文总结，写入 summaries
+        
+        Args:
+            papers: 论文信息列表
+            language: 总结语言 ("chinese"、"english" 或 "bilingual")
+            
+        Yields:
+            (论文在输入中的下标, 写入了总结的论文)
+        """
+        start = time.perf_counter()
+        latencies = [0.0] * len(papers)
+        cache_before = self.cache.stats() if self.cache is not None else None
+        retries_before, throttled_before = self.retries, self.throttled
+        
+        fallbacks, skipped = [], []
+        deadline = start + self.time_budget if self.time_budget else None
+        # 双语模式下已缓存的部分 {下标: {语言: 总结}}
+        known = {}
+        
+        def summarize(batch: List[int]) -> List[int]:
+            batch_start = time.perf_counter()
+            if deadline is not None and batch_start > deadline:
+                # 超出本次运行的时间预算，剩余论文使用摘要节选
+                for index in batch:
+                    self._set_excerpt(papers[index], language)
+                skipped.extend(batch)
+                return batch
+            
+            if language == BILINGUAL:
+                for index in batch:
+                    self._set_summary(papers[index], language,
+                                      self.summarize_bilingual(papers[index], known.get(index, {})))
+            elif len(batch) == 1:
+                # 直接写入原记录，不再逐篇复制 / Write into the record itself instead of copying every paper
+                papers[batch[0]]['summary'] = self._generate_summary(papers[batch[0]], language)
+            else:
+                summaries = self.summarize_batch([papers[i] for i in batch], language)
+                for index, summary in zip(batch, summaries):
+                    if summary is None:
+                        fallbacks.append(index)
+                        papers[index]['summary'] = self._generate_summary(papers[index], language)
+                    else:
+                        self._store_summary(papers[index], language, summary, self._batch_template(language))
+                        papers[index]['summary'] = summary
+            for index in batch:
+                latencies[index] = time.perf_counter() - batch_start
+            return batch
+        
+        # 先取出缓存命中的论文，其余在预算内按相关度选择
+        pending = []
+        for i, paper in enumerate(papers):
+            if language == BILINGUAL:
+                known[i] = self._cached_halves(paper)
+                cached = known[i] if len(known[i]) == len(LANGUAGES) else None
+            else:
+                cached = self._cached_summary(paper, language)
+            if cached is not None:
+                self._set_summary(paper, language, cached)
+            else:
+                pending.append(i)
+        selected, over_budget = self._select_within_budget(papers, pending, language)
+        for index in over_budget:
+            self._set_excerpt(papers[index], language)
+        skipped.extend(over_budget)
+        
+        if self.batch_size > 1 and language != BILINGUAL:
+            # 按token预算合并请求
+            batches = self._make_batches(papers, selected, language)
+        else:
+            batches = [[i] for i in selected]
+        selected_set = set(selected)
+        for index in range(len(papers)):
+            if index not in selected_set:
+                yield index, papers[index]
+        
+        if self.max_concurrency <= 1:
+            for batch in batches:
+                for index in summarize(batch):
+                    yield index, papers[index]
+        else:
+            with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+                futures = [executor.submit(summarize, batch) for batch in batches]
+                try:
+                    for future in as_completed(futures):
+                        for index in future.result():
+                            yield index, papers[index]
+                except GeneratorExit:
+                    # 调用方提前停止时取消尚未开始的请求
+                    for future in futures:
+                        future.cancel()
+                    raise
+        
+        self.last_run_stats = self._latency_stats(latencies, time.perf_counter() - start)
+        self.last_run_stats.update({
+            'requests': len(batches) + len(fallbacks),
+            'batch_fallbacks': len(fallbacks),
+            'budget_skipped': len(skipped),
+            'concurrency_limit': self.limiter.limit,
+            'peak_concurrency': self.limiter.peak_in_flight,
+            'retries': self.retries - retries_before,
+            'throttled': self.throttled - throttled_before
+        })
+        if cache_before is not None:
+            # 本次运行的缓存命中率
+            cache_after = self.cache.stats()
+            hits = cache_after['hits'] - cache_before['hits']
+            misses = cache_after['misses'] - cache_before['misses']
+            self.last_run_stats.update({
+                'cache_hits': hits,
+                'cache_misses': misses,
+                'cache_hit_rate': hits / (hits + misses) if hits + misses else 0.0
+            })
+    
+    def summarize_papers_offline(self, papers: List[Dict], language: str = "chinese",
+                                 poll_interval: float = None, timeout: float = None) -> List[Dict]:
+        """
+        通过OpenAI Batch API离线生成总结（适用于无人等待的定时任务）
+        
+        未命中缓存的论文写成一个JSONL请求文件提交为批处理任务，轮询直到任务结束后
+        把结果写回每篇论文；任务失败、超时或缺少结果的论文改为同步请求
         
-        for i, paper in enumerate(papers, 1):
-            print(f"正在生成第 {i}/{len(papers)} 篇论文的总结...")
+        Args:
+            papers: 论文信息列表
+            language: 总结语言
+            poll_interval: 轮询间隔（秒）
+            timeout: 最长等待时间（秒），超时后取消任务
             
-            paper_copy = paper.copy()
-            paper_copy['summary'] = self.summarize_paper(paper, language)
-            summarized_papers.append(paper_copy)
+        Returns:
+            包含总结的论文信息列表
+        """
+        if language == BILINGUAL:
+            # 批处理任务只支持单语言提示词，双语总结仍同步生成（每篇一次请求）
+            print("⚠️  双语总结暂不支持批处理任务，改为同步生成")
+            return self.summarize_papers(papers, language)
+        
+        poll_interval = config.OPENAI_BATCH_POLL_INTERVAL if poll_interval is None else poll_interval
+        timeout = config.OPENAI_BATCH_TIMEOUT if timeout is None else timeout
+        start = time.perf_counter()
+        
+        pending = {}
+        for i, paper in enumerate(papers):
+            cached = self._cached_summary(paper, language)
+            if cached is not None:
+                paper['summary'] = cached
+            else:
+                pending[str(i)] = paper
+        
+        # 超出token预算的论文使用摘要节选，不提交到批处理任务
+        selected, over_budget = self._select_within_budget(papers, [int(i) for i in pending], language)
+        for index in over_budget:
+            papers[index]['summary'] = self._excerpt(papers[index], language)
+        pending = {str(index): papers[index] for index in selected}
+        
+        results = {}
+        if pending and not getattr(self.backend, 'supports_batch', False):
+            print("⚠️  当前总结后端不支持批处理任务，改为同步生成")
+        elif pending:
+            try:
+                results = self._run_batch_job(pending, language, poll_interval, timeout)
+            except Exception as e:
+                print(f"批处理任务出错，改为同步生成: {e}")
+        
+        missing = [paper for custom_id, paper in pending.items() if custom_id not in results]
+        for custom_id, summary in results.items():
+            self._store_summary(pending[custom_id], language, summary)
+            pending[custom_id]['summary'] = summary
+        if missing:
+            print(f"⚠️  {len(missing)} 篇论文未从批处理任务取得总结，改为同步生成")
+            self.summarize_papers(missing, language)
+        
+        self.last_run_stats = self._latency_stats([], time.perf_counter() - start)
+        self.last_run_stats.update({
+            'papers': len(papers),
+            'batch_requests': len(pending),
+            'batch_fallbacks': len(missing),
+            'budget_skipped': len(over_budget)
+        })
+        return papers
+    
+    def _run_batch_job(self, pending: Dict[str, Dict], language: str,
+                       poll_interval: float, timeout: float) -> Dict[str, str]:
+        """提交批处理任务并等待结束，返回 {custom_id: 总结}"""
+        lines = []
+        for custom_id, paper in pending.items():
+            prompt = self._prompt_template(language).format(title=paper['title'], abstract=self._prompt_abstract(paper))
+            lines.append(json.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model,
+                    "messages": [
+                        {"role": "system", "content": SYSTEM_PROMPT},
+                        {"role": "user", "content": prompt}
+                    ],
+                    "max_tokens": self.max_tokens,
+                    "temperature": self.temperature
+                }
+            }, ensure_ascii=False))
+        
+        request_file = self.backend.client.files.create(
+            file=("summaries.jsonl", "\n".join(lines).encode('utf-8')),
+            purpose="batch"
+        )
+        batch = self.backend.client.batches.create(
+            input_file_id=request_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        print(f"📤 已提交批处理任务 {batch.id}，共 {len(lines)} 篇论文")
+        
+        deadline = time.monotonic() + timeout
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            if time.monotonic() >= deadline:
+                print(f"⏱️  批处理任务 {batch.id} 超时，已取消")
+                self.backend.client.batches.cancel(batch.id)
+                return {}
+            time.sleep(poll_interval)
+            batch = self.backend.client.batches.retrieve(batch.id)
+        
+        print(f"📥 批处理任务 {batch.id} 状态: {batch.status}")
+        if not batch.output_file_id:
+            return {}
+        
+        results = {}
+        for line in self.backend.client.files.content(batch.output_file_id).text.splitlines():
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            response = item.get('response') or {}
+            if response.get('status_code') != 200:
+                continue
+            try:
+                summary = response['body']['choices'][0]['message']['content'].strip()
+            except (KeyError, IndexError, TypeError, AttributeError):
+                continue
+            if item.get('custom_id') in pending and summary:
+                results[item['custom_id']] = summary
+        return results
+    
+    def _latency_stats(self, latencies: List[float], wall_seconds: float) -> Dict:
+        """计算单篇延迟分布和总耗时"""
+        ordered = sorted(latencies)
+        
+        def percentile(p: float) -> float:
+            return ordered[min(len(ordered) - 1, int(p * len(ordered)))] if ordered else 0.0
         
-        return summarized_papers
\ No newline at end of file
+        return {
+            'papers': len(latencies),
+            'concurrency': self.max_concurrency,
+            'wall_seconds': wall_seconds,
+            'latency_sum': sum(latencies),
+            'latency_mean': sum(latencies) / len(latencies) if latencies else 0.0,
+            'latency_p50': percentile(0.5),
+            'latency_p95': percentile(0.95),
+            'latency_max': ordered[-1] if ordered else 0.0
+        }
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+总结后端模块 / Summary Backend Module
+PaperSummarizer 通过后端发送对话补全请求：兼容OpenAI接口的服务（官方接口或自建推理服务），
+以及用于离线压测的本地模拟后端 /
+PaperSummarizer sends chat completions through a backend: any OpenAI-compatible server (the official API or a
+self-hosted inference server), or a local mock backend for offline load testing
+"""
+
+import json
+import random
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+import config
+
+
+class BackendError(Exception):
+    """
+    后端请求失败 / A backend request failed
+    status_code 为空表示连接错误或超时 / A missing status_code means a connection error or timeout
+    """
+
+    def __init__(self, message: str, status_code: Optional[int] = None, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+def retry_after_seconds(headers) -> Optional[float]:
+    """
+    从 Retry-After（或 retry-after-ms）头中读取需要等待的秒数，没有时返回 None /
+    Read the wait in seconds from Retry-After (or retry-after-ms), None if absent
+    """
+    headers = headers or {}
+    try:
+        if headers.get('retry-after-ms'):
+            return float(headers['retry-after-ms']) / 1000
+        value = headers.get('retry-after')
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            # HTTP日期格式 / HTTP date format
+            return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+class OpenAIBackend:
+    """
+    兼容OpenAI接口的后端 / OpenAI-compatible backend
+    使用独立的httpx连接池，可配置超时、连接数和keep-alive；重试由 PaperSummarizer 负责 /
+    Uses its own httpx connection pool with configurable timeouts, pool size and keep-alive; PaperSummarizer
+    handles retries
+    """
+
+    supports_batch = True
+
+    def __init__(self, api_key: str, base_url: Optional[str] = None, timeout: float = 60.0,
+                 connect_timeout: float = 10.0, pool_size: int = 16, keep_alive: bool = True):
+        """
+        初始化后端 / Initialize the backend
+
+        Args:
+            api_key: API密钥（自建服务通常接受任意值）/ API key (self-hosted servers usually accept anything)
+            base_url: 接口地址，为空时使用官方接口 / API base url, official API if None
+            timeout: 读取响应的超时（秒）/ Read timeout (seconds)
+            connect_timeout: 建立连接的超时（秒）/ Connect timeout (seconds)
+            pool_size: 最大连接数 / Maximum number of connections
+            keep_alive: 是否复用空闲连接 / Whether idle connections are reused
+        """
+        from openai import OpenAI
+        try:
+            import httpx2 as httpx  # 新版 openai 基于 httpx2 / Newer openai releases are built on httpx2
+        except ImportError:
+            import httpx
+
+        self.http_client = httpx.Client(
+            timeout=httpx.Timeout(timeout, connect=connect_timeout),
+            limits=httpx.Limits(
+                max_connections=pool_size,
+                max_keepalive_connections=pool_size if keep_alive else 0
+            )
+        )
+        self.client = OpenAI(api_key=api_key, base_url=base_url, max_retries=0, http_client=self.http_client)
+
+    def complete(self, **kwargs) -> str:
+        """
+        发送对话补全请求，返回回复文本 / Send a chat completion and return the reply text
+
+        Raises:
+            BackendError: 请求失败 / The request failed
+        """
+        from openai import APIConnectionError, APIStatusError
+
+        try:
+            response = self.client.chat.completions.create(**kwargs)
+        except APIStatusError as e:
+            raise BackendError(str(e), e.status_code, retry_after_seconds(e.response.headers)) from e
+        except APIConnectionError as e:
+            raise BackendError(str(e)) from e
+        return response.choices[0].message.content or ""
+
+
+class MockBackend:
+    """
+    本地模拟后端，用于离线压测 / Local mock backend for offline load testing
+    按配置的延迟和错误率返回固定内容：合并总结请求返回以论文ID为键的JSON，双语请求返回中英文JSON /
+    Replies with canned text after the configured latency and error rates: batched prompts get JSON keyed
+    by paper id and bilingual prompts get Chinese/English JSON
+    """
+
+    supports_batch = False
+
+    SUMMARY = ("本文提出了一种新的方法，在多个基准上取得了更好的效果，并分析了其效率与适用场景。 / "
+               "The paper proposes a new method that improves results on several benchmarks and analyses its "
+               "efficiency and use cases.")
+
+    _ID_PATTERN = re.compile(r'^ID: (\S+)$', re.MULTILINE)
+
+    def __init__(self, latency: float = 0.5, jitter: float = 0.2, rate_limit_rate: float = 0.0,
+                 error_rate: float = 0.0, max_concurrency: int = 0, seed: Optional[int] = None):
+        """
+        初始化模拟后端 / Initialize the mock backend
+
+        Args:
+            latency: 平均响应延迟（秒）/ Mean response latency (seconds)
+            jitter: 延迟的随机浮动比例 / Random latency spread as a fraction of latency
+            rate_limit_rate: 返回429的概率 / Probability of a 429 reply
+            error_rate: 返回500的概率 / Probability of a 500 reply
+            max_concurrency: 超过此并发数的请求返回429，0 表示不限制 / Requests beyond this concurrency get 429, 0 for no limit
+            seed: 随机数种子 / Random seed
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit_rate = rate_limit_rate
+        self.error_rate = error_rate
+        self.max_concurrency = max_concurrency
+        self.requests = 0
+        self.failures = 0
+        self._in_flight = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def complete(self, **kwargs) -> str:
+        """
+        模拟一次对话补全 / Simulate one chat completion
+
+        Raises:
+            BackendError: 按错误率模拟的429或500 / A 429 or 500 drawn from the error rates
+        """
+        with self._lock:
+            self.requests += 1
+            self._in_flight += 1
+            overloaded = 0 < self.max_concurrency < self._in_flight
+            roll = self._random.random()
+            delay = max(0.0, self.latency * (1 + self._random.uniform(-self.jitter, self.jitter)))
+        try:
+            time.sleep(delay)
+            if overloaded or roll < self.rate_limit_rate:
+                self._count_failure()
+                raise BackendError("mock rate limit", 429, retry_after=self.latency)
+            if roll < self.rate_limit_rate + self.error_rate:
+                self._count_failure()
+                raise BackendError("mock server error", 500)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+        prompt = kwargs['messages'][-1]['content']
+        ids = self._ID_PATTERN.findall(prompt)
+        if ids:
+            return json.dumps({paper_id: self.SUMMARY for paper_id in ids}, ensure_ascii=False)
+        if '"chinese"' in prompt and '"english"' in prompt:
+            chinese, english = self.SUMMARY.split(" / ")
+            return json.dumps({"chinese": chinese, "english": english}, ensure_ascii=False)
+        return self.SUMMARY
+
+    def _count_failure(self):
+        with self._lock:
+            self.failures += 1
+
+
+BACKENDS = {
+    "openai": OpenAIBackend,
+    "mock": MockBackend
+}
+
+
+def create_backend(name: str = None, api_key: str = None, base_url: str = None):
+    """
+    按名称和config.py中的配置创建后端 / Create a backend from its name and the settings in config.py
+
+    Args:
+        name: 后端名称（openai 或 mock），为空时使用 config.SUMMARY_BACKEND / Backend name, config.SUMMARY_BACKEND if None
+        api_key: API密钥 / API key
+        base_url: 接口地址 / API base url
+    """
+    name = name or config.SUMMARY_BACKEND
+    if name == "mock":
+        return MockBackend(
+            latency=config.MOCK_BACKEND_LATENCY,
+            rate_limit_rate=config.MOCK_BACKEND_RATE_LIMIT_RATE,
+            error_rate=config.MOCK_BACKEND_ERROR_RATE,
+            max_concurrency=config.MOCK_BACKEND_MAX_CONCURRENCY
+        )
+    if name == "openai":
+        if not api_key:
+            raise ValueError("需要提供OpenAI API密钥")
+        return OpenAIBackend(
+            api_key=api_key,
+            base_url=base_url,
+            timeout=config.SUMMARY_TIMEOUT,
+            connect_timeout=config.SUMMARY_CONNECT_TIMEOUT,
+            pool_size=config.SUMMARY_POOL_SIZE,
+            keep_alive=config.SUMMARY_KEEP_ALIVE
+        )
+    raise ValueError(f"未知的总结后端: {name}（可选: {', '.join(BACKENDS)}）")
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+论文总结缓存模块 / Paper Summary Cache Module
+按 (arXiv编号+版本, 语言, 提示词模板哈希, 模型, 温度) 持久化缓存生成的总结 /
+Persists generated summaries keyed by (arXiv id + version, language, prompt template hash, model, temperature)
+"""
+
+import hashlib
+import json
+from typing import Dict, List, Optional
+
+from disk_cache import DiskCache
+from paper_store import parse_arxiv_id
+
+
+class SummaryCache:
+    """
+    论文总结缓存 / Paper summary cache
+    提示词模板的哈希是键的一部分，修改提示词后旧总结自动失效 /
+    The prompt template hash is part of the key, so editing the prompt invalidates old summaries automatically
+    """
+
+    def __init__(self, db_path: str = "data/summary_cache.db", max_bytes: int = 20 * 1024 * 1024):
+        """
+        初始化缓存 / Initialize the cache
+
+        Args:
+            db_path: 缓存数据库路径 / Path of the cache database
+            max_bytes: 缓存总大小上限，超出时淘汰最久未使用的总结 / Size limit; least recently used summaries are evicted beyond it
+        """
+        self.store = DiskCache(db_path, max_bytes=max_bytes)
+
+    def make_key(self, url: str, language: str, prompt_template: str, model: str, temperature: float) -> str:
+        """
+        生成缓存键 / Build a cache key
+
+        Args:
+            url: 论文链接（含版本号）/ Paper url (with version)
+            language: 总结语言 / Summary language
+            prompt_template: 提示词模板（含系统提示）/ Prompt template (including the system prompt)
+            model: 模型名称 / Model name
+            temperature: 采样温度 / Sampling temperature
+        """
+        arxiv_id, version = parse_arxiv_id(url)
+        prompt_hash = hashlib.sha256(prompt_template.encode('utf-8')).hexdigest()[:16]
+        parts = [f"{arxiv_id}v{version}", language, prompt_hash, model, f"{temperature:g}"]
+        return hashlib.sha256(json.dumps(parts).encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """读取总结，未命中时返回 None / Read a summary, None on a miss"""
+        entry = self.store.get(key)
+        return entry['value'].decode('utf-8') if entry else None
+
+    def get_first(self, keys: List[str]) -> Optional[str]:
+        """
+        按顺序返回第一个命中的总结，整体计为一次命中或未命中 /
+        Return the first summary found in key order, counted as a single hit or miss
+        """
+        entry = self.store.get_first(keys)
+        return entry['value'].decode('utf-8') if entry else None
+
+    def set(self, key: str, summary: str):
+        """保存总结 / Store a summary"""
+        self.store.set(key, summary.encode('utf-8'))
+
+    def stats(self) -> Dict:
+        """返回命中、未命中和淘汰统计 / Return hit, miss and eviction statistics"""
+        return self.store.stats()
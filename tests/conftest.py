@@ -0,0 +1,88 @@
+"""
+测试公共配置 / Shared test configuration
+项目模块位于仓库根目录，测试直接导入 / Project modules live at the repository root and are imported directly
+"""
+
+import json
+import os
+import re
+import sys
+import threading
+import time
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from paper import Paper  # noqa: E402
+
+
+def build_paper(number: int, version: int = 1, submitted: str = "2024-01-15T12:00:00", **fields) -> Paper:
+    """生成测试用论文记录 / Build a paper record for tests"""
+    url = f"http://arxiv.org/abs/2401.{number:05d}v{version}"
+    values = dict(
+        title=f"Paper {number} on neural networks",
+        authors=["Alice", "Bob"],
+        abstract=f"We study neural networks in paper {number}. The results are strong.",
+        url=url,
+        pdf_url=url.replace('/abs/', '/pdf/'),
+        published=submitted[:10],
+        categories=["cs.LG"],
+        submitted=submitted
+    )
+    values.update(fields)
+    return Paper(**values)
+
+
+@pytest.fixture
+def make_paper():
+    return build_paper
+
+
+@pytest.fixture
+def non_utc_timezone(monkeypatch):
+    """
+    把本地时区设为UTC+8（POSIX写法，不依赖时区数据库），检查时间窗口不受主机时区影响 /
+    Set the local timezone to UTC+8 (POSIX form, no tz database needed) to check windows ignore the host timezone
+    """
+    if not hasattr(time, "tzset"):
+        pytest.skip("time.tzset is not available on this platform")
+    monkeypatch.setenv("TZ", "CST-8")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+class RecordingBackend:
+    """
+    记录请求的测试后端：合并请求返回以论文ID为键的JSON，双语请求返回中英文JSON，其余返回固定前缀加标题 /
+    Test backend that records prompts: batched prompts get JSON keyed by paper id, bilingual prompts get
+    Chinese/English JSON and everything else gets a fixed prefix plus the title
+    """
+
+    supports_batch = False
+
+    def __init__(self, reply: str = "summary of "):
+        self.reply = reply
+        self.prompts = []
+        self.fail_ids = set()
+        self._lock = threading.Lock()
+
+    def complete(self, **kwargs) -> str:
+        prompt = kwargs['messages'][-1]['content']
+        with self._lock:
+            self.prompts.append(prompt)
+        ids = re.findall(r'^ID: (\S+)$', prompt, re.MULTILINE)
+        if ids:
+            return json.dumps({i: f"{self.reply}{i}" for i in ids if i not in self.fail_ids})
+        title = re.search(r'(?:标题|Title)(?: / Title)?[：:] *(.*)', prompt).group(1)
+        if '"chinese"' in prompt and '"english"' in prompt:
+            return json.dumps({"chinese": f"中文 {title}", "english": f"English {title}"}, ensure_ascii=False)
+        return f"{self.reply}{title}"
+
+
+@pytest.fixture
+def backend():
+    return RecordingBackend()
@@ -0,0 +1,102 @@
+import pytest
+
+import summarizer as summarizer_module
+from rate_limiter import AdaptiveConcurrencyLimiter
+from summarizer import PaperSummarizer
+from summary_backends import BackendError, retry_after_seconds
+
+
+def test_limit_grows_additively_while_healthy():
+    limiter = AdaptiveConcurrencyLimiter(initial=2, max_limit=4, latency_target=1.0)
+    # 每完成约 limit 个请求加一 / One more per roughly limit completions
+    for _ in range(3):
+        limiter.acquire()
+        limiter.release(0.1)
+    assert limiter.limit == 3
+    for _ in range(10):
+        limiter.acquire()
+        limiter.release(0.1)
+    assert limiter.limit == 4
+
+    # 延迟超过目标时不再增加 / No growth while latency is over the target
+    limiter = AdaptiveConcurrencyLimiter(initial=2, max_limit=4, latency_target=1.0)
+    for _ in range(5):
+        limiter.acquire()
+        limiter.release(5.0)
+    assert limiter.limit == 2
+
+
+def test_one_burst_of_failures_halves_the_limit_once():
+    limiter = AdaptiveConcurrencyLimiter(initial=8, max_limit=8)
+    for _ in range(4):
+        limiter.acquire()
+    for _ in range(4):
+        limiter.release(0.5, overloaded=True)
+    assert limiter.limit == 4
+    assert limiter.stats()['decreases'] == 1
+    assert limiter.stats()['peak_in_flight'] == 4
+
+
+def test_retry_after_header_is_parsed():
+    assert retry_after_seconds({'retry-after': "3"}) == 3.0
+    assert retry_after_seconds({'retry-after-ms': "1500"}) == 1.5
+    assert retry_after_seconds({'retry-after': "soon"}) is None
+    assert retry_after_seconds(None) is None
+
+
+class FlakyBackend:
+    def __init__(self, errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def complete(self, **kwargs):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return "ok"
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    slept = []
+    monkeypatch.setattr(summarizer_module.time, "sleep", slept.append)
+    return slept
+
+
+def test_throttled_requests_are_retried(sleeps, make_paper):
+    backend = FlakyBackend([BackendError("slow down", 429, retry_after=2.0), BackendError("boom", 503)])
+    summarizer = PaperSummarizer(backend=backend, max_concurrency=1, batch_size=1)
+
+    assert summarizer.summarize_paper(make_paper(1), "english") == "ok"
+    assert backend.calls == 3
+    assert sleeps[0] == 2.0 and len(sleeps) == 2
+    assert summarizer.retries == 2 and summarizer.throttled == 1
+
+
+def test_client_errors_are_not_retried(sleeps, make_paper):
+    backend = FlakyBackend([BackendError("bad request", 400)])
+    summarizer = PaperSummarizer(backend=backend, max_concurrency=1, batch_size=1)
+
+    summarizer.summarize_paper(make_paper(1), "english")
+    assert backend.calls == 1 and sleeps == []
+
+
+def test_retries_stop_after_the_limit(sleeps, make_paper):
+    backend = FlakyBackend([BackendError("slow down", 429)] * 10)
+    summarizer = PaperSummarizer(backend=backend, max_concurrency=1, batch_size=1)
+    summarizer.max_retries = 2
+
+    summarizer.summarize_paper(make_paper(1), "english")
+    assert backend.calls == 3
+
+
+def test_unexpected_backend_failures_shrink_the_limit(sleeps, make_paper):
+    # 自定义后端抛出的超时等异常不是正常样本 / Timeouts and other errors from a custom backend are not healthy samples
+    backend = FlakyBackend([TimeoutError("read timed out")])
+    summarizer = PaperSummarizer(backend=backend, max_concurrency=8, batch_size=1)
+    before = summarizer.limiter.limit
+
+    assert "read timed out" in summarizer.summarize_paper(make_paper(1), "english")
+    stats = summarizer.limiter.stats()
+    assert stats['decreases'] == 1 and stats['increases'] == 0
+    assert summarizer.limiter.limit < before and summarizer.limiter.in_flight == 0
@@ -0,0 +1,87 @@
+import json
+from datetime import timedelta
+
+import pytest
+
+import config
+from main import ArxivPusher
+from paper_store import TIMESTAMP_FORMAT, utc_now
+from summarizer import PaperSummarizer
+
+
+@pytest.fixture
+def pusher(tmp_path, monkeypatch, backend, make_paper):
+    monkeypatch.chdir(tmp_path)
+    for name, value in [("OPENAI_API_KEY", None), ("SUMMARY_BACKEND", "openai"), ("PAPER_STORE_PATH", ""),
+                        ("HTTP_CACHE_PATH", ""), ("RATE_LIMIT_STATE_PATH", ""), ("REPORT_ARCHIVE_DIR", ""),
+                        ("REPORT_FRAGMENT_CACHE_PATH", "")]:
+        monkeypatch.setattr(config, name, value)
+    pusher = ArxivPusher()
+    pusher.summarizer = PaperSummarizer(backend=backend, max_concurrency=1, batch_size=1, cache=None)
+
+    papers = [
+        make_paper(1, title="Large language model alignment", submitted="2099-01-01T00:00:00"),
+        make_paper(2, title="Image segmentation", submitted="2099-01-01T00:00:00"),
+        make_paper(3, title="Language model for image captioning", submitted="2099-01-01T00:00:00")
+    ]
+    pusher.searches = []
+
+    def fake_search(keywords, days_back, local=False):
+        pusher.searches.append((keywords, days_back, pusher.fetcher.max_results))
+        return [paper.replace() for paper in papers]
+
+    pusher.fetcher.search_papers = fake_search
+    return pusher
+
+
+def write_profiles(tmp_path, profiles) -> str:
+    path = tmp_path / "profiles.json"
+    path.write_text(json.dumps(profiles), encoding='utf-8')
+    return str(path)
+
+
+def test_load_profiles_fills_defaults_and_validates(tmp_path, pusher):
+    path = write_profiles(tmp_path, [{"name": "nlp", "keywords": ["language model"]}])
+    assert pusher.load_profiles(path) == [{
+        'name': "nlp", 'keywords': ["language model"], 'days': config.DAYS_BACK,
+        'format': "html", 'language': config.SUMMARY_LANGUAGE
+    }]
+
+    with pytest.raises(ValueError):
+        pusher.load_profiles(write_profiles(tmp_path, [{"name": "empty", "keywords": []}]))
+
+
+def test_batch_fetches_once_and_summarizes_shared_papers_once(tmp_path, pusher, backend):
+    path = write_profiles(tmp_path, [
+        {"name": "nlp", "keywords": ["language model"], "days": 2, "language": "chinese"},
+        {"name": "vision", "keywords": ["Image", "LANGUAGE MODEL"], "days": 5, "language": "english"}
+    ])
+    results = pusher.run_batch(path, save_file=False)
+
+    assert len(pusher.searches) == 1
+    keywords, days, max_results = pusher.searches[0]
+    # 关键词忽略大小写去重 / Keywords are de-duplicated ignoring case
+    assert [keyword.lower() for keyword in keywords] == ["language model", "image"]
+    assert days == 5 and max_results == 2 * config.MAX_RESULTS
+
+    assert [paper['url'][-7:] for paper in results['nlp']] == ["00001v1", "00003v1"]
+    assert [paper['url'][-7:] for paper in results['vision']] == ["00001v1", "00002v1", "00003v1"]
+    # 中英文配置合并为一次双语请求，共享的论文只请求一次 / Chinese and English share one bilingual request per paper
+    assert len(backend.prompts) == 3
+    assert results['nlp'][0]['summary'] == "中文 Large language model alignment"
+    assert results['vision'][0]['summary'] == "English Large language model alignment"
+    assert 'summaries' not in results['nlp'][0]
+
+
+def test_profile_windows_are_computed_in_utc(tmp_path, pusher, make_paper, non_utc_timezone):
+    # 主机时区为UTC+8时，两天的窗口仍包含47小时前的论文 / At UTC+8 a two-day window still holds a paper from 47 hours ago
+    now = utc_now()
+    papers = [
+        make_paper(number, title="Language model", submitted=(now - timedelta(hours=hours)).strftime(TIMESTAMP_FORMAT))
+        for number, hours in [(1, 47), (2, 49)]
+    ]
+    pusher.fetcher.search_papers = lambda keywords, days_back, local=False: [paper.replace() for paper in papers]
+
+    path = write_profiles(tmp_path, [{"name": "nlp", "keywords": ["language model"], "days": 2}])
+    results = pusher.run_batch(path, save_file=False)
+    assert [paper['url'][-7:] for paper in results['nlp']] == ["00001v1"]
@@ -0,0 +1,55 @@
+import json
+
+from conftest import RecordingBackend
+from summarizer import BILINGUAL, ERROR_PREFIX, PaperSummarizer
+from summary_cache import SummaryCache
+
+
+class ChineseOnlyBackend(RecordingBackend):
+    """双语请求只返回中文部分 / Bilingual prompts only get the Chinese half back"""
+
+    def complete(self, **kwargs) -> str:
+        reply = super().complete(**kwargs)
+        if reply.startswith("{"):
+            return json.dumps({"chinese": json.loads(reply)["chinese"]}, ensure_ascii=False)
+        return reply
+
+
+def test_one_request_yields_both_languages(backend, make_paper):
+    summarizer = PaperSummarizer(backend=backend, max_concurrency=1, batch_size=4)
+    paper = summarizer.summarize_papers([make_paper(1)], BILINGUAL)[0]
+
+    assert len(backend.prompts) == 1
+    assert paper['summaries'] == {'chinese': "中文 Paper 1 on neural networks",
+                                  'english': "English Paper 1 on neural networks"}
+    assert paper['summary'] == paper['summaries']['chinese']
+
+
+def test_missing_half_is_requested_and_cached_under_its_own_prompt(tmp_path, make_paper):
+    cache = SummaryCache(str(tmp_path / "summaries.db"))
+    backend = ChineseOnlyBackend()
+    summarizer = PaperSummarizer(backend=backend, cache=cache, max_concurrency=1, batch_size=1)
+
+    paper = summarizer.summarize_papers([make_paper(1)], BILINGUAL)[0]
+    assert len(backend.prompts) == 2
+    assert paper['summaries']['english'] == "summary of Paper 1 on neural networks"
+
+    # 单独生成的英文总结用单语言提示词的键保存，单语言运行和下一次双语运行都能复用 /
+    # The separately generated English half is keyed by the single-language prompt and reused by both modes
+    english = summarizer.summarize_papers([make_paper(1)], "english")[0]
+    assert english['summary'] == "summary of Paper 1 on neural networks"
+    summarizer.summarize_papers([make_paper(1)], BILINGUAL)
+    assert len(backend.prompts) == 2
+
+
+def test_errors_use_the_requested_language(make_paper):
+    class FailingBackend:
+        def complete(self, **kwargs):
+            raise RuntimeError("down")
+
+    summarizer = PaperSummarizer(backend=FailingBackend(), max_concurrency=1, batch_size=1)
+    assert summarizer.summarize_paper(make_paper(1), "english") == ERROR_PREFIX['english'] + "down"
+    assert summarizer.summarize_paper(make_paper(1), "chinese") == ERROR_PREFIX['chinese'] + "down"
+
+    halves = summarizer.summarize_bilingual(make_paper(1))
+    assert halves == {language: prefix + "down" for language, prefix in ERROR_PREFIX.items()}
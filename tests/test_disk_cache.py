@@ -0,0 +1,95 @@
+import itertools
+
+import pytest
+
+import disk_cache
+from disk_cache import DiskCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = {'value': 1_000_000.0}
+    ticks = itertools.count()
+
+    def time():
+        return now['value'] + next(ticks) * 1e-3
+
+    monkeypatch.setattr(disk_cache.time, "time", time)
+    return now
+
+
+def test_get_respects_ttl(tmp_path, clock):
+    cache = DiskCache(str(tmp_path / "cache.db"), ttl=60)
+    cache.set("key", b"value", {'etag': "x"})
+
+    entry = cache.get("key")
+    assert entry['value'] == b"value" and entry['meta'] == {'etag': "x"}
+
+    clock['value'] += 120
+    assert cache.get("key") is None
+    assert cache.peek("key")['value'] == b"value"
+    assert cache.stats()['hits'] == 1 and cache.stats()['misses'] == 1
+
+
+def test_eviction_drops_least_recently_used(tmp_path, clock):
+    cache = DiskCache(str(tmp_path / "cache.db"), max_bytes=30)
+    for key in "abc":
+        cache.set(key, b"x" * 10)
+    cache.get("a")
+    cache.set("d", b"x" * 10)
+
+    assert cache.peek("a") is not None
+    assert cache.peek("b") is None
+    assert cache.stats()['evictions'] == 1
+
+
+def test_mark_accessed_keeps_the_lifetime(tmp_path, clock):
+    cache = DiskCache(str(tmp_path / "cache.db"), max_bytes=20, ttl=60)
+    cache.set("a", b"x" * 10)
+    cache.set("b", b"x" * 10)
+    clock['value'] += 50
+    cache.mark_accessed("a")
+    cache.set("c", b"x" * 10)
+
+    assert cache.peek("b") is None
+    clock['value'] += 20
+    assert cache.get("a") is None
+
+
+def test_get_many_and_set_many(tmp_path):
+    cache = DiskCache(str(tmp_path / "cache.db"))
+    cache.set_many({f"k{i}": str(i).encode() for i in range(1200)})
+
+    found = cache.get_many([f"k{i}" for i in range(0, 1300, 100)])
+    assert sorted(found) == sorted(f"k{i}" for i in range(0, 1200, 100))
+    assert found["k300"]['value'] == b"300"
+    assert cache.stats()['misses'] == 1
+
+
+def test_get_first_prefers_earlier_keys_and_counts_once(tmp_path):
+    cache = DiskCache(str(tmp_path / "cache.db"))
+    cache.set("b", b"second")
+    cache.set("c", b"third")
+
+    assert cache.get_first(["a", "b", "c"])['value'] == b"second"
+    assert cache.get_first(["x", "y"]) is None
+    assert cache.stats()['hits'] == 1 and cache.stats()['misses'] == 1
+
+
+def test_connections_are_closed_after_each_operation(tmp_path, monkeypatch):
+    opened = []
+    connect = disk_cache.sqlite3.connect
+
+    def tracking_connect(*args, **kwargs):
+        opened.append(connect(*args, **kwargs))
+        return opened[-1]
+
+    monkeypatch.setattr(disk_cache.sqlite3, "connect", tracking_connect)
+    cache = DiskCache(str(tmp_path / "cache.db"))
+    cache.set("a", b"value")
+    assert cache.get("a")['value'] == b"value"
+
+    assert len(opened) >= 3
+    for conn in opened:
+        with pytest.raises(disk_cache.sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
@@ -0,0 +1,61 @@
+from extractive_summarizer import EXTRACT_PREFIX, ExtractiveSummarizer, sentence_spans, split_sentences
+
+ABSTRACT = ("Graph neural networks learn node embeddings. We propose a sparse graph neural network for "
+            "large graphs. Lunch was served at noon. The sparse graph network reaches 93.5% accuracy, "
+            "e.g. on Cora.")
+
+
+def test_split_sentences_keeps_decimals_and_abbreviations():
+    assert split_sentences(ABSTRACT) == [
+        "Graph neural networks learn node embeddings.",
+        "We propose a sparse graph neural network for large graphs.",
+        "Lunch was served at noon.",
+        "The sparse graph network reaches 93.5% accuracy, e.g. on Cora."
+    ]
+    assert split_sentences("本文提出了新方法。效果很好！") == ["本文提出了新方法。", "效果很好！"]
+    assert split_sentences("  ") == []
+
+
+def test_sentence_spans_point_into_the_original_text():
+    text = "First  sentence.\nSecond one, cf. Smith et al. 2020. Third."
+    assert [text[start:end] for start, end in sentence_spans(text)] == [
+        "First  sentence.", "Second one, cf. Smith et al. 2020.", "Third."
+    ]
+
+
+def test_extract_prefers_central_sentences_in_original_order(make_paper):
+    summarizer = ExtractiveSummarizer(max_sentences=2, max_chars=400)
+    paper = make_paper(1, title="Sparse graph neural networks", abstract=ABSTRACT)
+    other = make_paper(2)
+
+    extract = summarizer.extract([paper, other])[0]
+    assert "Lunch" not in extract
+    assert extract == ("We propose a sparse graph neural network for large graphs. "
+                       "The sparse graph network reaches 93.5% accuracy, e.g. on Cora.")
+
+
+def test_extract_respects_character_limit(make_paper):
+    summarizer = ExtractiveSummarizer(max_sentences=3, max_chars=40)
+    extract = summarizer.extract([make_paper(1, abstract=ABSTRACT)])[0]
+    assert len(extract) <= 43 and extract.endswith("...")
+    assert summarizer.extract([make_paper(2, abstract="")]) == [""]
+
+
+def test_summaries_carry_the_language_prefix(make_paper):
+    summarizer = ExtractiveSummarizer()
+    paper = make_paper(1, abstract=ABSTRACT)
+    assert summarizer.summarize_paper(paper, "english").startswith(EXTRACT_PREFIX['english'])
+
+    papers = summarizer.summarize_papers([paper, make_paper(2)], "bilingual")
+    # 双语时两种语言共用同一段抽取结果 / Both languages share one extract
+    summaries = papers[0]['summaries']
+    assert summaries['chinese'][len(EXTRACT_PREFIX['chinese']):] == summaries['english'][len(EXTRACT_PREFIX['english']):]
+    assert papers[0]['summary'] == summaries['chinese']
+    assert summarizer.last_run_stats['papers'] == 2
+
+
+def test_iter_summaries_yields_every_index_once(make_paper):
+    papers = [make_paper(number) for number in range(5)]
+    indices = [index for index, _ in ExtractiveSummarizer().iter_summaries(papers, "chinese", chunk_size=2)]
+    assert indices == [0, 1, 2, 3, 4]
+    assert all(paper['summary'].startswith(EXTRACT_PREFIX['chinese']) for paper in papers)
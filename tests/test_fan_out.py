@@ -0,0 +1,34 @@
+from arxiv_fetcher import ArxivFetcher
+
+
+def test_merge_results_keeps_latest_version_sorted_by_submission(make_paper):
+    fetcher = ArxivFetcher()
+    merged = fetcher.merge_results([
+        [make_paper(1, submitted="2024-01-10T00:00:00"), make_paper(2, submitted="2024-01-12T00:00:00")],
+        [make_paper(1, version=2, submitted="2024-01-14T00:00:00"), make_paper(3, submitted="2024-01-11T00:00:00")],
+        [make_paper(2, submitted="2024-01-12T00:00:00")]
+    ])
+    assert [paper['url'][-7:] for paper in merged] == ["00001v2", "00002v1", "00003v1"]
+
+
+def test_fan_out_runs_one_query_per_keyword_chunk(make_paper):
+    fetcher = ArxivFetcher(max_results=3, fan_out=True, chunk_size=2, max_workers=3)
+    results = {
+        fetcher.build_query(["a", "b"]): [make_paper(1, submitted="2024-01-10T00:00:00"),
+                                          make_paper(2, submitted="2024-01-13T00:00:00")],
+        fetcher.build_query(["c", "d"]): [make_paper(2, submitted="2024-01-13T00:00:00"),
+                                          make_paper(3, submitted="2024-01-12T00:00:00")],
+        fetcher.build_query(["e"]): [make_paper(4, submitted="2024-01-09T00:00:00")]
+    }
+    queries = []
+
+    def fake_query(query, cutoff_date, client):
+        queries.append(query)
+        return results[query], fetcher._empty_fetch_stats()
+
+    fetcher._search_query = fake_query
+    papers = fetcher.search_papers(["a", "b", "c", "d", "e"], days_back=7)
+
+    assert sorted(queries) == sorted(results)
+    assert [paper['url'][-7:] for paper in papers] == ["00002v1", "00003v1", "00001v1"]
+    assert [stats['results'] for stats in fetcher.last_query_stats] == [2, 2, 1]
@@ -0,0 +1,55 @@
+import config
+from fragment_cache import FragmentCache
+from report_generator import ReportGenerator
+
+URL = "http://arxiv.org/abs/2401.00001v1"
+SECTIONS = [("总结", "summary")]
+
+
+def test_key_depends_on_version_summary_format_and_template():
+    cache = FragmentCache(None)
+    key = cache.make_key(URL, "html", ["chinese"], SECTIONS, "template")
+    assert key == cache.make_key(URL, "html", ["chinese"], SECTIONS, "template")
+    assert len({
+        key,
+        cache.make_key(URL.replace("v1", "v2"), "html", ["chinese"], SECTIONS, "template"),
+        cache.make_key(URL, "html", ["chinese"], [("总结", "other")], "template"),
+        cache.make_key(URL, "markdown", ["chinese"], SECTIONS, "template"),
+        cache.make_key(URL, "html", ["chinese", "english"], SECTIONS, "template"),
+        cache.make_key(URL, "html", ["chinese"], SECTIONS, "template 2")
+    }) == 6
+
+
+def test_memory_cache_evicts_least_recently_used():
+    cache = FragmentCache(None, memory_bytes=10)
+    cache.set_many({"a": "aaaa", "b": "bbbb"})
+    assert cache.get_many(["a"]) == {"a": "aaaa"}
+    cache.set_many({"c": "cccc"})
+
+    assert cache.get_many(["a", "b", "c"]) == {"a": "aaaa", "c": "cccc"}
+    assert cache.stats()['evictions'] == 1
+
+
+def test_disk_cache_is_shared_across_instances_after_flush(tmp_path):
+    path = str(tmp_path / "fragments.db")
+    first = FragmentCache(path)
+    first.set_many({"a": "片段"})
+    assert FragmentCache(path).get_many(["a"]) == {}
+
+    first.flush()
+    assert FragmentCache(path).get_many(["a"]) == {"a": "片段"}
+
+
+def test_default_config_reuses_fragments_across_runs(tmp_path, monkeypatch, make_paper):
+    # 默认配置下片段写入磁盘，次日的新进程仍能复用 / By default fragments go to disk and a later process reuses them
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(config, "REPORT_SKIP_UNCHANGED", False)
+    papers = [make_paper(1, summary="one"), make_paper(2, summary="two")]
+
+    ReportGenerator.from_config().generate_html_report(papers, ["ml"])
+    assert (tmp_path / "data" / "fragment_cache.db").exists()
+
+    reporter = ReportGenerator.from_config()
+    reporter.generate_html_report(papers + [make_paper(3, summary="three")], ["ml"])
+    assert reporter.last_render_stats['fragment_hits'] == 2
+    assert reporter.last_render_stats['fragment_misses'] == 1
@@ -0,0 +1,119 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from arxiv_fetcher import ArxivFetcher
+from paper_index import PaperIndex
+from summarizer import PaperSummarizer
+
+ENTRY = """
+  <entry>
+    <id>oai:arXiv.org:{arxiv_id}</id>
+    <title>{title}</title>
+    <summary>arXiv:{arxiv_id} Announce Type: new
+Abstract: {abstract}</summary>
+    <dc:creator>Alice Smith, Bob Jones</dc:creator>
+    <category term="cs.LG"/>
+    <published>{published}</published>
+  </entry>"""
+
+FEED = """<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom" xmlns:dc="http://purl.org/dc/elements/1.1/">
+  <title>cs.LG updates on arXiv.org</title>{entries}
+</feed>"""
+
+
+class FakeResponse:
+    def __init__(self, content: bytes):
+        self.content = content
+
+    def raise_for_status(self):
+        pass
+
+
+def make_feed(entries, hours_ago: float = 2) -> bytes:
+    published = (datetime.now(timezone.utc) - timedelta(hours=hours_ago)).strftime('%Y-%m-%dT%H:%M:%SZ')
+    return FEED.format(entries="".join(
+        ENTRY.format(arxiv_id=arxiv_id, title=title, abstract=abstract, published=published)
+        for arxiv_id, title, abstract in entries
+    )).encode('utf-8')
+
+
+@pytest.fixture
+def harvest_fetcher():
+    fetcher = ArxivFetcher(max_results=10)
+    feed = make_feed([
+        ("2401.00001v1", "Sparse  attention\n for transformers", "We make attention sparse."),
+        ("2401.00002v2", "Graph learning", "A study of graph neural networks."),
+        ("2401.00003v1", "Protein folding", "Nothing about the other topics.")
+    ])
+    fetcher.requested = []
+
+    def fake_get(url, timeout=None):
+        fetcher.requested.append(url)
+        return FakeResponse(feed)
+
+    fetcher.session.get = fake_get
+    return fetcher
+
+
+def test_harvest_parses_feed_entries(harvest_fetcher):
+    papers = harvest_fetcher.harvest_category_feed(["cs.LG", "cs.AI"])
+    assert harvest_fetcher.requested == ["https://rss.arxiv.org/atom/cs.AI+cs.LG"]
+
+    first = next(paper for paper in papers if paper['url'].endswith("00001v1"))
+    assert first['title'] == "Sparse attention for transformers"
+    assert first['abstract'] == "We make attention sparse."
+    assert first['authors'] == ("Alice Smith", "Bob Jones")
+    assert first['categories'] == ("cs.LG",)
+    assert first['pdf_url'] == "http://arxiv.org/pdf/2401.00001v1"
+
+
+def test_harvest_downloads_each_category_set_once(harvest_fetcher):
+    harvest_fetcher.harvest_category_feed(["cs.LG"])
+    harvest_fetcher.harvest_category_feed(["cs.LG"])
+    harvest_fetcher.harvest_papers(["graph neural networks"], categories=["cs.LG"])
+    assert len(harvest_fetcher.requested) == 1
+
+
+def test_harvest_matches_keyword_phrases_locally(harvest_fetcher):
+    papers = harvest_fetcher.harvest_papers(["sparse attention", "graph neural  networks"], categories=["cs.LG"])
+    assert sorted(paper['url'][-7:] for paper in papers) == ["00001v1", "00002v2"]
+
+
+def test_blank_keywords_match_nothing(harvest_fetcher):
+    pattern = harvest_fetcher.compile_keywords(["", "   "])
+    assert not pattern.search("anything at all")
+    assert harvest_fetcher.harvest_papers(["  "], categories=["cs.LG"]) == []
+
+    pattern = harvest_fetcher.compile_keywords(["", "attention"])
+    assert pattern.search("Sparse ATTENTION")
+    assert not pattern.search("attentions")
+
+
+def test_harvest_hands_out_copies_of_cached_papers(harvest_fetcher, backend):
+    harvest_fetcher.index = PaperIndex()
+    summarizer = PaperSummarizer(backend=backend, max_concurrency=1, batch_size=1)
+
+    backend.reply = "中文总结 "
+    first = summarizer.summarize_papers(harvest_fetcher.harvest_papers(["attention"], categories=["cs.LG"]), "chinese")
+    second = harvest_fetcher.harvest_papers(["attention"], categories=["cs.LG"])
+    assert len(harvest_fetcher.requested) == 1
+    # 第二次获取不带上一次的总结 / The second harvest does not carry the previous run's summaries
+    assert 'summary' not in second[0]
+
+    backend.reply = "English summary "
+    summarizer.summarize_papers(second, "english")
+    assert first[0]['summary'].startswith("中文总结")
+    assert second[0]['summary'].startswith("English summary")
+    assert 'summary' not in harvest_fetcher.harvest_papers(["attention"], categories=["cs.LG"])[0]
+    assert all('summary' not in paper for _, paper in harvest_fetcher.index.search(["attention"]))
+
+
+@pytest.mark.parametrize("hours_ago, kept", [(47, 1), (49, 0)])
+def test_harvest_window_is_computed_in_utc(hours_ago, kept, non_utc_timezone):
+    # 主机时区为UTC+8时窗口边界不应偏移8小时 / At UTC+8 the window edge must not shift by eight hours
+    fetcher = ArxivFetcher(max_results=10)
+    feed = make_feed([("2401.00002v1", "Graph learning", "A study of graph neural networks.")], hours_ago)
+    fetcher.session.get = lambda url, timeout=None: FakeResponse(feed)
+    assert len(fetcher.harvest_papers(["graph neural networks"], categories=["cs.LG"], days_back=2)) == kept
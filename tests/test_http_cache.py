@@ -0,0 +1,95 @@
+import itertools
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+import disk_cache
+from arxiv_fetcher import ThrottledSession
+from http_cache import ResponseCache, normalize_url
+from rate_limiter import TokenBucket
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """让磁盘缓存的时间每次读取前进一秒 / Make the disk cache clock advance one second per read"""
+    ticks = itertools.count(1_000_000)
+    monkeypatch.setattr(disk_cache.time, "time", lambda: float(next(ticks)))
+
+
+class FakeAdapter(HTTPAdapter):
+    """返回固定响应体，支持 ETag 条件请求 / Serves a fixed body and honours ETag conditional requests"""
+
+    def __init__(self):
+        super().__init__()
+        self.sent = []
+
+    def send(self, request, **kwargs):
+        self.sent.append(request)
+        response = requests.Response()
+        response.url = request.url
+        response.request = request
+        if request.headers.get('If-None-Match') == '"v1"':
+            response.status_code = 304
+            response._content = b""
+        else:
+            response.status_code = 200
+            response._content = f"body of {request.url}".encode('utf-8')
+            response.headers = CaseInsensitiveDict({'ETag': '"v1"', 'Content-Type': 'application/atom+xml'})
+        return response
+
+
+def make_session(cache):
+    adapter = FakeAdapter()
+    return ThrottledSession(TokenBucket(rate=1e9, capacity=1e9), cache, adapter), adapter
+
+
+def test_normalize_url_sorts_query_and_lowercases_host():
+    assert normalize_url("HTTP://Export.arXiv.org/api/query?b=2&a=1") == "http://export.arxiv.org/api/query?a=1&b=2"
+
+
+def test_fresh_hit_skips_the_network(tmp_path):
+    cache = ResponseCache(str(tmp_path / "http.db"), ttl=600)
+    session, adapter = make_session(cache)
+
+    first = session.get("http://example.org/api?q=1")
+    second = session.get("http://example.org/api?q=1")
+
+    assert len(adapter.sent) == 1
+    assert second.content == first.content
+    assert second.headers['X-Cache'] == "HIT"
+    assert cache.stats()['hits'] == 1 and cache.stats()['misses'] == 1
+
+
+def test_expired_entry_is_revalidated_with_etag(tmp_path):
+    cache = ResponseCache(str(tmp_path / "http.db"), ttl=0)
+    session, adapter = make_session(cache)
+
+    first = session.get("http://example.org/api?q=1")
+    second = session.get("http://example.org/api?q=1")
+
+    assert adapter.sent[1].headers['If-None-Match'] == '"v1"'
+    assert second.status_code == 200 and second.content == first.content
+    assert cache.stats()['revalidated'] == 1
+
+
+def test_served_hits_keep_entries_from_eviction(tmp_path, clock):
+    url = "http://example.org/api?q={}".format
+    size = len(f"body of {url(0)}")
+    cache = ResponseCache(str(tmp_path / "http.db"), ttl=10 ** 9, max_bytes=3 * size)
+    session, adapter = make_session(cache)
+
+    for i in range(3):
+        session.get(url(i))
+    created = cache.store.peek(normalize_url(url(0)))['age']
+    # 最早写入的条目被命中后变为最近使用 / The oldest entry becomes most recently used once it is served
+    session.get(url(0))
+    session.get(url(3))
+
+    assert cache.store.peek(normalize_url(url(0))) is not None
+    assert cache.store.peek(normalize_url(url(1))) is None
+    assert cache.store.peek(normalize_url(url(2))) is not None
+    assert len(adapter.sent) == 4
+    # 命中不会重置有效期 / A hit does not restart the lifetime
+    assert cache.store.peek(normalize_url(url(0)))['age'] > created
@@ -0,0 +1,48 @@
+from datetime import timedelta
+
+from arxiv_fetcher import ArxivFetcher
+from paper_store import PaperStore, TIMESTAMP_FORMAT, utc_now
+
+
+def test_incremental_fetch_only_requests_newer_papers(tmp_path, make_paper):
+    now = utc_now().replace(microsecond=0)
+    fetcher = ArxivFetcher(max_results=10, store=PaperStore(str(tmp_path / "papers.db")), incremental=True)
+    calls = []
+    batches = [
+        [make_paper(2, submitted=(now - timedelta(hours=5)).strftime(TIMESTAMP_FORMAT)),
+         make_paper(1, submitted=(now - timedelta(hours=30)).strftime(TIMESTAMP_FORMAT))],
+        [make_paper(3, submitted=(now - timedelta(hours=1)).strftime(TIMESTAMP_FORMAT))]
+    ]
+
+    def fake_fetch(query, since, client):
+        calls.append(since)
+        return batches[len(calls) - 1], True, fetcher._empty_fetch_stats()
+
+    fetcher._fetch_remote = fake_fetch
+
+    first = fetcher.search_papers(["neural networks"], days_back=2)
+    second = fetcher.search_papers(["neural networks"], days_back=2)
+
+    assert [paper['url'][-7:] for paper in first] == ["00002v1", "00001v1"]
+    # 第二次只获取上次最新论文之后的部分，旧论文来自本地存储 / The second run only fetches past the newest paper seen
+    assert calls[1] == now - timedelta(hours=5)
+    assert [paper['url'][-7:] for paper in second] == ["00003v1", "00002v1", "00001v1"]
+
+
+def test_cutoff_is_computed_in_utc(tmp_path, make_paper, non_utc_timezone):
+    # 主机时区为UTC+8时，47小时前提交的论文仍在两天的窗口内 / At UTC+8 a paper from 47 hours ago is still within two days
+    now = utc_now().replace(microsecond=0)
+    fetcher = ArxivFetcher(max_results=10, store=PaperStore(str(tmp_path / "papers.db")), incremental=True)
+    calls = []
+
+    def fake_fetch(query, since, client):
+        calls.append(since)
+        return [make_paper(2, submitted=(now - timedelta(hours=1)).strftime(TIMESTAMP_FORMAT)),
+                make_paper(1, submitted=(now - timedelta(hours=47)).strftime(TIMESTAMP_FORMAT))], True, \
+            fetcher._empty_fetch_stats()
+
+    fetcher._fetch_remote = fake_fetch
+
+    papers = fetcher.search_papers(["neural networks"], days_back=2)
+    assert abs(calls[0] - (now - timedelta(days=2))) < timedelta(minutes=1)
+    assert [paper['url'][-7:] for paper in papers] == ["00002v1", "00001v1"]
@@ -0,0 +1,47 @@
+import os
+import sys
+from datetime import timedelta
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+
+from arxiv_fetcher import ArxivFetcher  # noqa: E402
+from mock_servers import MockServer  # noqa: E402
+from paper_store import utc_now  # noqa: E402
+from rate_limiter import TokenBucket  # noqa: E402
+
+
+@pytest.fixture
+def server(non_utc_timezone):
+    # 主机时区不是UTC时获取器的窗口也必须与按GMT计算的模拟数据一致 /
+    # The fetcher's window must match the GMT mock data even when the host is not on UTC
+    with MockServer(total_papers=200, days=10) as mock:
+        yield mock
+
+
+def test_date_window_selects_papers_inside_it(server):
+    now = server._now
+    query = f"(ti:\"x\") AND submittedDate:[{(now - timedelta(days=5)).strftime('%Y%m%d%H%M')} TO " \
+            f"{(now + timedelta(days=1)).strftime('%Y%m%d%H%M')}]"
+    first, last = server.date_window(query)
+    assert first == 0
+    assert 95 <= last <= 100
+    assert server.date_window('ti:"x"') == (0, 200)
+
+    upper = (now - timedelta(days=8)).strftime('%Y%m%d%H%M')
+    first, last = server.date_window(f"submittedDate:[{(now - timedelta(days=20)).strftime('%Y%m%d%H%M')} TO {upper}]")
+    assert 158 <= first <= 160 and last == 200
+
+
+def test_fetch_only_pages_through_the_window(server):
+    fetcher = ArxivFetcher(max_results=500, limiter=TokenBucket(rate=1e9, capacity=1e9), api_url=server.arxiv_api_url)
+    papers = fetcher.search_papers(["x"], days_back=3)
+
+    stats = fetcher.last_query_stats[0]
+    cutoff = (utc_now() - timedelta(days=3)).strftime('%Y-%m-%dT%H:%M:%S')
+    assert 55 <= len(papers) <= 60
+    assert all(paper['submitted'] >= cutoff for paper in papers)
+    # 窗口外的论文不会被传输；按小时取整的下界最多多出一小时的条目 / Papers outside the window are never sent
+    assert stats['pages'] == 1
+    assert stats['entries'] - len(papers) <= 1
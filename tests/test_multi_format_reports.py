@@ -0,0 +1,44 @@
+import json
+import xml.etree.ElementTree as ElementTree
+
+import pytest
+
+from report_generator import ReportGenerator
+
+ATOM = "{http://www.w3.org/2005/Atom}"
+
+
+def test_all_formats_are_written_in_one_pass(tmp_path, make_paper):
+    reporter = ReportGenerator(output_dir=str(tmp_path))
+    papers = [make_paper(1, summary="one & <two>"), make_paper(2, summary="three")]
+    consumed = []
+
+    def stream():
+        for paper in papers:
+            consumed.append(paper['url'])
+            yield paper
+
+    paths = reporter.save_reports(stream(), ["ml"], ["html", "md", "jsonl", "atom"], name="daily")
+    # 论文只被遍历一次 / The papers are iterated once
+    assert len(consumed) == 2
+    assert list(paths) == ["html", "markdown", "jsonl", "atom"]
+    assert paths['markdown'].endswith(".md") and paths['atom'].endswith(".xml")
+    assert "daily_" in paths['html']
+
+    records = [json.loads(line) for line in open(paths['jsonl'], encoding='utf-8')]
+    assert [record['id'] for record in records] == ["2401.00001v1", "2401.00002v1"]
+    assert records[0]['summary'] == "one & <two>"
+
+    feed = ElementTree.parse(paths['atom']).getroot()
+    entries = feed.findall(f"{ATOM}entry")
+    assert [entry.find(f"{ATOM}id").text for entry in entries] == [paper['url'] for paper in papers]
+    assert entries[0].find(f"{ATOM}summary").text == "总结: one & <two>"
+    assert entries[0].find(f"{ATOM}updated").text == "2024-01-15T12:00:00Z"
+
+    assert "**论文数量:** 2" in open(paths['markdown'], encoding='utf-8').read()
+    assert "📊 共找到 2 篇相关论文" in open(paths['html'], encoding='utf-8').read()
+
+
+def test_unknown_format_is_rejected(tmp_path, make_paper):
+    with pytest.raises(ValueError):
+        ReportGenerator(output_dir=str(tmp_path)).save_reports([make_paper(1)], ["ml"], ["pdf"])
@@ -0,0 +1,49 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+
+from mock_servers import MockServer  # noqa: E402
+from summarizer import PaperSummarizer  # noqa: E402
+from summary_backends import OpenAIBackend  # noqa: E402
+from summary_cache import SummaryCache  # noqa: E402
+
+
+@pytest.fixture
+def server():
+    with MockServer(batch_delay=0.05) as mock:
+        yield mock
+
+
+def test_offline_batch_summarizes_uncached_papers(tmp_path, server, make_paper):
+    cache = SummaryCache(str(tmp_path / "summaries.db"))
+    summarizer = PaperSummarizer(backend=OpenAIBackend("test", base_url=server.openai_base_url), cache=cache)
+    expected = server.completion['choices'][0]['message']['content'].strip()
+
+    papers = summarizer.summarize_papers_offline([make_paper(i) for i in range(3)], "chinese", poll_interval=0.01)
+    assert [paper['summary'] for paper in papers] == [expected] * 3
+    assert len(server.batches) == 1
+    assert summarizer.last_run_stats['batch_requests'] == 3
+    assert summarizer.last_run_stats['batch_fallbacks'] == 0
+
+    # 结果已写入缓存，第二次无需再提交任务 / Results are cached, so a second run submits nothing
+    summarizer.summarize_papers_offline([make_paper(i) for i in range(3)], "chinese", poll_interval=0.01)
+    assert len(server.batches) == 1
+
+
+def test_timed_out_batch_is_cancelled_and_run_synchronously(server, make_paper):
+    server.batch_delay = 60
+    summarizer = PaperSummarizer(backend=OpenAIBackend("test", base_url=server.openai_base_url), batch_size=1)
+
+    papers = summarizer.summarize_papers_offline([make_paper(1)], "english", poll_interval=0.01, timeout=0.05)
+    assert next(iter(server.batches.values()))['status'] == "cancelled"
+    assert papers[0]['summary'] == server.completion['choices'][0]['message']['content'].strip()
+    assert summarizer.last_run_stats['batch_fallbacks'] == 1
+
+
+def test_backend_without_batch_support_runs_synchronously(backend, make_paper):
+    summarizer = PaperSummarizer(backend=backend, max_concurrency=1, batch_size=1)
+    papers = summarizer.summarize_papers_offline([make_paper(1)], "chinese")
+    assert papers[0]['summary'] == "summary of Paper 1 on neural networks"
@@ -0,0 +1,85 @@
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from arxiv_fetcher import ArxivFetcher
+from paper_store import TIMESTAMP_FORMAT, utc_now
+
+
+class FakeClient:
+    """按提交时间倒序返回结果的假客户端 / Fake client returning results newest first"""
+
+    def __init__(self, results):
+        self.results_list = results
+        self.page_size = 100
+        self.searches = []
+        self._session = SimpleNamespace(request_count=0, bytes_received=0)
+
+    def results(self, search, offset=0):
+        self.searches.append((search.query, offset, search.max_results))
+        self._session.request_count += 1
+        yield from self.results_list[offset:search.max_results]
+
+
+def make_results(count, hours_apart):
+    now = datetime.now(timezone.utc)
+    return [SimpleNamespace(
+        title=f"Paper {i}", authors=["Alice"], summary="Abstract.", pdf_url=f"http://arxiv.org/pdf/2401.{i:05d}v1",
+        entry_id=f"http://arxiv.org/abs/2401.{i:05d}v1", categories=["cs.LG"],
+        published=now - timedelta(hours=hours_apart * (i + 1))
+    ) for i in range(count)]
+
+
+def test_paging_stops_at_the_cutoff():
+    fetcher = ArxivFetcher(max_results=50)
+    client = FakeClient(make_results(200, hours_apart=1))
+    since = utc_now() - timedelta(hours=10, minutes=30)
+
+    papers, exhausted, stats = fetcher._fetch_remote('ti:"x"', since, client)
+
+    assert len(papers) == 10
+    assert exhausted
+    assert stats['entries'] == 11 and stats['discarded'] == 1
+    # 截止时间之后不再请求下一页 / No further page is requested past the cutoff
+    assert len(client.searches) == 1
+    assert 'submittedDate:[' in client.searches[0][0]
+
+
+def test_window_does_not_depend_on_the_host_timezone(non_utc_timezone):
+    # arXiv按GMT解释 submittedDate，主机时区为UTC+8时窗口也不能偏移 / arXiv reads submittedDate as GMT
+    fetcher = ArxivFetcher(max_results=50)
+    client = FakeClient(make_results(200, hours_apart=1))
+    since = utc_now() - timedelta(hours=10, minutes=30)
+
+    papers, exhausted, _ = fetcher._fetch_remote('ti:"x"', since, client)
+
+    assert len(papers) == 10 and exhausted
+    assert f"submittedDate:[{since.strftime('%Y%m%d%H00')} TO " in client.searches[0][0]
+    newest = datetime.strptime(papers[0]['submitted'], TIMESTAMP_FORMAT)
+    assert abs(newest - (utc_now() - timedelta(hours=1))) < timedelta(minutes=1)
+
+
+def test_paging_stops_once_enough_papers_are_found():
+    fetcher = ArxivFetcher(max_results=5)
+    client = FakeClient(make_results(200, hours_apart=1))
+
+    papers, exhausted, stats = fetcher._fetch_remote('ti:"x"', utc_now() - timedelta(days=30), client)
+
+    assert [paper['url'][-7:] for paper in papers] == [f"{i:05d}v1" for i in range(5)]
+    assert not exhausted
+    assert client.searches == [(client.searches[0][0], 0, 5)]
+
+
+def test_short_page_means_results_are_exhausted():
+    fetcher = ArxivFetcher(max_results=50)
+    client = FakeClient(make_results(3, hours_apart=1))
+
+    papers, exhausted, _ = fetcher._fetch_remote('ti:"x"', utc_now() - timedelta(days=30), client)
+    assert len(papers) == 3 and exhausted
+
+
+def test_page_size_grows_when_hits_are_sparse():
+    fetcher = ArxivFetcher(max_results=10)
+    assert fetcher._next_page_size(10) == 10
+    fetcher._observe_hit_density(100, 10)
+    assert fetcher._next_page_size(10) > 10
+    assert fetcher._next_page_size(10 ** 6) == ArxivFetcher.MAX_PAGE_SIZE
@@ -0,0 +1,41 @@
+import pytest
+
+from paper import Paper
+
+
+def test_dict_view_hides_unset_optional_fields(make_paper):
+    paper = make_paper(1)
+    assert 'summary' not in paper
+    assert paper.get('summary') is None
+    assert set(paper) == {'title', 'authors', 'abstract', 'url', 'pdf_url', 'published', 'categories', 'submitted'}
+
+    paper['summary'] = "总结"
+    assert paper['summary'] == "总结"
+    assert paper.to_dict()['summary'] == "总结"
+    with pytest.raises(KeyError):
+        paper['unknown'] = 1
+
+
+def test_from_dict_round_trip(make_paper):
+    paper = make_paper(1, relevance=1.5)
+    copy = Paper.from_dict(paper.to_dict())
+    assert copy == paper and copy is not paper
+    assert Paper.from_dict(paper) is paper
+
+
+def test_replace_returns_an_independent_copy(make_paper):
+    paper = make_paper(1)
+    copy = paper.replace(summary="总结")
+    copy['title'] = "Changed"
+
+    assert 'summary' not in paper
+    assert paper['title'] == "Paper 1 on neural networks"
+    assert copy['summary'] == "总结"
+
+
+def test_repeated_strings_are_interned(make_paper):
+    # 运行时拼接的字符串默认不共享 / Strings built at runtime are not shared by default
+    first, second = (make_paper(i, authors=["".join(["Ali", "ce"])], categories=["".join(["cs.", "LG"])])
+                     for i in (1, 2))
+    assert first.authors[0] is second.authors[0]
+    assert first.categories[0] is second.categories[0]
@@ -0,0 +1,60 @@
+from datetime import datetime
+
+from paper_index import PaperIndex, tokenize
+
+
+def test_tokenize_lowercases_words():
+    assert tokenize("Graph Neural-Networks, 2024!") == ["graph", "neural", "networks", "2024"]
+
+
+def test_phrases_must_be_adjacent(make_paper):
+    index = PaperIndex()
+    index.add_papers([
+        make_paper(1, title="Sparse attention", abstract="Attention that is sparse."),
+        make_paper(2, title="Attention", abstract="Sparse models and attention heads.")
+    ])
+    assert [paper['url'][-7:] for _, paper in index.search(["sparse attention"])] == ["00001v1"]
+    assert len(index.search(["attention"])) == 2
+    assert index.search(["missing phrase"]) == []
+
+
+def test_more_frequent_terms_rank_higher(make_paper):
+    index = PaperIndex()
+    index.add_papers([
+        make_paper(1, title="Transformers", abstract="A transformer. Another transformer. More transformer."),
+        make_paper(2, title="Transformers", abstract="Only one transformer here among other words."),
+        make_paper(3, title="Unrelated", abstract="Nothing relevant.")
+    ])
+    ranked = index.search(["transformer"])
+    assert [paper['url'][-7:] for _, paper in ranked] == ["00001v1", "00002v1"]
+    assert ranked[0][0] > ranked[1][0] > 0
+
+
+def test_new_version_replaces_old_one(make_paper):
+    index = PaperIndex()
+    index.add_papers([make_paper(1, abstract="About diffusion models.")])
+    index.add_papers([make_paper(1, version=2, abstract="About language models.")])
+    index.add_papers([make_paper(1, abstract="About diffusion models.")])
+
+    assert len(index) == 1
+    assert index.search(["diffusion"]) == []
+    assert index.search(["language models"])[0][1]['url'].endswith("v2")
+
+
+def test_search_filters_by_date_and_limit(make_paper):
+    index = PaperIndex()
+    index.add_papers([make_paper(i, submitted=f"2024-01-{10 + i}T00:00:00") for i in range(1, 6)])
+
+    assert len(index.search(["neural networks"], since=datetime(2024, 1, 13))) == 3
+    assert len(index.search(["neural networks"], limit=2)) == 2
+
+
+def test_index_keeps_its_own_copy_without_summaries(make_paper):
+    index = PaperIndex()
+    paper = make_paper(1, summary="已有总结")
+    index.add_papers([paper])
+    paper['summaries'] = {'english': "written later"}
+
+    stored = index.search(["neural networks"])[0][1]
+    assert stored is not paper
+    assert 'summary' not in stored and 'summaries' not in stored
@@ -0,0 +1,65 @@
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+import paper_store
+
+from paper_store import PaperStore, parse_arxiv_id
+
+
+def test_parse_arxiv_id():
+    assert parse_arxiv_id("http://arxiv.org/abs/2401.01234v3") == ("2401.01234", 3)
+    assert parse_arxiv_id("http://arxiv.org/abs/2401.01234") == ("2401.01234", 1)
+    assert parse_arxiv_id("http://arxiv.org/abs/cs/0101001v2") == ("cs/0101001", 2)
+
+
+def test_load_papers_returns_latest_version_of_query(tmp_path, make_paper):
+    store = PaperStore(str(tmp_path / "papers.db"))
+    store.upsert_papers([make_paper(1, submitted="2024-01-10T08:00:00"),
+                         make_paper(2, submitted="2024-01-12T08:00:00")], query="q")
+    store.upsert_papers([make_paper(1, version=2, title="Revised", submitted="2024-01-14T08:00:00")], query="q")
+    store.upsert_papers([make_paper(3, submitted="2024-01-13T08:00:00")], query="other")
+
+    papers = store.load_papers("q", since=datetime(2024, 1, 1))
+    assert [paper['url'] for paper in papers] == [
+        "http://arxiv.org/abs/2401.00001v2",
+        "http://arxiv.org/abs/2401.00002v1"
+    ]
+    assert papers[0]['title'] == "Revised"
+    assert papers[0]['authors'] == ("Alice", "Bob")
+
+    assert [paper['url'] for paper in store.load_papers("q", since=datetime(2024, 1, 13))] == \
+        ["http://arxiv.org/abs/2401.00001v2"]
+    assert len(store.load_papers("q", since=datetime(2024, 1, 1), limit=1)) == 1
+    assert len(store.load_all_papers()) == 3
+
+
+def test_query_state_round_trip(tmp_path):
+    store = PaperStore(str(tmp_path / "nested" / "papers.db"))
+    assert store.get_query_state("q") is None
+
+    store.update_query_state("q", last_seen=datetime(2024, 1, 15, 9), covered_from=datetime(2024, 1, 8))
+    assert store.get_query_state("q") == {
+        'last_seen': datetime(2024, 1, 15, 9),
+        'covered_from': datetime(2024, 1, 8)
+    }
+
+
+def test_connections_are_closed_after_each_operation(tmp_path, monkeypatch, make_paper):
+    opened = []
+    connect = sqlite3.connect
+
+    def tracking_connect(*args, **kwargs):
+        opened.append(connect(*args, **kwargs))
+        return opened[-1]
+
+    monkeypatch.setattr(paper_store.sqlite3, "connect", tracking_connect)
+    store = PaperStore(str(tmp_path / "papers.db"))
+    store.upsert_papers([make_paper(1)], query="q")
+    assert len(store.load_papers("q", since=datetime(2024, 1, 1))) == 1
+
+    assert len(opened) == 3
+    for conn in opened:
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
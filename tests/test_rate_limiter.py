@@ -0,0 +1,72 @@
+import pytest
+
+import rate_limiter
+from rate_limiter import TokenBucket, shared_adapter, shared_limiter
+
+
+class FakeClock:
+    """替代 time 模块，sleep 只推进时间 / Stands in for the time module; sleep only advances the clock"""
+
+    def __init__(self):
+        self.now = 1_000_000.0
+        self.slept = []
+
+    def time(self):
+        return self.now
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limiter, "time", fake)
+    return fake
+
+
+def test_burst_then_steady_rate(clock):
+    bucket = TokenBucket(rate=2.0, capacity=3)
+    for _ in range(3):
+        bucket.acquire()
+    assert clock.slept == []
+
+    bucket.acquire()
+    bucket.acquire()
+    assert clock.slept == [0.5, 0.5]
+    assert bucket.stats()['acquired'] == 5
+    assert bucket.stats()['total_wait'] == pytest.approx(1.0)
+
+
+def test_tokens_refill_up_to_capacity(clock):
+    bucket = TokenBucket(rate=1.0, capacity=2)
+    bucket.acquire()
+    bucket.acquire()
+    clock.now += 100
+    bucket.acquire()
+    bucket.acquire()
+    bucket.acquire()
+    assert clock.slept == [1.0]
+
+
+@pytest.mark.skipif(rate_limiter.fcntl is None, reason="需要 fcntl / requires fcntl")
+def test_state_file_shares_one_bucket(tmp_path, clock):
+    path = str(tmp_path / "state" / "limit.state")
+    # 两个实例模拟两个进程 / Two instances stand in for two processes
+    first = TokenBucket(rate=1.0, capacity=1, state_path=path)
+    second = TokenBucket(rate=1.0, capacity=1, state_path=path)
+
+    first.acquire()
+    second.acquire()
+    assert clock.slept == [1.0]
+    assert second.stats()['shared_across_processes']
+
+
+def test_shared_instances_are_reused():
+    assert shared_limiter(0.5, 1) is shared_limiter(0.5, 1)
+    assert shared_limiter(0.5, 1) is not shared_limiter(0.5, 2)
+    assert shared_adapter(3) is shared_adapter(3)
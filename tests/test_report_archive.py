@@ -0,0 +1,121 @@
+import json
+import os
+import threading
+from datetime import datetime
+
+from report_archive import MANIFEST_NAME, ReportArchive, append_before_tail, load_manifest
+from report_generator import ReportGenerator
+
+NOW = datetime(2024, 1, 15, 9, 30, 5)
+
+
+def make_archive(tmp_path) -> ReportArchive:
+    root = str(tmp_path / "archive")
+    return ReportArchive(root, reporter=ReportGenerator(output_dir=root))
+
+
+def test_append_inserts_before_the_tail(tmp_path):
+    path = str(tmp_path / "page.html")
+    append_before_tail(path, "<head>", ["a"], "</tail>")
+    append_before_tail(path, "<head>", ["b", "c"], "</tail>")
+    assert open(path, encoding='utf-8').read() == "<head>abc</tail>"
+
+    # 结尾缺失时新内容接在末尾，已有内容保持不变 / Without the tail new content follows the existing text
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("<head>ab")
+    append_before_tail(path, "<head>", ["d"], "</tail>")
+    assert open(path, encoding='utf-8').read() == "<head>abd</tail>"
+    assert os.listdir(tmp_path) == ["page.html"]
+
+
+def test_interrupted_append_leaves_the_page_intact(tmp_path):
+    path = str(tmp_path / "page.html")
+    append_before_tail(path, "<head>", ["a"], "</tail>")
+
+    def pieces():
+        yield "b"
+        raise RuntimeError("interrupted")
+
+    try:
+        append_before_tail(path, "<head>", pieces(), "</tail>")
+    except RuntimeError:
+        pass
+    assert open(path, encoding='utf-8').read() == "<head>a</tail>"
+    # 临时文件已删除 / The temporary file is removed
+    assert os.listdir(tmp_path) == ["page.html"]
+
+
+def test_runs_are_archived_with_a_valid_manifest(tmp_path, make_paper):
+    archive = make_archive(tmp_path)
+    archive.add_run([make_paper(1, summary="one")], ["ml"], now=NOW)
+    page_path = archive.add_run([make_paper(2, summary="two")], ["cv"], name="vision", now=NOW.replace(hour=10))
+
+    lines = (tmp_path / "archive" / MANIFEST_NAME).read_text(encoding='utf-8').splitlines()
+    runs = [json.loads(line) for line in lines]
+    assert [run['run'] for run in runs] == ["run-093005", "run-103005-vision"]
+    assert runs[1]['papers'] == [["2401.00002v1", "Paper 2 on neural networks"]]
+    page = open(page_path, encoding='utf-8').read()
+    assert 'id="run-093005-1"' in page and 'id="run-103005-vision-1"' in page
+    assert page.count("</html>") == 1
+    # 临时文件的权限不会带到归档页面上 / Pages do not inherit the owner-only mode of temporary files
+    assert os.stat(page_path).st_mode & 0o777 == 0o644
+
+
+def test_runs_in_the_same_second_get_distinct_ids(tmp_path, make_paper):
+    archive = make_archive(tmp_path)
+    for _ in range(3):
+        archive.add_run([make_paper(1, summary="one")], ["ml"], now=NOW)
+
+    runs = load_manifest(str(tmp_path / "archive" / MANIFEST_NAME))
+    assert [run['run'] for run in runs] == ["run-093005", "run-093005_2", "run-093005_3"]
+    index = (tmp_path / "archive" / "index.html").read_text(encoding='utf-8')
+    assert index.count("#run-093005_3") == 1
+
+
+def test_manifest_skips_a_half_written_line(tmp_path, make_paper):
+    archive = make_archive(tmp_path)
+    archive.add_run([make_paper(1, summary="one")], ["ml"], now=NOW)
+    manifest = tmp_path / "archive" / MANIFEST_NAME
+    before = manifest.read_text(encoding='utf-8')
+    # 模拟中断的写入：最后一行只写了一半 / Simulate an interrupted write: the last line is cut short
+    manifest.write_text(before + '{"date":"2024-01-', encoding='utf-8')
+
+    archive.add_run([make_paper(2, summary="two")], ["cv"], now=NOW.replace(hour=10))
+    text = manifest.read_text(encoding='utf-8')
+    # 已有内容只追加不重写 / Existing content is appended to, never rewritten
+    assert text.startswith(before)
+    assert [run['run'] for run in load_manifest(str(manifest))] == ["run-093005", "run-103005"]
+
+
+def test_legacy_json_manifest_is_converted(tmp_path):
+    root = tmp_path / "archive"
+    root.mkdir()
+    legacy = [{"run": "run-093005", "papers": []}, {"run": "run-103005", "papers": []}]
+    (root / "manifest.json").write_text(
+        "[\n" + ",\n".join(json.dumps(run) for run in legacy) + "\n]\n", encoding='utf-8'
+    )
+
+    make_archive(tmp_path)
+    assert not (root / "manifest.json").exists()
+    assert load_manifest(str(root / MANIFEST_NAME)) == legacy
+    search_page = (root / "search.html").read_text(encoding='utf-8')
+    assert 'fetch("manifest.jsonl")' in search_page and 'text.split("\\n")' in search_page
+
+
+def test_concurrent_runs_do_not_interleave(tmp_path, make_paper):
+    archives = [make_archive(tmp_path) for _ in range(4)]
+    threads = [
+        threading.Thread(target=archive.add_run, args=([make_paper(number, summary="x")], ["ml"]),
+                         kwargs={'now': NOW})
+        for number, archive in enumerate(archives, 1)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    runs = load_manifest(str(tmp_path / "archive" / MANIFEST_NAME))
+    assert sorted(run['run'] for run in runs) == ["run-093005", "run-093005_2", "run-093005_3", "run-093005_4"]
+    page = (tmp_path / "archive" / "days" / "2024-01" / "2024-01-15.html").read_text(encoding='utf-8')
+    assert page.count("</html>") == 1 and page.count('class="paper"') == 4
+    assert sorted(os.listdir(tmp_path / "archive")) == [".lock", "days", "index.html", MANIFEST_NAME, "search.html"]
@@ -0,0 +1,68 @@
+import gzip
+import os
+
+import pytest
+
+from report_generator import ReportGenerator
+
+
+def test_gzip_sibling_matches_the_report(tmp_path, make_paper):
+    reporter = ReportGenerator(output_dir=str(tmp_path), precompress=["gzip"])
+    path = reporter.save_report([make_paper(1, summary="一篇论文")], ["ml"], "html")
+
+    assert gzip.decompress(open(path + ".gz", 'rb').read()) == open(path, 'rb').read()
+    assert not os.path.exists(path + ".br")
+
+
+def test_brotli_sibling_matches_the_report(tmp_path, make_paper):
+    # brotli 是可选依赖，只有这一项需要它 / brotli is optional and only this test needs it
+    brotli = pytest.importorskip("brotli")
+    reporter = ReportGenerator(output_dir=str(tmp_path), precompress=["gzip", "br"])
+    path = reporter.save_report([make_paper(1, summary="一篇论文")], ["ml"], "html")
+
+    original = open(path, 'rb').read()
+    assert gzip.decompress(open(path + ".gz", 'rb').read()) == original
+    assert brotli.decompress(open(path + ".br", 'rb').read()) == original
+
+
+def test_unknown_precompression_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        ReportGenerator(output_dir=str(tmp_path), precompress=["zip"])
+
+
+def test_unchanged_reports_are_not_written_again(tmp_path, make_paper):
+    reporter = ReportGenerator(output_dir=str(tmp_path), skip_unchanged=True)
+    first = reporter.save_reports([make_paper(1, summary="one", relevance=1.0)], ["ml"], ["html", "jsonl"])
+
+    # 只有相关度不同的论文不算内容变化 / A paper that only differs in relevance is not a change
+    again = reporter.save_reports([make_paper(1, summary="one", relevance=2.0)], ["ml"], ["html", "jsonl"])
+    assert again == first
+    assert reporter.last_skipped == ["html", "jsonl"]
+
+    changed = reporter.save_reports([make_paper(1, summary="new")], ["ml"], ["html"])
+    assert reporter.last_skipped == []
+    assert "new" in open(changed['html'], encoding='utf-8').read()
+
+
+def test_deleted_report_is_regenerated(tmp_path, make_paper):
+    reporter = ReportGenerator(output_dir=str(tmp_path), skip_unchanged=True)
+    papers = [make_paper(1, summary="one")]
+    path = reporter.save_report(papers, ["ml"], "html", name="daily")
+    os.remove(path)
+
+    assert os.path.exists(reporter.save_report(papers, ["ml"], "html", name="daily"))
+    assert reporter.last_skipped == []
+
+
+def test_enabling_precompression_regenerates_an_unchanged_report(tmp_path, make_paper):
+    papers = [make_paper(1, summary="one")]
+    ReportGenerator(output_dir=str(tmp_path), skip_unchanged=True).save_report(papers, ["ml"], "html")
+
+    # 内容未变，但上一份报告没有现在要求的 .gz 副本 / Same content, but the previous report lacks the .gz copy now asked for
+    reporter = ReportGenerator(output_dir=str(tmp_path), skip_unchanged=True, precompress=["gzip"])
+    path = reporter.save_report(papers, ["ml"], "html")
+    assert reporter.last_skipped == []
+    assert gzip.decompress(open(path + ".gz", 'rb').read()) == open(path, 'rb').read()
+
+    reporter.save_report(papers, ["ml"], "html")
+    assert reporter.last_skipped == ["html"]
@@ -0,0 +1,60 @@
+import io
+
+from report_generator import ReportGenerator
+
+
+class CountingWriter:
+    """记录每次写入的输出 / Output that records every write"""
+
+    def __init__(self):
+        self.writes = []
+
+    def write(self, text: str):
+        self.writes.append(text)
+
+
+def hostile_paper(make_paper):
+    return make_paper(1, title="<script>alert('x')</script> & *bold* [link]", authors=["O'Brien", "A <B>"],
+                      summary='uses "quotes" & <tags> # not a heading')
+
+
+def test_html_escapes_every_field(tmp_path, make_paper):
+    html = ReportGenerator(output_dir=str(tmp_path)).generate_html_report([hostile_paper(make_paper)], ["a<b"])
+    assert "<script>" not in html
+    assert "&lt;script&gt;alert(&#x27;x&#x27;)&lt;/script&gt; &amp;" in html
+    assert "O&#x27;Brien, A &lt;B&gt;" in html
+    assert "uses &quot;quotes&quot; &amp; &lt;tags&gt;" in html
+    assert "a&lt;b" in html
+
+
+def test_markdown_escapes_formatting_and_urls(tmp_path, make_paper):
+    paper = hostile_paper(make_paper)
+    paper['pdf_url'] = "http://arxiv.org/pdf/2401.00001v1 (draft)"
+    markdown = ReportGenerator(output_dir=str(tmp_path)).generate_markdown_report([paper], ["deep_learning"])
+    assert r"## 1. \<script\>alert('x')\</script\> & \*bold\* \[link\]" in markdown
+    assert r"\# not a heading" in markdown
+    assert "**搜索关键词:** deep\\_learning" in markdown
+    assert "(http://arxiv.org/pdf/2401.00001v1%20%28draft%29)" in markdown
+
+
+def test_render_html_streams_papers_from_an_iterator(tmp_path, make_paper):
+    reporter = ReportGenerator(output_dir=str(tmp_path))
+    papers = [make_paper(number) for number in range(1, 4)]
+    out = CountingWriter()
+
+    written = reporter.render_html(iter(papers), ["neural networks"], out)
+    html = "".join(out.writes)
+    assert written == 3
+    # 片段逐篇写入，而不是拼接成整份报告后一次写入 / Fragments are written one by one, not joined into one string
+    assert len(out.writes) > 3
+    assert "📊 共找到 3 篇相关论文" in html
+    assert html.index("Paper 1 on") < html.index("Paper 2 on") < html.index("Paper 3 on")
+    assert "                    3. Paper 3" in html
+    assert html == reporter.generate_html_report(papers, ["neural networks"])
+
+
+def test_render_markdown_counts_iterator_papers(tmp_path, make_paper):
+    reporter = ReportGenerator(output_dir=str(tmp_path))
+    buffer = io.StringIO()
+    assert reporter.render_markdown((make_paper(n) for n in range(2)), ["ml"], buffer) == 2
+    assert "**论文数量:** 2" in buffer.getvalue()
@@ -0,0 +1,55 @@
+import threading
+
+from conftest import RecordingBackend
+from report_generator import ReportGenerator
+from summarizer import PaperSummarizer
+from summary_cache import SummaryCache
+
+
+class GatedBackend(RecordingBackend):
+    """第一篇论文的请求等到放行后才返回 / The first paper's request waits until released"""
+
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+
+    def complete(self, **kwargs) -> str:
+        if "Paper 1 " in kwargs['messages'][-1]['content']:
+            assert self.release.wait(5)
+        return super().complete(**kwargs)
+
+
+def test_papers_are_yielded_as_each_request_finishes(make_paper):
+    backend = GatedBackend()
+    summarizer = PaperSummarizer(backend=backend, max_concurrency=2, batch_size=1)
+    papers = [make_paper(1), make_paper(2)]
+
+    order = []
+    for index, paper in summarizer.iter_summaries(papers, "chinese"):
+        # 第二篇在第一篇的请求仍未返回时就已产出 / The second paper arrives while the first is still pending
+        order.append(index)
+        assert paper['summary'] == f"summary of Paper {index + 1} on neural networks"
+        backend.release.set()
+    assert order == [1, 0]
+
+
+def test_cache_hits_are_yielded_before_any_request(tmp_path, backend, make_paper):
+    cache = SummaryCache(str(tmp_path / "summaries.db"))
+    PaperSummarizer(backend=backend, cache=cache, batch_size=1).summarize_papers([make_paper(3)], "chinese")
+
+    summarizer = PaperSummarizer(backend=RecordingBackend(), cache=cache, max_concurrency=1, batch_size=1)
+    items = summarizer.iter_summaries([make_paper(1), make_paper(2), make_paper(3)], "chinese")
+    assert next(items)[0] == 2
+    assert summarizer.backend.prompts == []
+    assert sorted(index for index, _ in items) == [0, 1]
+
+
+def test_console_stream_prints_papers_in_arrival_order(tmp_path, capsys, make_paper):
+    reporter = ReportGenerator(output_dir=str(tmp_path))
+    papers = [make_paper(1, summary="first"), make_paper(2, summary="second")]
+
+    printed = reporter.print_console_stream([(1, papers[1]), (0, papers[0])], ["neural networks"], 2)
+    output = capsys.readouterr().out
+    assert printed == 2
+    assert "📊 找到论文数量: 2" in output
+    assert output.index("2. Paper 2") < output.index("1. Paper 1")
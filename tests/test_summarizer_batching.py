@@ -0,0 +1,53 @@
+from summarizer import PaperSummarizer, parse_batch_response
+from summary_cache import SummaryCache
+
+
+def test_parse_batch_response_tolerates_wrapping_text():
+    content = 'Here you go:\n```json\n{"2401.00001": " first ", "2401.00002": "", "2401.00003": 3}\n```'
+    assert parse_batch_response(content) == {"2401.00001": "first"}
+    assert parse_batch_response("not json") == {}
+    assert parse_batch_response('{"broken": ') == {}
+    assert parse_batch_response('["a", "b"]') == {}
+
+
+def test_batches_respect_size_and_token_budget(backend, make_paper):
+    summarizer = PaperSummarizer(backend=backend, batch_size=3, batch_token_budget=10 ** 6)
+    papers = [make_paper(i) for i in range(7)]
+    assert summarizer._make_batches(papers, list(range(7)), "chinese") == [[0, 1, 2], [3, 4, 5], [6]]
+
+    # 预算只够一篇时每篇单独成组 / A budget that fits one paper puts every paper in its own group
+    summarizer.batch_token_budget = 1
+    assert summarizer._make_batches(papers, [0, 1], "chinese") == [[0], [1]]
+
+
+def test_packed_request_with_per_paper_fallback(backend, make_paper):
+    backend.fail_ids = {"2401.00002"}
+    summarizer = PaperSummarizer(backend=backend, max_concurrency=1, batch_size=4, batch_token_budget=10 ** 6)
+    papers = summarizer.summarize_papers([make_paper(i) for i in range(1, 4)], "english")
+
+    assert [paper['summary'] for paper in papers] == [
+        "summary of 2401.00001", "summary of Paper 2 on neural networks", "summary of 2401.00003"
+    ]
+    assert len(backend.prompts) == 2
+    assert summarizer.last_run_stats['batch_fallbacks'] == 1
+    assert summarizer.last_run_stats['requests'] == 2
+
+
+def test_cache_keys_follow_the_prompt_actually_used(tmp_path, backend, make_paper):
+    cache = SummaryCache(str(tmp_path / "summaries.db"))
+    backend.fail_ids = {"2401.00002"}
+    packed = PaperSummarizer(backend=backend, cache=cache, max_concurrency=1, batch_size=4,
+                             batch_token_budget=10 ** 6)
+    packed.summarize_papers([make_paper(i) for i in range(1, 4)], "english")
+    assert len(backend.prompts) == 2
+
+    # 合并请求模式下两种来源的总结都能复用 / In packed mode both kinds of summaries are reused
+    packed.summarize_papers([make_paper(i) for i in range(1, 4)], "english")
+    assert len(backend.prompts) == 2
+
+    # 逐篇模式只复用逐篇提示词生成的总结（单篇回退）/ Per-paper mode only reuses per-paper prompt summaries
+    single = PaperSummarizer(backend=backend, cache=cache, max_concurrency=1, batch_size=1)
+    papers = single.summarize_papers([make_paper(i) for i in range(1, 4)], "english")
+    assert len(backend.prompts) == 4
+    assert papers[1]['summary'] == "summary of Paper 2 on neural networks"
+    assert single.last_run_stats['cache_hits'] == 1 and single.last_run_stats['cache_misses'] == 2
@@ -0,0 +1,47 @@
+import threading
+import time
+
+from summarizer import PaperSummarizer
+
+
+class SlowBackend:
+    """每个请求固定耗时，并记录同时进行的请求数 / Fixed latency per request, tracking requests in flight"""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def complete(self, **kwargs) -> str:
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(self.latency)
+        with self._lock:
+            self.in_flight -= 1
+        return "summary: " + kwargs['messages'][-1]['content'].split("标题：")[1].split("\n")[0]
+
+
+def test_concurrent_summaries_keep_input_order(make_paper):
+    backend = SlowBackend(latency=0.05)
+    summarizer = PaperSummarizer(backend=backend, max_concurrency=4, batch_size=1)
+    papers = [make_paper(i) for i in range(8)]
+
+    start = time.perf_counter()
+    result = summarizer.summarize_papers(papers, "chinese")
+    elapsed = time.perf_counter() - start
+
+    assert result is papers
+    assert [paper['summary'] for paper in papers] == [f"summary: Paper {i} on neural networks" for i in range(8)]
+    assert 2 <= backend.peak <= 4
+    assert elapsed < 8 * 0.05
+    assert summarizer.last_run_stats['requests'] == 8
+    assert summarizer.last_run_stats['papers'] == 8
+
+
+def test_single_worker_is_sequential(make_paper):
+    backend = SlowBackend(latency=0.01)
+    summarizer = PaperSummarizer(backend=backend, max_concurrency=1, batch_size=1)
+    summarizer.summarize_papers([make_paper(i) for i in range(3)], "chinese")
+    assert backend.peak == 1
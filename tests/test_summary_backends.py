@@ -0,0 +1,67 @@
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+
+import config  # noqa: E402
+from mock_servers import MockServer  # noqa: E402
+from summarizer import PaperSummarizer  # noqa: E402
+from summary_backends import BackendError, MockBackend, OpenAIBackend, create_backend  # noqa: E402
+
+
+def ask(backend, prompt: str) -> str:
+    return backend.complete(model="test", messages=[{"role": "user", "content": prompt}])
+
+
+def test_create_backend_follows_config(monkeypatch):
+    monkeypatch.setattr(config, "MOCK_BACKEND_LATENCY", 0.25)
+    monkeypatch.setattr(config, "MOCK_BACKEND_MAX_CONCURRENCY", 3)
+    backend = create_backend("mock")
+    assert isinstance(backend, MockBackend)
+    assert (backend.latency, backend.max_concurrency) == (0.25, 3)
+
+    monkeypatch.setattr(config, "SUMMARY_POOL_SIZE", 2)
+    assert isinstance(create_backend("openai", api_key="test", base_url="http://127.0.0.1:9/v1"), OpenAIBackend)
+    with pytest.raises(ValueError):
+        create_backend("openai")
+    with pytest.raises(ValueError, match="mock"):
+        create_backend("unknown")
+
+
+def test_mock_backend_replies_match_the_prompt_shape():
+    backend = MockBackend(latency=0, seed=1)
+    assert ask(backend, "标题: x") == MockBackend.SUMMARY
+    assert set(json.loads(ask(backend, "ID: 2401.00001v1\nID: 2401.00002v1"))) == {"2401.00001v1", "2401.00002v1"}
+    assert set(json.loads(ask(backend, 'Reply as {"chinese": ..., "english": ...}'))) == {"chinese", "english"}
+    assert backend.requests == 3 and backend.failures == 0
+
+
+def test_mock_backend_simulates_errors():
+    with pytest.raises(BackendError) as error:
+        ask(MockBackend(latency=0, rate_limit_rate=1.0), "x")
+    assert error.value.status_code == 429
+
+    backend = MockBackend(latency=0, error_rate=1.0)
+    with pytest.raises(BackendError) as error:
+        ask(backend, "x")
+    assert error.value.status_code == 500
+    assert backend.failures == 1
+
+
+def test_openai_backend_talks_to_a_compatible_server(make_paper):
+    with MockServer() as server:
+        backend = OpenAIBackend("test", base_url=server.openai_base_url, pool_size=2)
+        expected = server.completion['choices'][0]['message']['content']
+        assert ask(backend, "hello") == expected
+
+        summarizer = PaperSummarizer(backend=backend, max_concurrency=2, batch_size=1)
+        papers = summarizer.summarize_papers([make_paper(1), make_paper(2)], "chinese")
+        assert [paper['summary'] for paper in papers] == [expected.strip()] * 2
+
+        # 服务端的错误状态码原样交给重试逻辑 / Server status codes are passed on to the retry logic
+        with pytest.raises(BackendError) as error:
+            ask(OpenAIBackend("test", base_url=f"{server.url}/missing"), "hello")
+        assert error.value.status_code == 404
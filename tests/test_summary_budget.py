@@ -0,0 +1,53 @@
+from summarizer import (EXCERPT_PREFIX, PROMPT_TEMPLATES, SYSTEM_PROMPT, PaperSummarizer, abstract_excerpt,
+                        count_tokens, estimate_tokens, trim_text)
+
+ABSTRACT = ("We reach 93.5% accuracy, e.g. on ImageNet.\nThe method, cf. Smith et al. 2020, is fast.  "
+            "It scales to 1.2B parameters! 本文提出了新方法。效果很好。")
+
+
+def test_estimate_tokens_counts_cjk_characters_individually():
+    assert estimate_tokens("abcdefgh") == 2
+    assert estimate_tokens("本文提出") == 4
+
+
+def test_trim_keeps_whole_sentences_and_original_spacing():
+    trimmed = trim_text(ABSTRACT, 30)
+    assert trimmed == "We reach 93.5% accuracy, e.g. on ImageNet.\nThe method, cf. Smith et al. 2020, is fast. …"
+    assert trim_text(ABSTRACT, 0) == ABSTRACT
+    assert trim_text(ABSTRACT, 1000) == ABSTRACT
+
+
+def test_trim_cuts_characters_when_the_first_sentence_is_too_long():
+    text = "word " * 200
+    trimmed = trim_text(text, 10)
+    assert trimmed.endswith("…") and len(trimmed) < 60
+
+
+def test_excerpt_does_not_split_decimals_or_abbreviations():
+    assert abstract_excerpt(ABSTRACT, 60) == "We reach 93.5% accuracy, e.g. on ImageNet."
+    end = ABSTRACT.index("。") + 1
+    assert abstract_excerpt(ABSTRACT, end) == ABSTRACT[:end]
+    assert abstract_excerpt(ABSTRACT, end - 1) == ABSTRACT[:ABSTRACT.index("  It")]
+    assert abstract_excerpt(ABSTRACT, 20) == "We reach 93.5% accur…"
+    assert abstract_excerpt("本文提出了新方法。效果很好。", 10) == "本文提出了新方法。"
+
+
+def test_token_budget_prefers_relevant_papers(backend, make_paper):
+    summarizer = PaperSummarizer(backend=backend, max_concurrency=1, batch_size=1)
+    papers = [make_paper(1, relevance=0.5), make_paper(2, relevance=3.0), make_paper(3, relevance=1.0)]
+    per_paper = (count_tokens(SYSTEM_PROMPT + PROMPT_TEMPLATES['chinese'], summarizer.model)
+                 + summarizer._paper_tokens(papers[0]))
+    summarizer.token_budget = 2 * per_paper + 1
+
+    assert summarizer._select_within_budget(papers, [0, 1, 2], "chinese") == ([1, 2], [0])
+    summarizer.summarize_papers(papers, "chinese")
+    assert papers[0]['summary'].startswith(EXCERPT_PREFIX['chinese'])
+    assert papers[1]['summary'] == "summary of Paper 2 on neural networks"
+    assert summarizer.last_run_stats['budget_skipped'] == 1
+
+
+def test_time_budget_falls_back_to_excerpts(backend, make_paper):
+    summarizer = PaperSummarizer(backend=backend, max_concurrency=1, batch_size=1, time_budget=1e-9)
+    papers = summarizer.summarize_papers([make_paper(1), make_paper(2)], "english")
+    assert all(paper['summary'].startswith(EXCERPT_PREFIX['english']) for paper in papers)
+    assert backend.prompts == []
@@ -0,0 +1,43 @@
+from summarizer import PaperSummarizer
+from summary_cache import SummaryCache
+
+
+def test_key_depends_on_version_language_prompt_model_and_temperature(tmp_path):
+    cache = SummaryCache(str(tmp_path / "summaries.db"))
+    url = "http://arxiv.org/abs/2401.00001v1"
+    key = cache.make_key(url, "chinese", "prompt", "model", 0.3)
+
+    assert key == cache.make_key(url, "chinese", "prompt", "model", 0.3)
+    assert len({
+        key,
+        cache.make_key(url.replace("v1", "v2"), "chinese", "prompt", "model", 0.3),
+        cache.make_key(url, "english", "prompt", "model", 0.3),
+        cache.make_key(url, "chinese", "prompt 2", "model", 0.3),
+        cache.make_key(url, "chinese", "prompt", "model 2", 0.3),
+        cache.make_key(url, "chinese", "prompt", "model", 0.7)
+    }) == 6
+
+
+def test_second_run_is_served_from_cache(tmp_path, backend, make_paper):
+    cache = SummaryCache(str(tmp_path / "summaries.db"))
+    summarizer = PaperSummarizer(backend=backend, cache=cache, max_concurrency=1, batch_size=1)
+
+    summarizer.summarize_papers([make_paper(1), make_paper(2)], "chinese")
+    papers = summarizer.summarize_papers([make_paper(1), make_paper(2), make_paper(1, version=2)], "chinese")
+
+    assert len(backend.prompts) == 3
+    assert papers[0]['summary'] == "summary of Paper 1 on neural networks"
+    assert summarizer.last_run_stats['cache_hits'] == 2
+    assert summarizer.last_run_stats['cache_misses'] == 1
+
+
+def test_failed_summaries_are_not_cached(tmp_path, make_paper):
+    class FailingBackend:
+        def complete(self, **kwargs):
+            raise RuntimeError("down")
+
+    cache = SummaryCache(str(tmp_path / "summaries.db"))
+    summarizer = PaperSummarizer(backend=FailingBackend(), cache=cache, max_concurrency=1, batch_size=1)
+    summarizer.summarize_papers([make_paper(1)], "chinese")
+
+    assert cache.stats()['entries'] == 0
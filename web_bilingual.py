@@ -14,6 +14,7 @@ from typing import List, Dict
 import json
 
 from arxiv_fetcher import ArxivFetcher
+from extractive_summarizer import ExtractiveSummarizer
 from summarizer import PaperSummarizer
 from report_generator import ReportGenerator
 import config
@@ -22,25 +23,27 @@ app = Flask(__name__)
 CORS(app)
 
 # 全局变量 / Global variables
-fetcher = ArxivFetcher(max_results=config.MAX_RESULTS)
+fetcher = ArxivFetcher.from_config()
 summarizer = None
-reporter = ReportGenerator()
+extractive_summarizer = ExtractiveSummarizer()
+reporter = ReportGenerator.from_config()
 
 # 检查OpenAI API / Check OpenAI API
-has_openai_api = bool(config.OPENAI_API_KEY)
+has_openai_api = bool(config.OPENAI_API_KEY) or config.SUMMARY_BACKEND == "mock"
 if has_openai_api:
     try:
-        summarizer = PaperSummarizer()
+        summarizer = PaperSummarizer.from_config()
     except Exception as e:
         has_openai_api = False
         print(f"OpenAI API 初始化失败 / OpenAI API initialization failed: {e}")
 
-# 搜索状态 / Search status
+# 搜索状态，papers 在总结过程中按完成顺序逐篇追加 / Search status; papers are appended as each summary completes
 search_status = {
     'is_searching': False,
     'progress': 0,
     'message': '准备就绪 / Ready',
-    'papers': []
+    'papers': [],
+    'total': 0
 }
 
 @app.route('/')
@@ -72,7 +75,8 @@ def search_papers():
         'is_searching': True,
         'progress': 0,
         'message': '开始搜索... / Starting search...',
-        'papers': []
+        'papers': [],
+        'total': 0
     })
     
     # 更新fetcher的最大结果数 / Update fetcher max results
@@ -116,36 +120,21 @@ def perform_search(keywords: List[str], days: int, language: str):
         
         search_status.update({
             'progress': 50,
-            'message': f'📚 找到 {len(papers)} 篇论文，正在处理摘要... / Found {len(papers)} papers, processing abstracts...'
+            'message': f'📚 找到 {len(papers)} 篇论文，正在生成总结... / Found {len(papers)} papers, generating summaries...',
+            'total': len(papers)
         })
         
-        # 使用摘要作为总结 / Use abstracts as summaries
-        for i, paper in enumerate(papers):
+        # 每篇总结完成后立即加入状态，前端轮询时即可显示 /
+        # Each paper joins the status as soon as its summary completes, so polling clients show it right away
+        active_summarizer = summarizer or extractive_summarizer
+        for done, (_, paper) in enumerate(active_summarizer.iter_summaries(papers, language=language), 1):
             if not search_status['is_searching']:
                 return
             
-            abstract = paper['abstract']
-            clean_abstract = fetcher.clean_text(abstract)
-            
-            # 根据语言处理摘要 / Process abstract based on language
-            if language == 'chinese':
-                if len(clean_abstract) > 200:
-                    summary = clean_abstract[:200] + "..."
-                else:
-                    summary = clean_abstract
-                summary = f"【论文摘要】{summary}"
-            else:
-                if len(clean_abstract) > 300:
-                    summary = clean_abstract[:300] + "..."
-                else:
-                    summary = clean_abstract
-                summary = f"[Abstract] {summary}"
-            
-            paper['summary'] = summary
+            search_status['papers'].append(paper)
             
             # 更新进度 / Update progress
-            progress = 50 + (i + 1) / len(papers) * 40
-            search_status['progress'] = progress
+            search_status['progress'] = 50 + done / len(papers) * 40
         
         if not search_status['is_searching']:
             return
@@ -155,6 +144,7 @@ def perform_search(keywords: List[str], days: int, language: str):
             'is_searching': False,
             'progress': 100,
             'message': f'✅ 搜索完成！找到 {len(papers)} 篇相关论文 / Search completed! Found {len(papers)} relevant papers',
+            # 完成后恢复原始排序 / Restore the original order once complete
             'papers': papers
         })
         
@@ -169,7 +159,7 @@ def perform_search(keywords: List[str], days: int, language: str):
 @app.route('/api/status')
 def get_status():
     """获取搜索状态 / Get search status"""
-    return jsonify(search_status)
+    return jsonify(dict(search_status, papers=[dict(paper) for paper in list(search_status['papers'])]))
 
 @app.route('/api/stop')
 def stop_search():